@@ -5,15 +5,28 @@ Flask application for uploading iFlow folders and generating Knowledge Graphs in
 """
 
 import os
+import pathlib
+import re
+import string
 import zipfile
 import tempfile
 import shutil
 import logging
-from flask import Flask, request, jsonify, send_file
+import itertools
+import mmap
+import stat
+import threading
+import atexit
+from flask import Flask, Response, request, send_file
 from werkzeug.utils import secure_filename
 from werkzeug.exceptions import RequestEntityTooLarge
-import json
-from datetime import datetime
+from neo4j import GraphDatabase
+import orjson
+import pybase64
+import uuid
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import time
 import traceback
 
 # Import the KG creation logic
@@ -39,176 +52,442 @@ app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024  # 100MB max file size
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['ALLOWED_EXTENSIONS'] = {'zip'}
+# Offload /export file transfers to the front proxy (Nginx/Apache) when one
+# is configured to honour X-Sendfile
+app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
 
 # Create upload directory if it doesn't exist
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
+# Shared Neo4j driver - created once per process so requests reuse the same
+# connection pool instead of paying a Bolt handshake per request
+_neo4j_driver = None
+_neo4j_driver_lock = threading.Lock()
+
+def get_neo4j_driver():
+    """Return the process-wide Neo4j driver, creating it on first use."""
+    global _neo4j_driver
+    if _neo4j_driver is None:
+        with _neo4j_driver_lock:
+            if _neo4j_driver is None:
+                uri = os.getenv('NEO4J_URI', 'neo4j://127.0.0.1:7687')
+                user = os.getenv('NEO4J_USERNAME', os.getenv('NEO4J_USER', 'neo4j'))
+                password = os.getenv('NEO4J_PASSWORD', 'password')
+                _neo4j_driver = GraphDatabase.driver(
+                    uri,
+                    auth=(user, password),
+                    max_connection_pool_size=int(os.environ.get('NEO4J_POOL_SIZE', '50'))
+                )
+                atexit.register(_neo4j_driver.close)
+                logger.info("Created shared Neo4j driver for %s", uri)
+    return _neo4j_driver
+
+def ojson(payload, status=200):
+    """jsonify replacement that encodes through orjson's C serializer."""
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+
+def _json_body():
+    """Parse the request body with orjson's C decoder.
+
+    Returns None for an empty or malformed body, matching how the handlers
+    already treat a missing JSON payload.
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+def _iso_now():
+    """UTC timestamp for response payloads, without a datetime allocation."""
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
+# Monotonic suffix so two requests landing in the same second never
+# produce the same generated filename
+_upload_seq = itertools.count()
+
+def _stamp():
+    """Compact UTC timestamp plus sequence number, used in generated filenames."""
+    return f"{time.strftime('%Y%m%d_%H%M%S', time.gmtime())}_{next(_upload_seq):06d}"
+
+_indexes_ready = False
+
+def ensure_indexes_once():
+    """Create the id indexes the batched MERGEs rely on, once per process.
+
+    Retries on the next call if the database was unreachable, so a slow
+    Neo4j startup does not leave the process without indexes forever.
+    """
+    global _indexes_ready
+    if _indexes_ready:
+        return
+    try:
+        IFlowKnowledgeGraph(driver=get_neo4j_driver()).ensure_indexes()
+        _indexes_ready = True
+        logger.info("Neo4j indexes verified")
+    except Exception as e:
+        logger.warning("Could not create Neo4j indexes yet: %s", e)
+
+def get_kg(folder_name=None):
+    """Return a lightweight IFlowKnowledgeGraph wrapper over the shared driver."""
+    ensure_indexes_once()
+    return IFlowKnowledgeGraph(folder_name=folder_name, driver=get_neo4j_driver())
+
+# Background workers for /upload processing - the request returns 202 as soon
+# as the upload is persisted and clients poll /upload/status/<job_id>
+_upload_pool = ThreadPoolExecutor(max_workers=int(os.environ.get('KG_WORKERS', '4')))
+_upload_jobs = {}
+_UPLOAD_JOBS_MAX = int(os.environ.get('KG_JOB_BACKLOG', '256'))
+
+def _sweep_upload_jobs():
+    """Drop the oldest finished jobs once the table outgrows the cap.
+
+    Terminal results are normally evicted when the client polls them, but
+    jobs nobody polls would otherwise pin their Future and full result
+    payload forever. Dicts iterate in insertion order, so this sheds the
+    oldest finished entries first and never touches running jobs.
+    """
+    if len(_upload_jobs) <= _UPLOAD_JOBS_MAX:
+        return
+    for job_id, future in list(_upload_jobs.items()):
+        if future.done():
+            _upload_jobs.pop(job_id, None)
+            if len(_upload_jobs) <= _UPLOAD_JOBS_MAX:
+                break
+
+def _run_upload_job(zip_path, folder_name):
+    """Worker entry point: ingest the persisted upload, then drop the file."""
+    try:
+        return process_iflow_zip(zip_path, folder_name=folder_name)
+    finally:
+        try:
+            os.remove(zip_path)
+            logger.info("Cleaned up uploaded file: %s", zip_path)
+        except OSError as e:
+            logger.warning("Could not clean up uploaded file: %s", e)
+
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension."""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
 
-def extract_folder_name_from_zip(zip_path):
-    """Extract the folder name from a zip file by examining its contents."""
-    try:
-        logger.info(f"=== STARTING FOLDER NAME EXTRACTION FOR: {zip_path} ===")
+# Common technical folders that should never be treated as the iFlow name
+TECHNICAL_FOLDERS = frozenset({
+    'src', 'target', 'build', 'bin', 'lib', 'resources', 'meta-inf', 'web-inf',
+    'maven', 'gradle', 'node_modules', 'dist', 'out', 'test', 'tests'
+})
+
+# File extensions that usually indicate a meaningful project file
+MEANINGFUL_EXTS = ('.xml', '.json', '.properties', '.config')
+
+# Keywords that indicate business-meaningful folder names; frozenset gives O(1)
+# membership and avoids rebuilding the list on every call
+BUSINESS_KEYWORDS = frozenset({
+    'customer', 'order', 'material', 'product', 'integration', 'flow', 'process',
+    'service', 'api', 'data', 'sync', 'replicate', 'transfer', 'export', 'import',
+    'sales', 'purchase', 'inventory', 'warehouse', 'logistics', 'finance', 'hr',
+    'employee', 'supplier', 'vendor', 'pack', 'fee', 'erp', 'cpq', 'sap',
+    'business', 'suite', 'idoc', 'xml', 'flat', 'syntax', 'conversion',
+    'assembly', 'xslt', 'pricing', 'conditions', 'classifications'
+})
+
+# Precompiled patterns for clean_folder_name - one C-level match replaces the
+# old Python loops over prefix/suffix candidate lists
+_PREFIX_RE = re.compile(r'^(?:integration ?flow|integration|iflow|sap[-_]?|flow)\s*', re.IGNORECASE)
+_SUFFIX_RE = re.compile(r'\s*(?:\.iflw|\.xml|\.json|iflow|integration|flow)$', re.IGNORECASE)
+_WS_RE = re.compile(r'\s+')
+
+# Character filter for sanitize_folder_name: deleting through a precomputed
+# translation table runs at C speed instead of a per-character generator.
+# Non-ASCII names fall back to the regex so unicode letters survive.
+_KEEP_CHARS = frozenset(string.ascii_letters + string.digits + ' -()&/')
+_DEL_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if chr(c) not in _KEEP_CHARS))
+_NON_KEEP_RE = re.compile(r'[^\w ()&/-]')
+
+def sanitize_folder_name(raw):
+    """
+    Normalize a user-supplied folder name in one place: underscores become
+    spaces, whitespace is collapsed, and only characters that are safe for
+    folder ids are kept. Returns 'Uploaded iFlow' when nothing usable is left.
+    """
+    if not raw:
+        return "Uploaded iFlow"
+
+    folder_name = raw.replace('_', ' ').strip()
+    folder_name = _WS_RE.sub(' ', folder_name)
+    # Only remove truly problematic characters, keep meaningful business names
+    folder_name = folder_name.translate(_DEL_TABLE)
+    if not folder_name.isascii():
+        folder_name = _NON_KEEP_RE.sub('', folder_name)
+    return folder_name.strip() or "Uploaded iFlow"
+
+_ZIP_EXT_RE = re.compile(r'\.zip$', re.IGNORECASE)
+
+def _folder_from_filename(filename):
+    """Derive a display folder name from an uploaded filename.
+
+    One anchored regex strips the .zip extension case-insensitively, a
+    leading all-digit timestamp prefix is dropped, and the shared sanitizer
+    runs on what remains - replacing the ladder the handlers used to repeat.
+    """
+    name = _ZIP_EXT_RE.sub('', filename)
+    parts = name.split('_')
+    if len(parts) > 1 and parts[0].isdigit():
+        name = '_'.join(parts[1:])
+    return sanitize_folder_name(name)
+
+def _write_base64_to_file(base64_data, dest, chunk_chars=1 << 16):
+    """Decode a base64 payload to a path or writable file in fixed chunks.
+
+    Peak memory stays at one chunk instead of encoded text plus the full
+    decoded bytes. Slices are kept 4-aligned so each chunk decodes cleanly;
+    whitespace is stripped up front only when present. Returns bytes written.
+    """
+    if not isinstance(base64_data, (bytes, bytearray)):
+        base64_data = base64_data.encode('ascii')
+    # Tolerate data-URI payloads ("data:application/zip;base64,....")
+    if base64_data.startswith(b'data:'):
+        base64_data = base64_data.partition(b',')[2]
+    if b'\n' in base64_data or b'\r' in base64_data or b' ' in base64_data:
+        base64_data = b''.join(base64_data.split())
+
+    total = 0
+    if hasattr(dest, 'write'):
+        for start in range(0, len(base64_data), chunk_chars):
+            decoded = pybase64.b64decode(
+                base64_data[start:start + chunk_chars], validate=False)
+            dest.write(decoded)
+            total += len(decoded)
+        return total
+    with open(dest, 'wb', buffering=1 << 20) as out:
+        for start in range(0, len(base64_data), chunk_chars):
+            decoded = pybase64.b64decode(
+                base64_data[start:start + chunk_chars], validate=False)
+            out.write(decoded)
+            total += len(decoded)
+    return total
+
+def _looks_like_zip(fp):
+    """Peek the first bytes of a stream for the zip 'PK' signature.
+
+    Lets upload handlers reject non-zip payloads with a 400 before zipfile
+    seeks through the whole file looking for a central directory.
+    """
+    pos = fp.tell()
+    sig = fp.read(4)
+    fp.seek(pos)
+    return sig[:2] == b'PK'
+
+def extract_folder_name_from_zip(zip_src):
+    """
+    Extract the folder name from a zip file by examining its contents.
+    Accepts either a filesystem path or a seekable file-like object
+    (e.g. the SpooledTemporaryFile behind an upload stream).
+
+    Path lookups are cached on (path, mtime, size) so re-uploads of the
+    same zip (n8n retries, duplicate-folder attempts) skip the central
+    directory walk. File-like objects always take the uncached path.
+    """
+    if isinstance(zip_src, (str, os.PathLike)):
+        try:
+            st = os.stat(zip_src)
+        except OSError:
+            return _extract_folder_name_impl(zip_src)
+        return _cached_folder_name((os.fspath(zip_src), st.st_mtime_ns, st.st_size))
+    return _extract_folder_name_impl(zip_src)
+
+@functools.lru_cache(maxsize=64)
+def _cached_folder_name(key):
+    return _extract_folder_name_impl(key[0])
+
+def _folder_name_from_zipref(zip_ref, zip_name):
+    """Run the folder-name strategies against an already-open ZipFile."""
+    # Single pass over the central directory instead of materializing
+    # namelist() into several lists. Collect everything the strategies
+    # below need and exit early once a usable root folder and an .iflw
+    # entry have both been observed.
+    total_entries = 0
+    root_folders = set()
+    first_iflw = None
+    first_meaningful_folder = None
+
+    for zi in zip_ref.infolist():
+        total_entries += 1
+        file_name = zi.filename
+
+        if first_iflw is None and file_name.endswith('.iflw'):
+            first_iflw = file_name
+
+        root_folder, sep, _ = file_name.partition('/')
+        if sep and root_folder.lower() not in TECHNICAL_FOLDERS:
+            root_folders.add(root_folder)
+            if first_meaningful_folder is None and file_name.lower().endswith(MEANINGFUL_EXTS):
+                first_meaningful_folder = root_folder
+
+        if root_folders and first_iflw:
+            break
+
+    if not total_entries:
+        logger.warning("Empty zip file")
+        return None
+
+    logger.info("=== ZIP FILE ANALYSIS ===")
+    logger.info("Scanned %s zip entries (early exit enabled)", total_entries)
+
+    # Strategy 0: Use zip filename first (most reliable for user-uploaded files)
+    logger.info("=== STRATEGY 0: ZIP FILENAME (PRIORITY) ===")
+    zip_basename = os.path.splitext(os.path.basename(str(zip_name)))[0]
+    logger.info("Original zip basename: '%s'", zip_basename)
+    
+    # Remove timestamp prefix if present
+    if '_' in zip_basename:
+        parts = zip_basename.split('_')
+        if len(parts) > 1 and parts[0].isdigit():
+            # Remove timestamp prefix
+            zip_basename = '_'.join(parts[1:])
+            logger.info("Removed timestamp prefix: '%s'", zip_basename)
+    
+    # Don't clean the zip filename too aggressively - it's the user's intended name
+    zip_basename = zip_basename.replace('_', ' ').strip()
+    zip_basename = ' '.join(zip_basename.split())
+    
+    if zip_basename and len(zip_basename) > 2:
+        logger.info("✅ USING zip filename: '%s'", zip_basename)
+        return zip_basename
+    else:
+        logger.warning("❌ Zip filename too short: '%s'", zip_basename)
+    
+    # Strategy 1: Look for .iflw files (fallback)
+    logger.info("=== STRATEGY 1: .iflw FILES ===")
+    logger.info("First .iflw file: %s", first_iflw)
+
+    if first_iflw:
+        # Extract name from .iflw file
+        iflow_name = os.path.splitext(os.path.basename(first_iflw))[0]
+        logger.info("Extracted iFlow file name: '%s'", iflow_name)
         
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            # Get all file names in the zip
-            file_names = zip_ref.namelist()
-            
-            if not file_names:
-                logger.warning("Empty zip file")
-                return None
-            
-            logger.info(f"=== ZIP FILE ANALYSIS ===")
-            logger.info(f"Total files in zip: {len(file_names)}")
-            logger.info(f"All files in zip: {file_names}")
-            
-            # Strategy 0: Use zip filename first (most reliable for user-uploaded files)
-            logger.info(f"=== STRATEGY 0: ZIP FILENAME (PRIORITY) ===")
-            zip_basename = os.path.splitext(os.path.basename(zip_path))[0]
-            logger.info(f"Original zip basename: '{zip_basename}'")
-            
-            # Remove timestamp prefix if present
-            if '_' in zip_basename:
-                parts = zip_basename.split('_')
-                if len(parts) > 1 and parts[0].isdigit():
-                    # Remove timestamp prefix
-                    zip_basename = '_'.join(parts[1:])
-                    logger.info(f"Removed timestamp prefix: '{zip_basename}'")
-            
-            # Don't clean the zip filename too aggressively - it's the user's intended name
-            zip_basename = zip_basename.replace('_', ' ').strip()
-            zip_basename = ' '.join(zip_basename.split())
-            
-            if zip_basename and len(zip_basename) > 2:
-                logger.info(f"✅ USING zip filename: '{zip_basename}'")
-                return zip_basename
-            else:
-                logger.warning(f"❌ Zip filename too short: '{zip_basename}'")
-            
-            # Strategy 1: Look for .iflw files (fallback)
-            iflow_files = [f for f in file_names if f.endswith('.iflw')]
-            logger.info(f"=== STRATEGY 1: .iflw FILES ===")
-            logger.info(f"Found {len(iflow_files)} .iflw files: {iflow_files}")
-            
-            if iflow_files:
-                # Extract name from .iflw file
-                iflow_file = iflow_files[0]
-                iflow_name = os.path.splitext(os.path.basename(iflow_file))[0]
-                logger.info(f"Extracted iFlow file name: '{iflow_name}'")
-                
-                # Clean up the name
-                iflow_name = clean_folder_name(iflow_name)
-                
-                if iflow_name and len(iflow_name) > 2:
-                    logger.info(f"✅ USING iFlow file name: '{iflow_name}'")
-                    return iflow_name
-                else:
-                    logger.warning(f"❌ iFlow file name too short after cleaning: '{iflow_name}'")
-            
-            # Strategy 2: Look for the most meaningful root folder
-            logger.info(f"=== STRATEGY 2: ROOT FOLDERS ===")
-            root_folders = set()
-            for file_name in file_names:
-                if '/' in file_name:
-                    root_folder = file_name.split('/')[0]
-                    # Skip common technical folders
-                    if root_folder.lower() not in ['src', 'target', 'build', 'bin', 'lib', 'resources', 'meta-inf', 'web-inf', 'maven', 'gradle', 'node_modules', 'dist', 'out', 'test', 'tests']:
-                        root_folders.add(root_folder)
-            
-            logger.info(f"Found root folders: {list(root_folders)}")
-            
-            if root_folders:
-                # Choose the most meaningful folder name
-                folder_name = choose_best_folder_name(list(root_folders))
-                logger.info(f"Selected best folder: '{folder_name}'")
-                
-                # Clean up the folder name
-                folder_name = clean_folder_name(folder_name)
-                
-                if folder_name and len(folder_name) > 2:
-                    logger.info(f"✅ USING root folder name: '{folder_name}'")
-                    return folder_name
-                else:
-                    logger.warning(f"❌ Root folder name too short after cleaning: '{folder_name}'")
-            
-            # Strategy 3: Look for other meaningful files
-            logger.info(f"=== STRATEGY 3: MEANINGFUL FILES ===")
-            meaningful_files = [f for f in file_names if any(ext in f.lower() for ext in ['.xml', '.json', '.properties', '.config'])]
-            logger.info(f"Found meaningful files: {meaningful_files}")
-            
-            if meaningful_files:
-                # Try to extract name from meaningful files
-                for file_path in meaningful_files:
-                    if '/' in file_path:
-                        folder_name = file_path.split('/')[0]
-                        if folder_name.lower() not in ['src', 'target', 'build', 'bin', 'lib', 'resources', 'meta-inf', 'web-inf', 'maven', 'gradle', 'node_modules', 'dist', 'out', 'test', 'tests']:
-                            folder_name = clean_folder_name(folder_name)
-                            if folder_name and len(folder_name) > 2:
-                                logger.info(f"✅ USING meaningful folder from file: '{folder_name}'")
-                                return folder_name
-            
-            # Strategy 4: Look for any folder that contains business-meaningful keywords
-            logger.info(f"=== STRATEGY 4: BUSINESS KEYWORDS ===")
-            business_keywords = ['customer', 'order', 'material', 'product', 'integration', 'flow', 'process', 'data', 'sync', 'replicate', 'transfer', 'export', 'import', 'pack', 'fee', 'erp', 'cpq', 'sap', 'business', 'suite', 'idoc', 'xml', 'flat', 'syntax', 'conversion', 'assembly', 'process', 'xslt', 'pricing', 'conditions', 'classifications']
-            for file_name in file_names:
-                if '/' in file_name:
-                    folder_name = file_name.split('/')[0]
-                    if any(keyword in folder_name.lower() for keyword in business_keywords):
-                        folder_name = clean_folder_name(folder_name)
-                        if folder_name and len(folder_name) > 2:
-                            logger.info(f"✅ USING business-meaningful folder: '{folder_name}'")
-                            return folder_name
-            
-            # Final fallback
-            logger.warning("❌ Could not extract meaningful folder name, using default")
-            return "iFlow Integration"
-                
+        # Clean up the name
+        iflow_name = clean_folder_name(iflow_name)
+        
+        if iflow_name and len(iflow_name) > 2:
+            logger.info("✅ USING iFlow file name: '%s'", iflow_name)
+            return iflow_name
+        else:
+            logger.warning("❌ iFlow file name too short after cleaning: '%s'", iflow_name)
+    
+    # Strategy 2: Look for the most meaningful root folder
+    logger.info("=== STRATEGY 2: ROOT FOLDERS ===")
+    # Guard the list() copy - lazy formatting still evaluates the arg
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Found root folders: %s", list(root_folders))
+    
+    if root_folders:
+        # Choose the most meaningful folder name
+        folder_name = choose_best_folder_name(list(root_folders))
+        logger.info("Selected best folder: '%s'", folder_name)
+        
+        # Clean up the folder name
+        folder_name = clean_folder_name(folder_name)
+        
+        if folder_name and len(folder_name) > 2:
+            logger.info("✅ USING root folder name: '%s'", folder_name)
+            return folder_name
+        else:
+            logger.warning("❌ Root folder name too short after cleaning: '%s'", folder_name)
+    
+    # Strategy 3: Look for other meaningful files
+    logger.info("=== STRATEGY 3: MEANINGFUL FILES ===")
+    logger.info("First meaningful folder: %s", first_meaningful_folder)
+
+    if first_meaningful_folder:
+        folder_name = clean_folder_name(first_meaningful_folder)
+        if folder_name and len(folder_name) > 2:
+            logger.info("✅ USING meaningful folder from file: '%s'", folder_name)
+            return folder_name
+
+    # Strategy 4: Look for any folder that contains business-meaningful keywords
+    logger.info("=== STRATEGY 4: BUSINESS KEYWORDS ===")
+    for root_folder in root_folders:
+        if any(keyword in root_folder.lower() for keyword in BUSINESS_KEYWORDS):
+            folder_name = clean_folder_name(root_folder)
+            if folder_name and len(folder_name) > 2:
+                logger.info("✅ USING business-meaningful folder: '%s'", folder_name)
+                return folder_name
+    
+    # Final fallback
+    logger.warning("❌ Could not extract meaningful folder name, using default")
+    return "iFlow Integration"
+
+
+def _extract_folder_name_impl(zip_src):
+    f = mm = None
+    try:
+        logger.info("=== STARTING FOLDER NAME EXTRACTION FOR: %s ===", zip_src)
+
+        if hasattr(zip_src, 'read'):
+            zip_src.seek(0)
+            zip_name = getattr(zip_src, 'name', '') or ''
+            fp = zip_src
+        else:
+            # mmap the file so zipfile demand-pages only the central
+            # directory at the tail instead of reading the whole archive
+            zip_name = zip_src
+            f = open(zip_src, 'rb')
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            fp = mm
+
+        with zipfile.ZipFile(fp, 'r') as zip_ref:
+            return _folder_name_from_zipref(zip_ref, zip_name)
+
     except Exception as e:
-        logger.error(f"❌ Error extracting folder name from zip: {e}")
+        logger.error("❌ Error extracting folder name from zip: %s", e)
         return None
+    finally:
+        if mm is not None:
+            mm.close()
+        if f is not None:
+            f.close()
 
 def choose_best_folder_name(folder_names):
     """Choose the most meaningful folder name from a list."""
     # Prioritize folders that look like actual iFlow names
     meaningful_folders = []
-    
-    # Business keywords that indicate meaningful folder names
-    business_keywords = ['customer', 'order', 'material', 'product', 'integration', 'flow', 'process', 'service', 'api', 'data', 'sync', 'replicate', 'transfer', 'export', 'import', 'sales', 'purchase', 'inventory', 'warehouse', 'logistics', 'finance', 'hr', 'employee', 'supplier', 'vendor', 'pack', 'fee', 'erp', 'cpq', 'sap', 'business', 'suite']
-    
-    logger.info(f"Choosing best folder from: {folder_names}")
-    
+
+    logger.info("Choosing best folder from: %s", folder_names)
+
     for folder in folder_names:
         # Skip very short names
         if len(folder) < 3:
             continue
-        
+
+        folder_lower = folder.lower()
+
         # Skip common technical folders
-        if folder.lower() in ['src', 'target', 'build', 'bin', 'lib', 'resources', 'meta-inf', 'web-inf', 'maven', 'gradle', 'node_modules', 'dist', 'out', 'test', 'tests']:
+        if folder_lower in TECHNICAL_FOLDERS:
             continue
-        
+
         # Prefer folders with business-meaningful keywords
-        if any(keyword in folder.lower() for keyword in business_keywords):
+        if any(keyword in folder_lower for keyword in BUSINESS_KEYWORDS):
             meaningful_folders.insert(0, folder)  # Put at front
-            logger.info(f"Found meaningful folder: {folder}")
+            logger.info("Found meaningful folder: %s", folder)
         else:
             meaningful_folders.append(folder)
-    
+
     # If we have meaningful folders, return the best one
     if meaningful_folders:
-        logger.info(f"Selected meaningful folder: {meaningful_folders[0]}")
+        logger.info("Selected meaningful folder: %s", meaningful_folders[0])
         return meaningful_folders[0]
-    
+
     # If no meaningful folders, return the first non-technical folder
     for folder in folder_names:
-        if folder.lower() not in ['src', 'target', 'build', 'bin', 'lib', 'resources', 'meta-inf', 'web-inf', 'maven', 'gradle', 'node_modules', 'dist', 'out', 'test', 'tests']:
-            logger.info(f"Selected non-technical folder: {folder}")
+        if folder.lower() not in TECHNICAL_FOLDERS:
+            logger.info("Selected non-technical folder: %s", folder)
             return folder
     
     # Last resort
-    logger.info(f"Using last resort: {folder_names[0] if folder_names else 'iFlow Integration'}")
+    logger.info("Using last resort: %s", folder_names[0] if folder_names else 'iFlow Integration')
     return folder_names[0] if folder_names else "iFlow Integration"
 
 def clean_folder_name(folder_name):
@@ -216,77 +495,225 @@ def clean_folder_name(folder_name):
     if not folder_name:
         return None
     
-    logger.info(f"Cleaning folder name: '{folder_name}'")
+    logger.info("Cleaning folder name: '%s'", folder_name)
     
     # Replace underscores with spaces
     folder_name = folder_name.replace('_', ' ').strip()
-    
+
     # Remove multiple spaces
-    folder_name = ' '.join(folder_name.split())
-    
-    # Remove common SAP/iFlow prefixes and suffixes
-    prefixes_to_remove = [
-        'iflow', 'iFlow', 'integration flow', 'integrationflow',
-        'sap', 'SAP', 'flow', 'Flow', 'integration', 'Integration',
-        'sap-', 'SAP-', 'sap_', 'SAP_'
-    ]
-    
-    suffixes_to_remove = [
-        'iflow', 'iFlow', 'flow', 'Flow', 'integration', 'Integration',
-        '.iflw', '.xml', '.json'
-    ]
-    
-    # Remove prefixes
-    for prefix in prefixes_to_remove:
-        if folder_name.lower().startswith(prefix.lower()):
-            folder_name = folder_name[len(prefix):].strip()
-            logger.info(f"Removed prefix '{prefix}': '{folder_name}'")
-            break
-    
-    # Remove suffixes
-    for suffix in suffixes_to_remove:
-        if folder_name.lower().endswith(suffix.lower()):
-            folder_name = folder_name[:-len(suffix)].strip()
-            logger.info(f"Removed suffix '{suffix}': '{folder_name}'")
-            break
-    
+    folder_name = _WS_RE.sub(' ', folder_name)
+
+    # Remove common SAP/iFlow prefixes and suffixes with precompiled patterns
+    folder_name = _PREFIX_RE.sub('', folder_name).strip()
+    folder_name = _SUFFIX_RE.sub('', folder_name).strip()
+
     # Clean up any remaining issues
-    folder_name = ' '.join(folder_name.split())
+    folder_name = _WS_RE.sub(' ', folder_name)
     
     # If the name is too short or empty, return None
     if len(folder_name) < 3:
-        logger.warning(f"Folder name too short after cleaning: '{folder_name}'")
+        logger.warning("Folder name too short after cleaning: '%s'", folder_name)
         return None
     
-    logger.info(f"Final cleaned folder name: '{folder_name}'")
+    logger.info("Final cleaned folder name: '%s'", folder_name)
     return folder_name
 
-def extract_zip_file(zip_path, extract_to):
-    """Extract a zip file to the specified directory."""
+# iFlow archives are mostly many small XML files; inflate and os.write both
+# release the GIL, so a few workers extract them several-fold faster
+_EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Extraction scratch space lives on tmpfs when the host has one - the files
+# are written, re-read once by the parser, then discarded, so they never
+# need to hit real disk
+TMPFS_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+def _extract_dir_for(zip_ref=None):
+    """Pick the parent directory for an extraction TemporaryDirectory.
+
+    Prefers tmpfs, but falls back to the default temp location (None) when
+    the archive's uncompressed size - summed from the central directory -
+    would claim more than half the free tmpfs space.
+    """
+    if TMPFS_DIR is None:
+        return None
+    if zip_ref is not None:
+        try:
+            uncompressed = sum(zi.file_size for zi in zip_ref.infolist())
+            stats = os.statvfs(TMPFS_DIR)
+            if uncompressed > (stats.f_bavail * stats.f_frsize) // 2:
+                logger.info(
+                    "Archive too large for tmpfs (%s bytes uncompressed); "
+                    "extracting to disk instead", uncompressed)
+                return None
+        except OSError:
+            return None
+    return TMPFS_DIR
+
+def _sanitized_member_path(dest, name):
+    """Map a zip member name under dest the way zipfile's extract does.
+
+    Uploads are untrusted, so drop drive prefixes, leading separators and
+    any '', '.' or '..' components before joining - a hostile member name
+    must not be able to place anything outside the extraction root.
+    """
+    name = name.replace('/', os.path.sep)
+    if os.path.altsep:
+        name = name.replace(os.path.altsep, os.path.sep)
+    name = os.path.splitdrive(name)[1]
+    name = os.path.sep.join(
+        p for p in name.split(os.path.sep)
+        if p not in ('', os.path.curdir, os.path.pardir))
+    return os.path.join(dest, name)
+
+def _parallel_extract(zip_ref, dest):
+    """Extract an open ZipFile with a small worker pool.
+
+    CPython's zipfile serializes the underlying seeks per chunk, so
+    concurrent extract() calls on one handle are safe while inflate and
+    writes overlap. Small archives just use extractall().
+    """
+    infos = zip_ref.infolist()
+    if len(infos) < 8 or _EXTRACT_WORKERS < 2:
+        zip_ref.extractall(dest)
+        return
+
+    # Create the directory tree serially first so workers never race mkdir.
+    # Many zips carry no explicit directory entries, so derive parents from
+    # the file entries too - zipfile's own makedirs has no exist_ok and two
+    # workers filling the same new folder would otherwise collide. Paths
+    # are sanitized first so this pre-pass is as traversal-safe as the
+    # extract() calls that follow
+    for zi in infos:
+        target = _sanitized_member_path(dest, zi.filename)
+        os.makedirs(target if zi.is_dir() else os.path.dirname(target),
+                    exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=_EXTRACT_WORKERS) as ex:
+        # list() drains the iterator so worker exceptions propagate here
+        list(ex.map(
+            lambda zi: None if zi.is_dir() else zip_ref.extract(zi, dest),
+            infos))
+
+def extract_zip_file(zip_src, extract_to):
+    """Extract a zip to the specified directory.
+
+    Accepts a path or a seekable file-like object, so uploads held in memory
+    (or a spooled temp file) extract without an intermediate copy on disk.
+    """
     try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_to)
-        logger.info(f"Successfully extracted {zip_path} to {extract_to}")
+        if hasattr(zip_src, 'read'):
+            zip_src.seek(0)
+        with zipfile.ZipFile(zip_src, 'r') as zip_ref:
+            _parallel_extract(zip_ref, extract_to)
+        logger.info("Successfully extracted %s to %s", zip_src, extract_to)
         return True
     except Exception as e:
-        logger.error(f"Error extracting zip file: {e}")
+        logger.error("Error extracting zip file: %s", e)
         return False
 
+def stream_extract_iflw(zip_src, dest_path):
+    """
+    Stream the single .iflw entry out of a zip straight to dest_path.
+    Accepts a path or a seekable file-like object. Prefers entries under the
+    standard SAP scenarioflows/integrationflow path.
+    Returns the zip member name on success, None if no .iflw entry exists.
+    """
+    try:
+        if hasattr(zip_src, 'read'):
+            zip_src.seek(0)
+        with zipfile.ZipFile(zip_src, 'r') as zip_ref:
+            chosen = None
+            for zi in zip_ref.infolist():
+                if zi.filename.endswith('.iflw'):
+                    if 'scenarioflows/integrationflow/' in zi.filename:
+                        chosen = zi
+                        break
+                    if chosen is None:
+                        chosen = zi
+
+            if chosen is None:
+                logger.warning("No .iflw file found in the zip archive")
+                return None
+
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            with zip_ref.open(chosen) as src, open(dest_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, min(chosen.file_size, 1 << 20) or 1 << 20)
+
+            logger.info("Streamed %s to %s", chosen.filename, dest_path)
+            return chosen.filename
+
+    except Exception as e:
+        logger.error("Error streaming .iflw entry from zip: %s", e)
+        return None
+
+def process_iflow_zip(zip_src, folder_name=None):
+    """
+    Process an uploaded iFlow zip and create the Knowledge Graph.
+    Accepts a path or a seekable file-like object and streams only the .iflw
+    entry out of the archive instead of extracting every file to disk and
+    copying the one we need afterwards.
+    """
+    try:
+        # Use provided folder name or derive it from the zip itself
+        if not folder_name:
+            folder_name = sanitize_folder_name(extract_folder_name_from_zip(zip_src))
+
+        logger.info("Final folder name: '%s'", folder_name)
+
+        # Create a temporary directory holding only the .iflw file
+        with tempfile.TemporaryDirectory(dir=_extract_dir_for()) as temp_dir:
+            target_iflow_path = os.path.join(temp_dir, "src/main/resources/scenarioflows/integrationflow/test_iflow.iflw")
+            iflow_member = stream_extract_iflw(zip_src, target_iflow_path)
+            if not iflow_member:
+                return {
+                    'success': False,
+                    'error': 'No .iflw file found in the uploaded folder'
+                }
+
+            # Initialize the Knowledge Graph creator with folder name
+            kg = get_kg(folder_name=folder_name)
+            kg.iflow_file = target_iflow_path
+
+            # Create the Knowledge Graph
+            kg.run(batch_size=int(os.environ.get('KG_BATCH_SIZE', '1000')))
+
+            # Get statistics
+            stats = kg.get_graph_statistics()
+
+            return {
+                'success': True,
+                'message': 'Knowledge Graph created successfully',
+                'statistics': stats,
+                'iflow_file': iflow_member,
+                'folder_name': folder_name
+            }
+
+    except Exception as e:
+        logger.error("Error processing iFlow zip: %s", e)
+        logger.error(traceback.format_exc())
+        return {
+            'success': False,
+            'error': f'Error processing iFlow folder: {str(e)}'
+        }
+
 def find_iflow_file(extracted_path):
     """Find the iFlow file in the extracted directory structure."""
-    iflow_patterns = [
-        "src/main/resources/scenarioflows/integrationflow/*.iflw",
-        "**/*.iflw",
-        "**/integrationflow/*.iflw"
-    ]
-    
+    # Fast path: SAP iFlow projects place the file at a deterministic location,
+    # so try that directory first before resorting to a full tree walk
+    standard_dir = pathlib.Path(extracted_path) / 'src/main/resources/scenarioflows/integrationflow'
+    if standard_dir.is_dir():
+        for hit in standard_dir.glob('*.iflw'):
+            logger.info("Found iFlow file at standard path: %s", hit)
+            return str(hit)
+
+    # Fallback: walk the whole tree for non-standard layouts
     for root, dirs, files in os.walk(extracted_path):
         for file in files:
             if file.endswith('.iflw'):
                 iflow_path = os.path.join(root, file)
-                logger.info(f"Found iFlow file: {iflow_path}")
+                logger.info("Found iFlow file: %s", iflow_path)
                 return iflow_path
-    
+
     logger.warning("No .iflw file found in the extracted directory")
     return None
 
@@ -303,34 +730,23 @@ def process_iflow_folder(extracted_path, folder_name=None):
         
         # Use provided folder name or extract from path
         if not folder_name:
-            folder_name = os.path.basename(extracted_path) or "Uploaded_iFlow"
-        
-        logger.info(f"Original folder name: '{folder_name}'")
-        
-        # Clean up the folder name - replace underscores with spaces and clean up
-        folder_name = folder_name.replace('_', ' ').strip()
-        # Remove any extra spaces but keep meaningful characters
-        folder_name = ' '.join(folder_name.split())
-        # Only remove truly problematic characters, keep meaningful business names
-        folder_name = ''.join(c for c in folder_name if c.isalnum() or c in [' ', '-', '(', ')', '&', '/']).strip()
-        if not folder_name:
-            folder_name = "Uploaded iFlow"
-        
-        logger.info(f"Final folder name: '{folder_name}'")
+            folder_name = sanitize_folder_name(os.path.basename(extracted_path))
+
+        logger.info("Final folder name: '%s'", folder_name)
         
         # Create a temporary directory for processing
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=_extract_dir_for()) as temp_dir:
             # Copy the iFlow file to the expected location
             target_iflow_path = os.path.join(temp_dir, "src/main/resources/scenarioflows/integrationflow/test_iflow.iflw")
             os.makedirs(os.path.dirname(target_iflow_path), exist_ok=True)
             shutil.copy2(iflow_file, target_iflow_path)
             
             # Initialize the Knowledge Graph creator with folder name
-            kg = IFlowKnowledgeGraph(folder_name=folder_name)
+            kg = get_kg(folder_name=folder_name)
             kg.iflow_file = target_iflow_path
             
             # Create the Knowledge Graph
-            kg.run()
+            kg.run(batch_size=int(os.environ.get('KG_BATCH_SIZE', '1000')))
             
             # Get statistics
             stats = kg.get_graph_statistics()
@@ -344,7 +760,7 @@ def process_iflow_folder(extracted_path, folder_name=None):
             }
             
     except Exception as e:
-        logger.error(f"Error processing iFlow folder: {e}")
+        logger.error("Error processing iFlow folder: %s", e)
         logger.error(traceback.format_exc())
         return {
             'success': False,
@@ -353,193 +769,55 @@ def process_iflow_folder(extracted_path, folder_name=None):
 
 @app.route('/')
 def index():
-    """Main page with upload interface."""
-    return '''
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>KG Injection Pipeline</title>
-        <style>
-            body { font-family: Arial, sans-serif; margin: 40px; background-color: #f5f5f5; }
-            .container { max-width: 800px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-            h1 { color: #333; text-align: center; }
-            .upload-area { border: 2px dashed #ccc; padding: 40px; text-align: center; margin: 20px 0; border-radius: 10px; }
-            .upload-area:hover { border-color: #007bff; background-color: #f8f9fa; }
-            input[type="file"] { margin: 20px 0; }
-            button { background-color: #007bff; color: white; padding: 12px 24px; border: none; border-radius: 5px; cursor: pointer; font-size: 16px; }
-            button:hover { background-color: #0056b3; }
-            button:disabled { background-color: #ccc; cursor: not-allowed; }
-            .result { margin-top: 20px; padding: 15px; border-radius: 5px; }
-            .success { background-color: #d4edda; border: 1px solid #c3e6cb; color: #155724; }
-            .error { background-color: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; }
-            .loading { background-color: #d1ecf1; border: 1px solid #bee5eb; color: #0c5460; }
-            .stats { background-color: #e2e3e5; border: 1px solid #d6d8db; color: #383d41; margin-top: 10px; }
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>🚀 KG Injection Pipeline</h1>
-            <p style="text-align: center; color: #666;">Upload your iFlow zip file to generate a Knowledge Graph</p>
-            
-            <div class="upload-area">
-                <h3>📁 Upload iFlow Folder</h3>
-                <p>Select a zip file containing your iFlow folder</p>
-                <form id="uploadForm" enctype="multipart/form-data">
-                    <input type="file" id="fileInput" name="file" accept=".zip" required>
-                    <br><br>
-                    <button type="submit" id="uploadBtn">🚀 Generate Knowledge Graph</button>
-                </form>
-            </div>
-            
-            <div id="result"></div>
-            
-            <div style="margin-top: 30px; text-align: center;">
-                <h3>📊 Quick Actions</h3>
-                <button onclick="checkStatus()">📈 Check Database Status</button>
-                <button onclick="exportGraph()">📥 Export Graph Data</button>
-                <button onclick="clearDatabase()" style="background-color: #dc3545;">🗑️ Clear Database</button>
-            </div>
-        </div>
-
-        <script>
-            document.getElementById('uploadForm').addEventListener('submit', async function(e) {
-                e.preventDefault();
-                
-                const fileInput = document.getElementById('fileInput');
-                const uploadBtn = document.getElementById('uploadBtn');
-                const resultDiv = document.getElementById('result');
-                
-                if (!fileInput.files[0]) {
-                    showResult('Please select a file to upload.', 'error');
-                    return;
-                }
-                
-                const formData = new FormData();
-                formData.append('file', fileInput.files[0]);
-                
-                uploadBtn.disabled = true;
-                uploadBtn.textContent = '⏳ Processing...';
-                showResult('Uploading and processing your iFlow file...', 'loading');
-                
-                try {
-                    const response = await fetch('/upload', {
-                        method: 'POST',
-                        body: formData
-                    });
-                    
-                    const result = await response.json();
-                    
-                    if (result.success) {
-                        showResult(`✅ ${result.message}`, 'success');
-                        if (result.statistics) {
-                            showStats(result.statistics);
-                        }
-                    } else {
-                        if (result.error_type === 'duplicate_folder') {
-                            showResult(`⚠️ ${result.error}<br><br>💡 <strong>Solutions:</strong><br>• Use a different folder name<br>• Clear the existing folder first<br>• Rename your zip file`, 'error');
-                        } else {
-                            showResult(`❌ Error: ${result.error}`, 'error');
-                        }
-                    }
-                } catch (error) {
-                    showResult(`❌ Upload failed: ${error.message}`, 'error');
-                } finally {
-                    uploadBtn.disabled = false;
-                    uploadBtn.textContent = '🚀 Generate Knowledge Graph';
-                }
-            });
-            
-            function showResult(message, type) {
-                const resultDiv = document.getElementById('result');
-                resultDiv.innerHTML = `<div class="result ${type}">${message}</div>`;
-            }
-            
-            function showStats(stats) {
-                const resultDiv = document.getElementById('result');
-                resultDiv.innerHTML += `
-                    <div class="stats">
-                        <h4>📊 Knowledge Graph Statistics</h4>
-                        <p><strong>Total Nodes:</strong> ${stats.total_nodes}</p>
-                        <p><strong>Total Relationships:</strong> ${stats.total_relationships}</p>
-                        <p><strong>Nodes by Type:</strong></p>
-                        <ul>
-                            ${Object.entries(stats.nodes_by_type).map(([type, count]) => 
-                                `<li>${type}: ${count}</li>`
-                            ).join('')}
-                        </ul>
-                    </div>
-                `;
-            }
-            
-            async function checkStatus() {
-                try {
-                    const response = await fetch('/status');
-                    const result = await response.json();
-                    if (result.success) {
-                        showResult(`📈 Database Status: Connected<br>Nodes: ${result.current_counts.nodes}, Relationships: ${result.current_counts.relationships}`, 'success');
-                    } else {
-                        showResult(`❌ Database Error: ${result.error}`, 'error');
-                    }
-                } catch (error) {
-                    showResult(`❌ Status check failed: ${error.message}`, 'error');
-                }
-            }
-            
-            async function exportGraph() {
-                try {
-                    const response = await fetch('/export');
-                    if (response.ok) {
-                        const blob = await response.blob();
-                        const url = window.URL.createObjectURL(blob);
-                        const a = document.createElement('a');
-                        a.href = url;
-                        a.download = 'iflow_graph_export.json';
-                        document.body.appendChild(a);
-                        a.click();
-                        window.URL.revokeObjectURL(url);
-                        document.body.removeChild(a);
-                        showResult('📥 Graph data exported successfully!', 'success');
-                    } else {
-                        showResult('❌ Export failed', 'error');
-                    }
-                } catch (error) {
-                    showResult(`❌ Export failed: ${error.message}`, 'error');
-                }
-            }
-            
-            async function clearDatabase() {
-                if (!confirm('⚠️ Are you sure you want to clear the database? This will delete all data!')) {
-                    return;
-                }
-                
-                try {
-                    const response = await fetch('/clear', { method: 'POST' });
-                    const result = await response.json();
-                    if (result.success) {
-                        showResult('🗑️ Database cleared successfully!', 'success');
-                    } else {
-                        showResult(`❌ Clear failed: ${result.error}`, 'error');
-                    }
-                } catch (error) {
-                    showResult(`❌ Clear failed: ${error.message}`, 'error');
-                }
-            }
-        </script>
-    </body>
-    </html>
-    '''
+    """Main page with upload interface, served from static/index.html."""
+    return app.send_static_file('index.html')
+
+def enforce_max_size(max_bytes):
+    """Return 413 from the declared Content-Length before reading the body.
+
+    MAX_CONTENT_LENGTH only aborts after Werkzeug has started consuming the
+    stream; checking the header at the top of every upload route frees the
+    worker before any buffering or disk write happens.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            content_length = request.content_length
+            if content_length and content_length > max_bytes:
+                response = ojson({
+                    'success': False,
+                    'error': 'File too large. Maximum size is 100MB.'
+                }, status=413)
+                # Stop the client from pushing the rest of the body
+                response.headers['Connection'] = 'close'
+                return response
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@app.after_request
+def add_cache_headers(response):
+    """Allow clients to cache the static index page and revalidate via ETag."""
+    if request.path == '/' and response.status_code == 200:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 3600
+        response.add_etag()
+        return response.make_conditional(request)
+    return response
 
 @app.route('/health')
 def health_check():
     """Health check endpoint."""
-    return jsonify({
+    return ojson({
         'status': 'healthy',
         'service': 'KG Injection Pipeline',
-        'timestamp': datetime.utcnow().isoformat(),
+        'timestamp': _iso_now(),
         'version': '1.0.0'
     })
 
 @app.route('/upload', methods=['POST'])
+@enforce_max_size(app.config['MAX_CONTENT_LENGTH'])
 def upload_iflow():
     """
     Upload and process an iFlow folder (zipped).
@@ -548,7 +826,7 @@ def upload_iflow():
     try:
         # Check if file is present in request
         if 'file' not in request.files:
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'No file provided in request'
             }), 400
@@ -557,114 +835,154 @@ def upload_iflow():
         
         # Check if file is selected
         if file.filename == '':
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'No file selected'
             }), 400
         
         # Check if file has allowed extension
         if not allowed_file(file.filename):
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'File must be a zip file (.zip)'
             }), 400
-        
-        # Secure the filename
-        filename = secure_filename(file.filename)
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        filename = f"{timestamp}_{filename}"
-        
+
+        # Fail fast on payloads that only pretend to be zips
+        if not _looks_like_zip(file.stream):
+            return ojson({
+                'success': False,
+                'error': 'Not a valid zip file'
+            }), 400
+
         # Extract the original folder name from the uploaded filename
-        original_filename = secure_filename(file.filename)
-        folder_name = original_filename.replace('.zip', '').replace('.ZIP', '')
-        
-        # Clean up the folder name - replace underscores with spaces and clean up
-        folder_name = folder_name.replace('_', ' ').strip()
-        # Remove any extra spaces
-        folder_name = ' '.join(folder_name.split())
-        
-        # Save uploaded file
-        upload_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(upload_path)
-        logger.info(f"File uploaded: {upload_path}")
-        
-        # Create temporary directory for extraction
-        with tempfile.TemporaryDirectory() as temp_extract_dir:
-            # Extract the zip file
-            if not extract_zip_file(upload_path, temp_extract_dir):
-                return jsonify({
-                    'success': False,
-                    'error': 'Failed to extract zip file'
-                }), 400
-            
-            # Process the extracted iFlow folder with the original folder name
-            result = process_iflow_folder(temp_extract_dir, folder_name=folder_name)
-            
-            # Clean up uploaded file
-            try:
-                os.remove(upload_path)
-                logger.info(f"Cleaned up uploaded file: {upload_path}")
-            except Exception as e:
-                logger.warning(f"Could not clean up uploaded file: {e}")
-            
-            if result['success']:
-                return jsonify({
-                    'success': True,
-                    'message': f'iFlow processed successfully and Knowledge Graph created for folder: {result.get("folder_name", "Unknown")}',
-                    'statistics': result.get('statistics', {}),
-                    'iflow_file': result.get('iflow_file', ''),
-                    'folder_name': result.get('folder_name', ''),
-                    'timestamp': datetime.utcnow().isoformat()
-                }), 200
-            else:
-                # Check if it's a duplicate folder error
-                error_message = result.get('error', 'Unknown error occurred')
-                if 'already exists' in error_message.lower():
-                    return jsonify({
-                        'success': False,
-                        'error': f'Folder "{folder_name}" already exists in the database. Please use a different name or clear the existing folder first.',
-                        'folder_name': folder_name,
-                        'error_type': 'duplicate_folder'
-                    }), 409  # Conflict status code
-                else:
-                    return jsonify({
-                        'success': False,
-                        'error': error_message
-                    }), 500
-                
+        folder_name = _folder_from_filename(secure_filename(file.filename))
+
+        return _enqueue_upload(file.stream, folder_name)
+
     except RequestEntityTooLarge:
-        return jsonify({
+        return ojson({
             'success': False,
             'error': 'File too large. Maximum size is 100MB.'
         }), 413
-    
+
     except Exception as e:
-        logger.error(f"Unexpected error in upload endpoint: {e}")
+        logger.error("Unexpected error in upload endpoint: %s", e)
         logger.error(traceback.format_exc())
-        return jsonify({
+        return ojson({
             'success': False,
             'error': f'Internal server error: {str(e)}'
         }), 500
 
+def _enqueue_upload(stream, folder_name, status_prefix='/upload/status'):
+    """Persist the zip stream and queue ingest on the worker pool.
+
+    The request answers 202 as soon as the upload is on disk; clients poll
+    the returned status_url for completion, failure, or the duplicate-folder
+    409 that the worker surfaces through the job result.
+    """
+    spool = tempfile.NamedTemporaryFile(
+        dir=app.config['UPLOAD_FOLDER'], suffix='.zip', delete=False)
+    with spool:
+        stream.seek(0)
+        _copy_stream(stream, spool)
+
+    job_id = uuid.uuid4().hex
+    _sweep_upload_jobs()
+    _upload_jobs[job_id] = _upload_pool.submit(_run_upload_job, spool.name, folder_name)
+    logger.info("Queued upload for folder '%s' as job %s", folder_name, job_id)
+
+    return ojson({
+        'success': True,
+        'message': f'Upload accepted; Knowledge Graph creation for folder "{folder_name}" is running in the background',
+        'job_id': job_id,
+        'status_url': f'{status_prefix}/{job_id}',
+        'folder_name': folder_name,
+        'timestamp': _iso_now()
+    }), 202
+
+@app.route('/upload/status/<job_id>', methods=['GET'])
+@app.route('/api/upload/status/<job_id>', methods=['GET'])
+def upload_job_status(job_id):
+    """Poll the outcome of a background upload job."""
+    future = _upload_jobs.get(job_id)
+    if future is None:
+        return ojson({
+            'success': False,
+            'error': 'Unknown job id'
+        }), 404
+
+    if not future.done():
+        return ojson({
+            'success': True,
+            'job_id': job_id,
+            'state': 'processing'
+        }), 200
+
+    # Terminal states are delivered once; evict so completed jobs don't
+    # retain their Future and result payload for the life of the process
+    _upload_jobs.pop(job_id, None)
+
+    exc = future.exception()
+    if exc is not None:
+        return ojson({
+            'success': False,
+            'job_id': job_id,
+            'state': 'failed',
+            'error': str(exc)
+        }), 500
+
+    result = future.result()
+    folder_name = result.get('folder_name', '')
+    if result['success']:
+        return ojson({
+            'success': True,
+            'job_id': job_id,
+            'state': 'finished',
+            'message': f'iFlow processed successfully and Knowledge Graph created for folder: {folder_name or "Unknown"}',
+            'statistics': result.get('statistics', {}),
+            'iflow_file': result.get('iflow_file', ''),
+            'folder_name': folder_name,
+            'timestamp': _iso_now()
+        }), 200
+
+    # Check if it's a duplicate folder error
+    error_message = result.get('error', 'Unknown error occurred')
+    if 'already exists' in error_message.lower():
+        return ojson({
+            'success': False,
+            'job_id': job_id,
+            'state': 'failed',
+            'error': error_message,
+            'folder_name': folder_name,
+            'error_type': 'duplicate_folder'
+        }), 409  # Conflict status code
+
+    return ojson({
+        'success': False,
+        'job_id': job_id,
+        'state': 'failed',
+        'error': error_message
+    }), 500
+
 @app.route('/status', methods=['GET'])
 def get_status():
     """Get the current status of the Knowledge Graph database."""
     try:
-        kg = IFlowKnowledgeGraph()
+        kg = get_kg()
         stats = kg.get_graph_statistics()
         counts = kg.get_current_counts()
         
-        return jsonify({
+        return ojson({
             'success': True,
             'database_status': 'connected',
             'statistics': stats,
             'current_counts': counts,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _iso_now()
         })
         
     except Exception as e:
-        logger.error(f"Error getting database status: {e}")
-        return jsonify({
+        logger.error("Error getting database status: %s", e)
+        return ojson({
             'success': False,
             'error': f'Database connection error: {str(e)}'
         }), 500
@@ -673,18 +991,18 @@ def get_status():
 def clear_database():
     """Clear the Knowledge Graph database."""
     try:
-        kg = IFlowKnowledgeGraph()
+        kg = get_kg()
         kg.clear_database()
         
-        return jsonify({
+        return ojson({
             'success': True,
             'message': 'Database cleared successfully',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _iso_now()
         })
         
     except Exception as e:
-        logger.error(f"Error clearing database: {e}")
-        return jsonify({
+        logger.error("Error clearing database: %s", e)
+        return ojson({
             'success': False,
             'error': f'Error clearing database: {str(e)}'
         }), 500
@@ -693,55 +1011,62 @@ def clear_database():
 def clear_specific_folder():
     """Clear a specific folder from the Knowledge Graph database."""
     try:
-        data = request.get_json()
+        data = _json_body() or {}
         folder_name = data.get('folder_name')
         
         if not folder_name:
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'Folder name is required'
             }), 400
         
-        kg = IFlowKnowledgeGraph(folder_name=folder_name)
+        kg = get_kg(folder_name=folder_name)
         kg.clear_folder_data()
         
-        return jsonify({
+        return ojson({
             'success': True,
             'message': f'Folder "{folder_name}" cleared successfully',
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': _iso_now()
         })
         
     except Exception as e:
-        logger.error(f"Error clearing folder: {e}")
-        return jsonify({
+        logger.error("Error clearing folder: %s", e)
+        return ojson({
             'success': False,
             'error': f'Error clearing folder: {str(e)}'
         }), 500
 
 @app.route('/export', methods=['GET'])
 def export_graph():
-    """Export the current Knowledge Graph data as JSON."""
+    """Export the current Knowledge Graph data as JSON, streamed to the client."""
     try:
-        kg = IFlowKnowledgeGraph()
-        
+        kg = get_kg()
+
         # Create export filename with timestamp
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        timestamp = _stamp()
         export_filename = f"iflow_graph_export_{timestamp}.json"
-        export_path = os.path.join(app.config['UPLOAD_FOLDER'], export_filename)
-        
-        # Export the graph data
-        kg.export_graph_data(export_path)
-        
-        return send_file(
-            export_path,
+
+        # Spool to a temp file so send_file can serve it conditionally (range
+        # requests, resumable downloads, X-Sendfile offload behind a proxy)
+        spool = tempfile.NamedTemporaryFile(
+            mode='w', suffix='.json', delete=False)
+        with spool:
+            kg.export_graph_data(spool)
+
+        response = send_file(
+            spool.name,
             as_attachment=True,
             download_name=export_filename,
-            mimetype='application/json'
+            mimetype='application/json',
+            conditional=True,
+            max_age=0
         )
-        
+        response.call_on_close(lambda: os.remove(spool.name))
+        return response
+
     except Exception as e:
-        logger.error(f"Error exporting graph: {e}")
-        return jsonify({
+        logger.error("Error exporting graph: %s", e)
+        return ojson({
             'success': False,
             'error': f'Error exporting graph: {str(e)}'
         }), 500
@@ -749,7 +1074,7 @@ def export_graph():
 @app.errorhandler(413)
 def too_large(e):
     """Handle file too large error."""
-    return jsonify({
+    return ojson({
         'success': False,
         'error': 'File too large. Maximum size is 100MB.'
     }), 413
@@ -757,26 +1082,32 @@ def too_large(e):
 @app.errorhandler(404)
 def not_found(e):
     """Handle 404 errors."""
-    return jsonify({
+    return ojson({
         'success': False,
         'error': 'Endpoint not found'
     }), 404
 
 @app.route('/n8n/upload', methods=['POST'])
+@enforce_max_size(app.config['MAX_CONTENT_LENGTH'])
 def upload_iflow_n8n():
     """
     Universal n8n-friendly endpoint for file uploads.
     Supports:
-    1. Raw binary uploads (Content-Type: application/x-zip-compressed)
+    1. Raw binary uploads (Content-Type: application/zip,
+       application/x-zip-compressed or application/octet-stream) - preferred:
+       base64 inflates the payload by a third and costs a full decode pass
     2. Multipart/form-data uploads (Content-Type: multipart/form-data)
-    3. JSON uploads with base64 data (Content-Type: application/json)
+    3. JSON uploads with base64 data (Content-Type: application/json) - legacy
     """
     try:
         content_type = request.content_type or ''
-        logger.info(f"Received upload request with Content-Type: {content_type}")
-        
-        # Handle different content types
-        if 'application/x-zip-compressed' in content_type or 'application/octet-stream' in content_type:
+        logger.info("Received upload request with Content-Type: %s", content_type)
+
+        # Handle different content types; raw zip bytes skip JSON parsing
+        # and base64 decoding entirely
+        if ('application/zip' in content_type
+                or 'application/x-zip-compressed' in content_type
+                or 'application/octet-stream' in content_type):
             # Raw binary upload from n8n
             return handle_raw_binary_upload()
         elif 'multipart/form-data' in content_type:
@@ -786,251 +1117,258 @@ def upload_iflow_n8n():
             # JSON with base64 data
             return handle_json_upload()
         else:
-            return jsonify({
+            return ojson({
                 'success': False,
-                'error': f'Unsupported Content-Type: {content_type}. Supported types: application/x-zip-compressed, multipart/form-data, application/json'
+                'error': f'Unsupported Content-Type: {content_type}. Supported types: application/zip, application/x-zip-compressed, multipart/form-data, application/json'
             }), 415
             
     except Exception as e:
-        logger.error(f"Unexpected error in n8n upload endpoint: {e}")
+        logger.error("Unexpected error in n8n upload endpoint: %s", e)
         logger.error(traceback.format_exc())
-        return jsonify({
+        return ojson({
             'success': False,
             'error': f'Internal server error: {str(e)}'
         }), 500
 
-def handle_raw_binary_upload():
-    """Handle raw binary file uploads from n8n."""
+def _upload_common(stream, filename_hint, default_folder=None, error_label='upload'):
+    """Shared tail for every upload route: name, extract, ingest, respond.
+
+    One hot path instead of five near-identical handler bodies; routes only
+    differ in how they validate input and obtain the zip stream.
+    """
     try:
-        # Get raw binary data
-        file_data = request.get_data()
-        
-        if not file_data:
-            return jsonify({
-                'success': False,
-                'error': 'No file data received'
-            }), 400
-        
-        # Generate filename with timestamp
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        filename = f"{timestamp}_n8n_upload.zip"
-        temp_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        
-        # Save raw binary data to file
-        with open(temp_path, 'wb') as f:
-            f.write(file_data)
-        
-        logger.info(f"Raw binary file saved: {temp_path} ({len(file_data)} bytes)")
-        
-        # Extract folder name from zip filename (most reliable for user uploads)
-        zip_filename = os.path.basename(temp_path)
-        folder_name = os.path.splitext(zip_filename)[0]
-        
-        # Remove timestamp prefix if present
-        if '_' in folder_name:
-            parts = folder_name.split('_')
-            if len(parts) > 1 and parts[0].isdigit():
-                # Remove timestamp prefix
-                folder_name = '_'.join(parts[1:])
-        
-        # Clean up the folder name - replace underscores with spaces
-        folder_name = folder_name.replace('_', ' ').strip()
-        folder_name = ' '.join(folder_name.split())
-        
-        if not folder_name or len(folder_name) < 3:
-            folder_name = f"n8n_Upload_{timestamp}"
-        
-        logger.info(f"Extracted folder name from filename: {folder_name}")
-        
-        # Process the file
-        return process_uploaded_file(temp_path, folder_name)
-        
+        folder_name = _folder_from_filename(filename_hint)
+        if default_folder and (folder_name == "Uploaded iFlow" or len(folder_name) < 3):
+            folder_name = default_folder
+
+        logger.info("Extracted folder name from filename: %s", folder_name)
+        return process_uploaded_file(stream, folder_name)
+
     except Exception as e:
-        logger.error(f"Error handling raw binary upload: {e}")
-        return jsonify({
+        logger.error("Error handling %s: %s", error_label, e)
+        return ojson({
             'success': False,
-            'error': f'Error processing raw binary upload: {str(e)}'
+            'error': f'Error processing {error_label}: {str(e)}'
         }), 500
 
+def _spool_base64_payload(base64_data):
+    """Decode a base64 payload into a spooled temp file, or None if invalid."""
+    spool = tempfile.SpooledTemporaryFile(max_size=50 << 20)
+    try:
+        _write_base64_to_file(base64_data, spool)
+        return spool
+    except Exception:
+        spool.close()
+        raise
+
+def _copy_stream(src, dst, bufsize=1 << 20):
+    """Copy an upload stream to dst, zero-copy via os.sendfile when possible.
+
+    Werkzeug spools large bodies to a real temp file, so when both ends
+    expose regular-file descriptors the kernel moves the bytes directly and
+    the userspace read/write loop disappears. Sockets, BytesIO and un-rolled
+    spooled files fall back to shutil.copyfileobj.
+    """
+    try:
+        src_fd = src.fileno()
+        # sendfile needs an mmap-able source; a socket fd would EINVAL
+        if not stat.S_ISREG(os.fstat(src_fd).st_mode):
+            raise OSError('source is not a regular file')
+        dst_fd = dst.fileno()
+    except (AttributeError, OSError):
+        shutil.copyfileobj(src, dst, bufsize)
+        return
+
+    dst.flush()
+    offset = src.tell()
+    while True:
+        sent = os.sendfile(dst_fd, src_fd, offset, bufsize)
+        if not sent:
+            break
+        offset += sent
+    # Re-sync the buffered file object with the fd position sendfile advanced
+    dst.seek(0, os.SEEK_END)
+
+def handle_raw_binary_upload():
+    """Handle raw binary file uploads from n8n."""
+    # Generate filename with timestamp
+    timestamp = _stamp()
+    filename = f"{timestamp}_n8n_upload.zip"
+
+    # Spool the body in memory, overflowing to disk only past 50 MB
+    spool = tempfile.SpooledTemporaryFile(max_size=50 << 20)
+    _copy_stream(request.stream, spool, 1 << 16)
+    file_size = spool.tell()
+    if not file_size:
+        spool.close()
+        return ojson({
+            'success': False,
+            'error': 'No file data received'
+        }), 400
+
+    logger.info("Raw binary upload spooled: %s (%s bytes)", filename, file_size)
+
+    try:
+        return _upload_common(spool, filename,
+                              default_folder=f"n8n_Upload_{timestamp}",
+                              error_label='raw binary upload')
+    finally:
+        spool.close()
+
 def handle_multipart_upload():
     """Handle traditional multipart/form-data uploads."""
-    try:
-        # Check if file is present in request
-        if 'file' not in request.files:
-            return jsonify({
-                'success': False,
-                'error': 'No file provided in multipart request'
-            }), 400
-        
-        file = request.files['file']
-        
-        # Check if file is selected
-        if file.filename == '':
-            return jsonify({
-                'success': False,
-                'error': 'No file selected'
-            }), 400
-        
-        # Check if file has allowed extension
-        if not allowed_file(file.filename):
-            return jsonify({
-                'success': False,
-                'error': 'File must be a zip file (.zip)'
-            }), 400
-        
-        # Secure the filename
-        filename = secure_filename(file.filename)
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        temp_filename = f"{timestamp}_{filename}"
-        temp_path = os.path.join(app.config['UPLOAD_FOLDER'], temp_filename)
-        
-        # Save uploaded file
-        file.save(temp_path)
-        logger.info(f"Multipart file saved: {temp_path}")
-        
-        # Extract folder name from zip filename (most reliable for user uploads)
-        folder_name = filename.replace('.zip', '').replace('.ZIP', '')
-        folder_name = folder_name.replace('_', ' ').strip()
-        folder_name = ' '.join(folder_name.split())
-        
-        if not folder_name or len(folder_name) < 3:
-            folder_name = "Uploaded iFlow"
-        
-        logger.info(f"Extracted folder name from filename: {folder_name}")
-        
-        # Process the file
-        return process_uploaded_file(temp_path, folder_name)
-        
-    except Exception as e:
-        logger.error(f"Error handling multipart upload: {e}")
-        return jsonify({
+    # Check if file is present in request
+    if 'file' not in request.files:
+        return ojson({
             'success': False,
-            'error': f'Error processing multipart upload: {str(e)}'
-        }), 500
+            'error': 'No file provided in multipart request'
+        }), 400
+
+    file = request.files['file']
+
+    # Check if file is selected
+    if file.filename == '':
+        return ojson({
+            'success': False,
+            'error': 'No file selected'
+        }), 400
+
+    # Check if file has allowed extension
+    if not allowed_file(file.filename):
+        return ojson({
+            'success': False,
+            'error': 'File must be a zip file (.zip)'
+        }), 400
+
+    # Extract straight from Werkzeug's spooled upload stream - no copy
+    # into UPLOAD_FOLDER and back
+    return _upload_common(file.stream, secure_filename(file.filename),
+                          error_label='multipart upload')
 
 def handle_json_upload():
     """Handle JSON uploads with base64 data."""
+    data = _json_body()
+
+    if not data:
+        return ojson({
+            'success': False,
+            'error': 'No JSON data provided'
+        }), 400
+
+    if 'file_data' not in data:
+        return ojson({
+            'success': False,
+            'error': 'No file_data provided in JSON'
+        }), 400
+
+    # Get file information
+    filename = data.get('filename', 'uploaded_file.zip')
+    base64_data = data.get('file_data')
+
+    if not base64_data:
+        return ojson({
+            'success': False,
+            'error': 'No base64 file data provided'
+        }), 400
+
+    # Decode into a spooled temp file - small uploads never touch disk
     try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No JSON data provided'
-            }), 400
-        
-        if 'file_data' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'No file_data provided in JSON'
-            }), 400
-        
-        # Get file information
-        filename = data.get('filename', 'uploaded_file.zip')
-        base64_data = data.get('file_data')
-        
-        if not base64_data:
-            return jsonify({
-                'success': False,
-                'error': 'No base64 file data provided'
-            }), 400
-        
-        # Decode base64 data
-        import base64
+        spool = _spool_base64_payload(base64_data)
+    except Exception as e:
+        return ojson({
+            'success': False,
+            'error': f'Invalid base64 data: {str(e)}'
+        }), 400
+
+    logger.info("JSON base64 payload decoded: %s", filename)
+
+    try:
+        return _upload_common(spool, filename, error_label='JSON upload')
+    finally:
+        spool.close()
+
+def process_uploaded_file(file_src, folder_name):
+    """Common processing logic for all upload types.
+
+    Accepts a filesystem path or a seekable file-like object holding the zip;
+    streamed sources are extracted directly with no intermediate disk copy.
+    """
+    try:
+        # One ZipFile open serves the folder-name fallback, the tmpfs size
+        # guard and the extraction - no second central-directory parse
         try:
-            file_data = base64.b64decode(base64_data)
+            if hasattr(file_src, 'read'):
+                file_src.seek(0)
+            zip_ref = zipfile.ZipFile(file_src, 'r')
         except Exception as e:
-            return jsonify({
+            logger.error("Error extracting zip file: %s", e)
+            return ojson({
                 'success': False,
-                'error': f'Invalid base64 data: {str(e)}'
+                'error': 'Failed to extract zip file'
             }), 400
-        
-        # Create temporary file
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        temp_filename = f"{timestamp}_{filename}"
-        temp_path = os.path.join(app.config['UPLOAD_FOLDER'], temp_filename)
-        
-        # Save decoded data to temporary file
-        with open(temp_path, 'wb') as f:
-            f.write(file_data)
-        
-        logger.info(f"JSON base64 file saved: {temp_path}")
-        
-        # Extract folder name from zip filename (most reliable for user uploads)
-        folder_name = filename.replace('.zip', '').replace('.ZIP', '')
-        folder_name = folder_name.replace('_', ' ').strip()
-        folder_name = ' '.join(folder_name.split())
-        
-        if not folder_name or len(folder_name) < 3:
-            folder_name = "Uploaded iFlow"
-        
-        logger.info(f"Extracted folder name from filename: {folder_name}")
-        
-        # Process the file
-        return process_uploaded_file(temp_path, folder_name)
-        
-    except Exception as e:
-        logger.error(f"Error handling JSON upload: {e}")
-        return jsonify({
-            'success': False,
-            'error': f'Error processing JSON upload: {str(e)}'
-        }), 500
 
-def process_uploaded_file(file_path, folder_name):
-    """Common processing logic for all upload types."""
-    try:
-        # Create temporary directory for extraction
-        with tempfile.TemporaryDirectory() as temp_extract_dir:
-            # Extract the zip file
-            if not extract_zip_file(file_path, temp_extract_dir):
-                return jsonify({
+        # Create temporary directory for extraction (tmpfs when it fits)
+        with zip_ref, tempfile.TemporaryDirectory(
+                dir=_extract_dir_for(zip_ref)) as temp_extract_dir:
+            try:
+                if not folder_name or folder_name == "Uploaded iFlow":
+                    zip_name = getattr(file_src, 'name', '') if hasattr(file_src, 'read') else file_src
+                    derived = _folder_name_from_zipref(zip_ref, zip_name or '')
+                    if derived:
+                        folder_name = sanitize_folder_name(derived)
+                _parallel_extract(zip_ref, temp_extract_dir)
+            except Exception as e:
+                logger.error("Error extracting zip file: %s", e)
+                return ojson({
                     'success': False,
                     'error': 'Failed to extract zip file'
                 }), 400
-            
+
             # Process the extracted iFlow folder
             result = process_iflow_folder(temp_extract_dir, folder_name=folder_name)
-            
-            # Clean up uploaded file
-            try:
-                os.remove(file_path)
-                logger.info(f"Cleaned up uploaded file: {file_path}")
-            except Exception as e:
-                logger.warning(f"Could not clean up uploaded file: {e}")
+
+            # Clean up the uploaded file; streamed sources have no file to remove
+            if isinstance(file_src, (str, os.PathLike)):
+                try:
+                    os.remove(file_src)
+                    logger.info("Cleaned up uploaded file: %s", file_src)
+                except Exception as e:
+                    logger.warning("Could not clean up uploaded file: %s", e)
             
             if result['success']:
-                return jsonify({
+                return ojson({
                     'success': True,
                     'message': f'iFlow processed successfully and Knowledge Graph created for folder: {result.get("folder_name", "Unknown")}',
                     'statistics': result.get('statistics', {}),
                     'iflow_file': result.get('iflow_file', ''),
                     'folder_name': result.get('folder_name', ''),
-                    'timestamp': datetime.utcnow().isoformat()
+                    'timestamp': _iso_now()
                 }), 200
             else:
                 # Check if it's a duplicate folder error
                 error_message = result.get('error', 'Unknown error occurred')
                 if 'already exists' in error_message.lower():
-                    return jsonify({
+                    return ojson({
                         'success': False,
                         'error': f'Folder "{folder_name}" already exists in the database. Please use a different name or clear the existing folder first.',
                         'folder_name': folder_name,
                         'error_type': 'duplicate_folder'
                     }), 409  # Conflict status code
                 else:
-                    return jsonify({
+                    return ojson({
                         'success': False,
                         'error': error_message
                     }), 500
                     
     except Exception as e:
-        logger.error(f"Error processing uploaded file: {e}")
-        return jsonify({
+        logger.error("Error processing uploaded file: %s", e)
+        return ojson({
             'success': False,
             'error': f'Error processing file: {str(e)}'
         }), 500
 
 @app.route('/api/upload', methods=['POST'])
+@enforce_max_size(app.config['MAX_CONTENT_LENGTH'])
 def upload_iflow_api():
     """
     API endpoint for direct file uploads (for n8n integration).
@@ -1039,7 +1377,7 @@ def upload_iflow_api():
     try:
         # Check if file is present in request
         if 'file' not in request.files:
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'No file provided in request'
             }), 400
@@ -1048,203 +1386,90 @@ def upload_iflow_api():
         
         # Check if file is selected
         if file.filename == '':
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'No file selected'
             }), 400
         
         # Check if file has allowed extension
         if not allowed_file(file.filename):
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'File must be a zip file (.zip)'
             }), 400
         
-        # Secure the filename
-        filename = secure_filename(file.filename)
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        filename = f"{timestamp}_{filename}"
-        
-        # Extract the original folder name from the uploaded filename
-        original_filename = secure_filename(file.filename)
-        folder_name = original_filename.replace('.zip', '').replace('.ZIP', '')
-        
-        # Clean up the folder name - replace underscores with spaces and clean up
-        folder_name = folder_name.replace('_', ' ').strip()
-        # Remove any extra spaces
-        folder_name = ' '.join(folder_name.split())
-        
-        # Save uploaded file
-        upload_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(upload_path)
-        logger.info(f"File uploaded: {upload_path}")
-        
-        # Create temporary directory for extraction
-        with tempfile.TemporaryDirectory() as temp_extract_dir:
-            # Extract the zip file
-            if not extract_zip_file(upload_path, temp_extract_dir):
-                return jsonify({
-                    'success': False,
-                    'error': 'Failed to extract zip file'
-                }), 400
-            
-            # Process the extracted iFlow folder with the original folder name
-            result = process_iflow_folder(temp_extract_dir, folder_name=folder_name)
-            
-            # Clean up uploaded file
-            try:
-                os.remove(upload_path)
-                logger.info(f"Cleaned up uploaded file: {upload_path}")
-            except Exception as e:
-                logger.warning(f"Could not clean up uploaded file: {e}")
-            
-            if result['success']:
-                return jsonify({
-                    'success': True,
-                    'message': f'iFlow processed successfully and Knowledge Graph created for folder: {result.get("folder_name", "Unknown")}',
-                    'statistics': result.get('statistics', {}),
-                    'iflow_file': result.get('iflow_file', ''),
-                    'folder_name': result.get('folder_name', ''),
-                    'timestamp': datetime.utcnow().isoformat()
-                }), 200
-            else:
-                # Check if it's a duplicate folder error
-                error_message = result.get('error', 'Unknown error occurred')
-                if 'already exists' in error_message.lower():
-                    return jsonify({
-                        'success': False,
-                        'error': f'Folder "{folder_name}" already exists in the database. Please use a different name or clear the existing folder first.',
-                        'folder_name': folder_name,
-                        'error_type': 'duplicate_folder'
-                    }), 409  # Conflict status code
-                else:
-                    return jsonify({
-                        'success': False,
-                        'error': error_message
-                    }), 500
-                
+        # Queue the ingest and answer 202 - n8n polls the status URL instead
+        # of holding an HTTP request open for the whole extract+ingest window
+        folder_name = _folder_from_filename(secure_filename(file.filename))
+        return _enqueue_upload(file.stream, folder_name,
+                               status_prefix='/api/upload/status')
+
     except RequestEntityTooLarge:
-        return jsonify({
+        return ojson({
             'success': False,
             'error': 'File too large. Maximum size is 100MB.'
         }), 413
     
     except Exception as e:
-        logger.error(f"Unexpected error in upload API endpoint: {e}")
+        logger.error("Unexpected error in upload API endpoint: %s", e)
         logger.error(traceback.format_exc())
-        return jsonify({
+        return ojson({
             'success': False,
             'error': f'Internal server error: {str(e)}'
         }), 500
 
 @app.route('/upload-base64', methods=['POST'])
+@enforce_max_size(app.config['MAX_CONTENT_LENGTH'])
 def upload_iflow_base64():
     """
     Upload and process an iFlow folder using base64 encoded data.
     Expected: JSON with 'data' field containing base64 encoded zip file.
     """
     try:
-        data = request.get_json()
+        data = _json_body()
         
         if not data:
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'No JSON data provided'
             }), 400
         
         if 'data' not in data:
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'No file data provided in JSON'
             }), 400
         
         # Get file information
         filename = data.get('filename', 'uploaded_file.zip')
-        mime_type = data.get('mimeType', 'application/zip')
         base64_data = data.get('data')
-        
+
         if not base64_data:
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': 'No base64 data provided'
             }), 400
-        
-        # Decode base64 data
-        import base64
+
+        # Decode into a spooled temp file - small uploads never touch disk
         try:
-            file_data = base64.b64decode(base64_data)
+            spool = _spool_base64_payload(base64_data)
         except Exception as e:
-            return jsonify({
+            return ojson({
                 'success': False,
                 'error': f'Invalid base64 data: {str(e)}'
             }), 400
-        
-        # Create temporary file
-        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        temp_filename = f"{timestamp}_{filename}"
-        temp_path = os.path.join(app.config['UPLOAD_FOLDER'], temp_filename)
-        
-        # Save decoded data to temporary file
-        with open(temp_path, 'wb') as f:
-            f.write(file_data)
-        
-        logger.info(f"Base64 file saved: {temp_path}")
-        
-        # Extract folder name from filename
-        folder_name = filename.replace('.zip', '').replace('.ZIP', '')
-        folder_name = folder_name.replace('_', ' ').strip()
-        folder_name = ' '.join(folder_name.split())
-        if not folder_name:
-            folder_name = "Uploaded iFlow"
-        
-        # Create temporary directory for extraction
-        with tempfile.TemporaryDirectory() as temp_extract_dir:
-            # Extract the zip file
-            if not extract_zip_file(temp_path, temp_extract_dir):
-                return jsonify({
-                    'success': False,
-                    'error': 'Failed to extract zip file'
-                }), 400
-            
-            # Process the extracted iFlow folder
-            result = process_iflow_folder(temp_extract_dir, folder_name=folder_name)
-            
-            # Clean up temporary file
-            try:
-                os.remove(temp_path)
-                logger.info(f"Cleaned up temporary file: {temp_path}")
-            except Exception as e:
-                logger.warning(f"Could not clean up temporary file: {e}")
-            
-            if result['success']:
-                return jsonify({
-                    'success': True,
-                    'message': f'iFlow processed successfully and Knowledge Graph created for folder: {result.get("folder_name", "Unknown")}',
-                    'statistics': result.get('statistics', {}),
-                    'iflow_file': result.get('iflow_file', ''),
-                    'folder_name': result.get('folder_name', ''),
-                    'timestamp': datetime.utcnow().isoformat()
-                }), 200
-            else:
-                # Check if it's a duplicate folder error
-                error_message = result.get('error', 'Unknown error occurred')
-                if 'already exists' in error_message.lower():
-                    return jsonify({
-                        'success': False,
-                        'error': f'Folder "{folder_name}" already exists in the database. Please use a different name or clear the existing folder first.',
-                        'folder_name': folder_name,
-                        'error_type': 'duplicate_folder'
-                    }), 409  # Conflict status code
-                else:
-                    return jsonify({
-                        'success': False,
-                        'error': error_message
-                    }), 500
-                
+
+        logger.info("Base64 payload decoded: %s", filename)
+
+        try:
+            return _upload_common(spool, filename, error_label='base64 upload')
+        finally:
+            spool.close()
+
     except Exception as e:
-        logger.error(f"Unexpected error in upload-base64 endpoint: {e}")
+        logger.error("Unexpected error in upload-base64 endpoint: %s", e)
         logger.error(traceback.format_exc())
-        return jsonify({
+        return ojson({
             'success': False,
             'error': f'Internal server error: {str(e)}'
         }), 500
@@ -1252,11 +1477,12 @@ def upload_iflow_base64():
 @app.errorhandler(500)
 def internal_error(e):
     """Handle internal server errors."""
-    return jsonify({
+    return ojson({
         'success': False,
         'error': 'Internal server error'
     }), 500
 
 if __name__ == '__main__':
-    # Development server
+    # Development server - make sure the merge indexes exist before traffic
+    ensure_indexes_once()
     app.run(host='0.0.0.0', port=int(os.environ.get('PORT', 5000)), debug=False)
@@ -7,13 +7,16 @@ Replicates the exact SAP iFlow diagram into a Neo4j Knowledge Graph for each fol
 """
 
 import os
-import xml.etree.ElementTree as ET
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from lxml import etree as ET
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 import logging
 from typing import Dict, List, Tuple, Any
-import json
-import glob
+import orjson
 
 # Load environment variables
 load_dotenv()
@@ -22,6 +25,148 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# XML namespaces used by SAP iFlow BPMN files
+BPMN2_NS = 'http://www.omg.org/spec/BPMN/20100524/MODEL'
+IFL_NS = 'http:///com.sap.ifl.model/Ifl.xsd'
+
+def _bpmn2(tag: str) -> str:
+    """Namespace-qualified bpmn2 tag name, as iterparse reports it."""
+    return '{%s}%s' % (BPMN2_NS, tag)
+
+NAMESPACES = {'bpmn2': BPMN2_NS, 'ifl': IFL_NS}
+
+# Precompiled XPath expressions - compiled once at import and reused for
+# every parsed element instead of reparsing the path string per call
+_XP_EXTENSION_ELEMENTS = ET.XPath('.//bpmn2:extensionElements', namespaces=NAMESPACES)
+_XP_IFL_PROPERTY = ET.XPath('.//ifl:property', namespaces=NAMESPACES)
+# Predicated lookup answers "what is this component's activityType?" in one
+# C-level XPath evaluation instead of a find + findall + Python loop
+_XP_ACTIVITY_TYPE = ET.XPath(
+    ".//bpmn2:extensionElements//ifl:property[key='activityType']/value/text()",
+    namespaces=NAMESPACES)
+
+# Characters not allowed in a Folder node id, replaced with underscores
+_FOLDER_ID_RE = re.compile(r'[^A-Za-z0-9_]')
+
+# All SAP Integration Suite adapter types treated as protocol components
+_SAP_PROTOCOL_TYPES = frozenset((
+    'IDOC', 'SOAP', 'HTTP', 'HCIOData', 'AMQP', 'ProcessDirect', 'Mail',
+    'JDBC', 'SFTP', 'FTP', 'SuccessFactors', 'OData', 'REST', 'XI',
+    'EDI', 'RFC', 'JMS', 'Kafka', 'MQTT', 'WebSocket', 'TCP', 'UDP'
+))
+
+# Per-folder Cypher text, hoisted to module level so each statement is
+# allocated once at import instead of being rebuilt for every folder; a
+# stable text also keeps the server's plan cache warm
+_Q_CLEAR_FOLDER_NODES = "MATCH (n {folder_id: $folder_id}) DETACH DELETE n"
+_Q_CLEAR_FOLDER_NODE = "MATCH (f:Folder {id: $folder_id}) DETACH DELETE f"
+
+_Q_PROCESS_CONTAINS = """
+    UNWIND $process_ids AS process_id
+    MATCH (p:Process {id: process_id, folder_id: $folder_id})
+    MATCH (c:Component {folder_id: $folder_id})
+    MERGE (p)-[:CONTAINS]->(c)
+"""
+
+_Q_PROTOCOL_EDGES = """
+    UNWIND $rows AS r
+    MATCH (pr:Protocol {id: r.pid, folder_id: $folder_id})
+    CALL {
+        WITH r, pr
+        WITH r, pr WHERE r.src IS NOT NULL
+        MATCH (source) WHERE source.id = r.src AND source.folder_id = $folder_id
+        MERGE (source)-[:USES_PROTOCOL]->(pr)
+    }
+    CALL {
+        WITH r, pr
+        WITH r, pr WHERE r.tgt IS NOT NULL
+        MATCH (target) WHERE target.id = r.tgt AND target.folder_id = $folder_id
+        MERGE (pr)-[:CONNECTS_TO]->(target)
+    }
+    CALL {
+        WITH r, pr
+        WITH r, pr WHERE r.part IS NOT NULL
+        MATCH (participant:Participant {id: r.part, folder_id: $folder_id})
+        MERGE (pr)-[:IMPLEMENTS]->(participant)
+    }
+    CALL {
+        WITH r, pr
+        WITH r, pr WHERE r.proc_wide
+        MATCH (process:Process {folder_id: $folder_id})
+        MERGE (process)-[:USES_PROTOCOL]->(pr)
+    }
+"""
+
+_Q_FOLDER_CONTAINS = """
+    MATCH (f:Folder {id: $folder_id})
+    MATCH (n:Process|Participant|SubProcess|Protocol {folder_id: $folder_id})
+    MERGE (f)-[:CONTAINS]->(n)
+"""
+
+_Q_INTERACTS_WITH = """
+    MATCH (p:Process {id: $main_process_id, folder_id: $folder_id})
+    UNWIND $participant_ids AS paid
+    MATCH (participant:Participant {id: paid, folder_id: $folder_id})
+    MERGE (p)-[:INTERACTS_WITH]->(participant)
+"""
+
+_Q_INVOKES = """
+    UNWIND $rows AS r
+    MATCH (p:Process {id: r.pid, folder_id: $folder_id})
+    MATCH (sp:SubProcess {id: r.sid, folder_id: $folder_id})
+    MERGE (p)-[:INVOKES]->(sp)
+"""
+
+_Q_RECEIVES_FROM = """
+    MATCH (c:Component {folder_id: $folder_id})-[r:CONNECTS_TO]->(p:Participant {folder_id: $folder_id})
+    MERGE (p)-[:RECEIVES_FROM]->(c)
+"""
+
+_Q_INITIATES = """
+    UNWIND $rows AS r
+    MATCH (p:Process {id: r.pid, folder_id: $folder_id})
+    MATCH (start:Component {id: r.cid, folder_id: $folder_id})
+    MERGE (p)-[:INITIATES]->(start)
+"""
+
+_Q_COMPLETES = """
+    UNWIND $rows AS r
+    MATCH (end:Component {id: r.cid, folder_id: $folder_id})
+    MATCH (p:Process {id: r.pid, folder_id: $folder_id})
+    MERGE (end)-[:COMPLETES]->(p)
+"""
+
+_Q_COMPONENT_USES_PROTOCOL = """
+    UNWIND $pairs AS pair
+    MATCH (c:Component {id: pair.cid, folder_id: $folder_id})
+    MATCH (protocol:Protocol {id: pair.pid, folder_id: $folder_id})
+    MERGE (c)-[:USES_PROTOCOL]->(protocol)
+"""
+
+_Q_PARTICIPANT_IMPLEMENTS = """
+    UNWIND $pairs AS pair
+    MATCH (participant:Participant {id: pair.paid, folder_id: $folder_id})
+    MATCH (protocol:Protocol {id: pair.pid, folder_id: $folder_id})
+    MERGE (participant)-[:IMPLEMENTS]->(protocol)
+"""
+
+@lru_cache(maxsize=None)
+def _node_merge_query(label: str) -> str:
+    """UNWIND-MERGE statement text for one node label, built once per label."""
+    return f"UNWIND $rows AS row MERGE (n:{label} {{id: row.id}}) SET n += row.props"
+
+@lru_cache(maxsize=None)
+def _flow_merge_query(rel_type: str, src_label: str, tgt_label: str) -> str:
+    """UNWIND-MERGE statement text for one flow type and endpoint label pair."""
+    source = f"(source:{src_label})" if src_label else "(source)"
+    target = f"(target:{tgt_label})" if tgt_label else "(target)"
+    return f"""
+        UNWIND $flows AS f
+        MATCH {source} WHERE source.id = f.src AND source.folder_id = $folder_id
+        MATCH {target} WHERE target.id = f.tgt AND target.folder_id = $folder_id
+        MERGE (source)-[:{rel_type} {{name: f.name, flow_id: f.id}}]->(target)
+    """
+
 class CompleteIFlowKnowledgeGraph:
     """
     Creates Knowledge Graphs for ALL SAP Integration Flow folders.
@@ -33,101 +178,291 @@ class CompleteIFlowKnowledgeGraph:
         self.uri = os.getenv('NEO4J_URI', 'neo4j://127.0.0.1:7687')
         self.user = os.getenv('NEO4J_USER', 'neo4j')
         self.password = os.getenv('NEO4J_PASSWORD', 'password')
-        
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+        self.database = os.getenv('NEO4J_DATABASE', 'neo4j')
+
+        # A pool large enough that concurrent folder workers each get their
+        # own Bolt connection instead of queueing on the default pool; the
+        # acquisition timeout keeps a saturated pool failing loudly instead
+        # of hanging workers indefinitely
+        self.driver = GraphDatabase.driver(
+            self.uri, auth=(self.user, self.password),
+            max_connection_pool_size=int(os.getenv('NEO4J_POOL_SIZE', '32')),
+            connection_acquisition_timeout=120,
+            fetch_size=1000)
         self.base_directory = base_directory
-        
-        # Store processed folders
+
+        # Store processed folders; appended from worker threads, so guarded
         self.processed_folders = []
         self.failed_folders = []
+        self._folders_lock = threading.Lock()
+
+        # .iflw paths discovered while scanning, so per-folder processing
+        # never repeats the directory walk
+        self._iflow_path_cache: Dict[str, str] = {}
+
+        # folder name -> sanitised Folder node id, so ingest, export and
+        # statistics reuse one string instead of re-sanitising per call
+        self._folder_id_cache: Dict[str, str] = {}
         
     def close(self):
         """Close the Neo4j driver connection."""
         if self.driver:
             self.driver.close()
+
+    def _session(self, **kwargs):
+        """Open a session pinned to the configured database.
+
+        Naming the database explicitly skips the home-database resolution
+        the driver otherwise performs for every new session. Callers that
+        drain their whole result can pass fetch_size=-1 to stream it in a
+        single batch instead of 1000-record pages.
+        """
+        return self.driver.session(database=self.database, **kwargs)
     
+    # Every label the pipeline writes - used for index creation before ingest
+    NODE_LABELS = ('Folder', 'Process', 'Participant', 'Component', 'SubProcess', 'Protocol')
+
+    # Qualified tag names precomputed once so the iterparse loop dispatches
+    # on plain string comparisons
+    PROCESS_TAG = _bpmn2('process')
+    PARTICIPANT_TAG = _bpmn2('participant')
+    SUBPROCESS_TAG = _bpmn2('subProcess')
+    SEQUENCE_FLOW_TAG = _bpmn2('sequenceFlow')
+    MESSAGE_FLOW_TAG = _bpmn2('messageFlow')
+    COMPONENT_TAGS = {
+        _bpmn2('startEvent'): 'startEvent',
+        _bpmn2('endEvent'): 'endEvent',
+        _bpmn2('serviceTask'): 'serviceTask',
+        _bpmn2('callActivity'): 'callActivity',
+        _bpmn2('parallelGateway'): 'parallelGateway',
+        _bpmn2('exclusiveGateway'): 'exclusiveGateway',
+    }
+    # Component kinds that may also carry adapter/protocol details
+    PROTOCOL_COMPONENT_TAGS = frozenset((
+        _bpmn2('startEvent'), _bpmn2('endEvent'),
+        _bpmn2('serviceTask'), _bpmn2('callActivity'),
+    ))
+
+    def ensure_indexes(self):
+        """Create id constraints and indexes so edge MATCHes are index-backed.
+
+        Without these the unlabeled endpoint lookups in relationship creation
+        degrade to an AllNodesScan per edge, which grows with the total graph
+        size as more folders are ingested.
+
+        These must stay identical to kg_iflow's schema objects: the two
+        modules target the same database, and Neo4j refuses to create a
+        uniqueness constraint while an equivalent plain index exists.
+        """
+        with self._session() as session:
+            # Folder ids are globally unique; the constraint doubles as the
+            # Folder id index
+            session.run("CREATE CONSTRAINT folder_id_unique IF NOT EXISTS "
+                        "FOR (n:Folder) REQUIRE n.id IS UNIQUE")
+            for label in self.NODE_LABELS:
+                if label == 'Folder':
+                    continue
+                # Node ids carry the folder prefix, so they are unique
+                # across folders; the constraint doubles as the id index
+                session.run(f"CREATE CONSTRAINT {label.lower()}_id_unique IF NOT EXISTS "
+                            f"FOR (n:{label}) REQUIRE n.id IS UNIQUE")
+                # folder_id leads so folder-wide matches use the index
+                # prefix and id + folder_id predicates resolve in one seek
+                session.run(f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.folder_id, n.id)")
+        logger.info("Ensured constraints and indexes for all node labels")
+
     def clear_database(self):
         """Clear existing iFlow data from the database."""
-        with self.driver.session() as session:
+        with self._session() as session:
             session.run("MATCH (n) DETACH DELETE n")
             logger.info("Cleared existing iFlow data from database")
     
     def get_current_counts(self) -> Dict[str, int]:
         """Get current node and relationship counts from the database."""
-        with self.driver.session() as session:
+        with self._session() as session:
             node_count = session.run("MATCH (n) RETURN count(n) as count").single()['count']
             rel_count = session.run("MATCH ()-[r]->() RETURN count(r) as count").single()['count']
             return {'nodes': node_count, 'relationships': rel_count}
     
+    # Fixed subpath holding the .iflw file inside every iFlow project
+    IFLOW_SUBDIR = os.path.join("src", "main", "resources", "scenarioflows", "integrationflow")
+
+    @classmethod
+    def _find_iflw_in(cls, folder_path: str) -> str:
+        """Return the first .iflw path under the folder's fixed subpath, or None.
+
+        Only the leaf filename is a wildcard, so one scandir of the known
+        directory replaces a glob walk of the whole 5-level pattern.
+        """
+        # IFLOW_SUBDIR is already pre-joined, so a plain separator concat
+        # avoids os.path.join's per-candidate argument processing
+        leaf = f"{folder_path}{os.sep}{cls.IFLOW_SUBDIR}"
+        try:
+            with os.scandir(leaf) as entries:
+                return next((entry.path for entry in entries if entry.name.endswith('.iflw')), None)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     def find_iflow_folders(self) -> List[str]:
         """
         Find all iFlow folders in the base directory.
         Returns a list of folder paths that contain iFlow files.
         """
-        logger.info(f"Scanning for iFlow folders in: {self.base_directory}")
-        
+        logger.info("Scanning for iFlow folders in: %s", self.base_directory)
+
         iflow_folders = []
-        
-        # Look for folders that contain the typical iFlow structure
-        for item in os.listdir(self.base_directory):
-            item_path = os.path.join(self.base_directory, item)
-            
-            # Skip if not a directory
-            if not os.path.isdir(item_path):
-                continue
-                
-            # Skip special directories
-            if item.startswith('.') or item in ['__pycache__', 'Extracted', 'extracted_confirm_product']:
-                continue
-            
-            # Check if this folder contains an iFlow file
-            iflow_pattern = os.path.join(item_path, "src", "main", "resources", "scenarioflows", "integrationflow", "*.iflw")
-            iflow_files = glob.glob(iflow_pattern)
-            
-            if iflow_files:
-                iflow_folders.append(item_path)
-                logger.info(f"Found iFlow folder: {item}")
-        
-        logger.info(f"Found {len(iflow_folders)} iFlow folders to process")
+
+        # Look for folders that contain the typical iFlow structure;
+        # scandir's DirEntry carries cached stat info so is_dir() costs no
+        # extra syscall per entry
+        with os.scandir(self.base_directory) as entries:
+            for entry in entries:
+                # Skip if not a directory
+                if not entry.is_dir():
+                    continue
+
+                # Skip special directories
+                if entry.name.startswith('.') or entry.name in ['__pycache__', 'Extracted', 'extracted_confirm_product']:
+                    continue
+
+                # Check if this folder contains an iFlow file
+                iflow_file = self._find_iflw_in(entry.path)
+
+                if iflow_file:
+                    # Remember the hit so get_iflow_file_path never re-walks
+                    self._iflow_path_cache[entry.path] = iflow_file
+                    iflow_folders.append(entry.path)
+                    logger.info("Found iFlow folder: %s", entry.name)
+
+        logger.info("Found %s iFlow folders to process", len(iflow_folders))
         return iflow_folders
-    
+
     def get_iflow_file_path(self, folder_path: str) -> str:
         """
         Get the iFlow file path for a given folder.
-        Returns the path to the .iflw file in the folder.
+        Returns the path to the .iflw file in the folder, using the path
+        cached during find_iflow_folders when available.
         """
-        iflow_pattern = os.path.join(folder_path, "src", "main", "resources", "scenarioflows", "integrationflow", "*.iflw")
-        iflow_files = glob.glob(iflow_pattern)
-        
-        if iflow_files:
-            return iflow_files[0]  # Return the first .iflw file found
+        cached = self._iflow_path_cache.get(folder_path)
+        if cached:
+            return cached
+
+        iflow_file = self._find_iflw_in(folder_path)
+        if iflow_file:
+            self._iflow_path_cache[folder_path] = iflow_file
+            return iflow_file  # Return the first .iflw file found
         else:
             raise FileNotFoundError(f"No .iflw file found in {folder_path}")
     
     def get_folder_name(self, folder_path: str) -> str:
         """Extract a clean folder name from the folder path."""
         return os.path.basename(folder_path)
-    
+
+    def _folder_id(self, folder_name: str) -> str:
+        """Sanitise a folder name into its Folder node id, caching the result."""
+        folder_id = self._folder_id_cache.get(folder_name)
+        if folder_id is None:
+            folder_id = f"Folder_{_FOLDER_ID_RE.sub('_', folder_name)}"
+            self._folder_id_cache[folder_name] = folder_id
+        return folder_id
+
+    def _handle_process(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:process element."""
+        data['processes'].append({
+            'id': elem.get('id'),
+            'name': self._get_node_name(elem.get('name'), elem.get('id'), 'Process'),
+            'type': 'Process'
+        })
+
+    def _handle_participant(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:participant element plus any protocol details."""
+        # Skip participants that are actually processes (have processRef)
+        if not elem.get('processRef'):
+            data['participants'].append({
+                'id': elem.get('id'),
+                'name': self._get_node_name(elem.get('name'), elem.get('id'), 'Participant'),
+                'type': 'Participant'
+            })
+        protocol_data = self._extract_protocol_from_participant(elem)
+        if protocol_data:
+            data['protocols'].append(protocol_data)
+
+    @classmethod
+    def _containing_process_id(cls, elem) -> str:
+        """Id of the nearest enclosing bpmn2:process element, or None."""
+        parent = elem.getparent()
+        while parent is not None and parent.tag != cls.PROCESS_TAG:
+            parent = parent.getparent()
+        return parent.get('id') if parent is not None else None
+
+    def _handle_component(self, elem, data: Dict[str, Any]) -> None:
+        """Collect an event/task/gateway element plus any protocol details."""
+        # Extract activityType from extension elements
+        activity_type = self._extract_activity_type(elem)
+        comp_type = self.COMPONENT_TAGS[elem.tag]
+        data['components'].append({
+            'id': elem.get('id'),
+            'name': self._get_node_name(elem.get('name'), elem.get('id'), activity_type or self._normalize_component_type(comp_type)),
+            'type': activity_type or self._normalize_component_type(comp_type),
+            'process_id': self._containing_process_id(elem)
+        })
+        if elem.tag in self.PROTOCOL_COMPONENT_TAGS:
+            protocol_data = self._extract_protocol_from_component(elem)
+            if protocol_data:
+                data['protocols'].append(protocol_data)
+
+    def _handle_subprocess(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:subProcess element."""
+        data['subprocesses'].append({
+            'id': elem.get('id'),
+            'name': self._get_node_name(elem.get('name'), elem.get('id'), 'SubProcess'),
+            'type': 'SubProcess',
+            'process_id': self._containing_process_id(elem)
+        })
+
+    def _handle_sequence_flow(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:sequenceFlow element."""
+        data['sequence_flows'].append({
+            'id': elem.get('id'),
+            'name': elem.get('name', ''),
+            'source': elem.get('sourceRef'),
+            'target': elem.get('targetRef'),
+            'type': 'SequenceFlow'
+        })
+
+    def _handle_message_flow(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:messageFlow element plus any protocol details."""
+        data['message_flows'].append({
+            'id': elem.get('id'),
+            'name': elem.get('name', ''),
+            'source': elem.get('sourceRef'),
+            'target': elem.get('targetRef'),
+            'type': 'MessageFlow'
+        })
+        protocol_data = self._extract_protocol_from_flow(elem)
+        if protocol_data:
+            data['protocols'].append(protocol_data)
+
+    # O(1) dispatch table for the iterparse loop; component tags all share
+    # one handler that looks up the concrete type from COMPONENT_TAGS
+    TAG_HANDLERS = {
+        PROCESS_TAG: _handle_process,
+        PARTICIPANT_TAG: _handle_participant,
+        SUBPROCESS_TAG: _handle_subprocess,
+        SEQUENCE_FLOW_TAG: _handle_sequence_flow,
+        MESSAGE_FLOW_TAG: _handle_message_flow,
+    }
+    for _component_tag in COMPONENT_TAGS:
+        TAG_HANDLERS[_component_tag] = _handle_component
+    del _component_tag
+
     def parse_iflow_xml(self, iflow_file: str) -> Dict[str, Any]:
         """
         Parse the iFlow XML file and extract all components and relationships.
         Returns a structured dictionary with all iFlow elements including protocol components.
         """
-        logger.info(f"Parsing iFlow XML file: {iflow_file}")
-        
-        try:
-            tree = ET.parse(iflow_file)
-            root = tree.getroot()
-        except FileNotFoundError:
-            logger.error(f"iFlow file not found: {iflow_file}")
-            return self._create_fallback_structure()
-        
-        # Define namespaces
-        namespaces = {
-            'bpmn2': 'http://www.omg.org/spec/BPMN/20100524/MODEL',
-            'ifl': 'http:///com.sap.ifl.model/Ifl.xsd'
-        }
-        
+        logger.info("Parsing iFlow XML file: %s", iflow_file)
+
         data = {
             'processes': [],
             'participants': [],
@@ -137,158 +472,109 @@ class CompleteIFlowKnowledgeGraph:
             'subprocesses': [],
             'protocols': []  # New: Protocol-specific components
         }
-        
-        # Extract processes
-        for process in root.findall('.//bpmn2:process', namespaces):
-            process_data = {
-                'id': process.get('id'),
-                'name': self._get_node_name(process.get('name'), process.get('id'), 'Process'),
-                'type': 'Process'
-            }
-            data['processes'].append(process_data)
-        
-        # Extract participants (exclude those that are actually processes with processRef)
-        for participant in root.findall('.//bpmn2:participant', namespaces):
-            # Skip participants that are actually processes (have processRef)
-            if participant.get('processRef'):
-                continue
-                
-            participant_data = {
-                'id': participant.get('id'),
-                'name': self._get_node_name(participant.get('name'), participant.get('id'), 'Participant'),
-                'type': 'Participant'
-            }
-            data['participants'].append(participant_data)
-        
-        # Extract all components (start events, end events, service tasks, call activities, gateways)
-        component_types = ['startEvent', 'endEvent', 'serviceTask', 'callActivity', 'parallelGateway', 'exclusiveGateway']
-        
-        for comp_type in component_types:
-            for component in root.findall(f'.//bpmn2:{comp_type}', namespaces):
-                # Extract activityType from extension elements
-                activity_type = self._extract_activity_type(component, namespaces)
-                
-                component_data = {
-                    'id': component.get('id'),
-                    'name': self._get_node_name(component.get('name'), component.get('id'), activity_type or self._normalize_component_type(comp_type)),
-                    'type': activity_type or self._normalize_component_type(comp_type)
-                }
-                data['components'].append(component_data)
-        
-        # Extract subprocesses
-        for subprocess in root.findall('.//bpmn2:subProcess', namespaces):
-            subprocess_data = {
-                'id': subprocess.get('id'),
-                'name': self._get_node_name(subprocess.get('name'), subprocess.get('id'), 'SubProcess'),
-                'type': 'SubProcess'
-            }
-            data['subprocesses'].append(subprocess_data)
-        
-        # Extract sequence flows
-        for flow in root.findall('.//bpmn2:sequenceFlow', namespaces):
-            flow_data = {
-                'id': flow.get('id'),
-                'name': flow.get('name', ''),
-                'source': flow.get('sourceRef'),
-                'target': flow.get('targetRef'),
-                'type': 'SequenceFlow'
-            }
-            data['sequence_flows'].append(flow_data)
-        
-        # Extract message flows
-        for flow in root.findall('.//bpmn2:messageFlow', namespaces):
-            flow_data = {
-                'id': flow.get('id'),
-                'name': flow.get('name', ''),
-                'source': flow.get('sourceRef'),
-                'target': flow.get('targetRef'),
-                'type': 'MessageFlow'
-            }
-            data['message_flows'].append(flow_data)
-        
-        # Extract protocol-specific components from message flows and participants
-        self._extract_protocol_components(root, namespaces, data)
-        
-        logger.info(f"Parsed {len(data['processes'])} processes, {len(data['participants'])} participants, "
-                   f"{len(data['components'])} components, {len(data['subprocesses'])} subprocesses, "
-                   f"{len(data['sequence_flows'])} sequence flows, {len(data['message_flows'])} message flows, "
-                   f"{len(data['protocols'])} protocol components")
+
+        handlers = self.TAG_HANDLERS
+
+        try:
+            # One streaming pass over 'end' events replaces the per-element-type
+            # findall traversals; each tag dispatches straight to its handler,
+            # which pulls protocol details while the subtree is still in memory
+            # huge_tree lifts libxml2's depth/size safety limits, which very
+            # large exported iFlows can otherwise trip mid-parse; the tag
+            # filter keeps uninteresting elements inside libxml2 entirely,
+            # so the Python loop only runs once per handled element
+            for _event, elem in ET.iterparse(iflow_file, events=('end',),
+                                             tag=tuple(handlers),
+                                             huge_tree=True):
+                handlers[elem.tag](self, elem, data)
+
+                # Handled subtree is no longer needed - drop it and any
+                # already-processed siblings to keep memory constant
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        except OSError:
+            logger.error("iFlow file not found: %s", iflow_file)
+            return self._create_fallback_structure()
+
+        # Deduplicate protocols by id - an element reached through more than
+        # one extraction path must not become duplicate Protocol nodes
+        if data['protocols']:
+            data['protocols'] = list({p['id']: p for p in data['protocols']}.values())
+
+        logger.info("Parsed %s processes, %s participants, %s components, "
+                   "%s subprocesses, %s sequence flows, %s message flows, "
+                   "%s protocol components",
+                   len(data['processes']), len(data['participants']),
+                   len(data['components']), len(data['subprocesses']),
+                   len(data['sequence_flows']), len(data['message_flows']),
+                   len(data['protocols']))
         
         return data
     
-    def _get_node_name(self, name: str, node_id: str, node_type: str, system: str = None, adapter_name: str = None) -> str:
+    @staticmethod
+    def _get_node_name(name: str, node_id: str, node_type: str, system: str = None, adapter_name: str = None) -> str:
         """
         Get a proper node name with fallback logic.
         If name is empty or None, fallback to system, adapter_name, id, or type properties.
+        Runs for every parsed element, so each candidate is stripped exactly once.
         """
-        if name and name.strip():
-            return name.strip()
-        
+        stripped = name.strip() if name else ''
+        if stripped:
+            return stripped
+
         # For protocols, try system property first
-        if system and system.strip():
-            return system.strip()
-        
+        stripped = system.strip() if system else ''
+        if stripped:
+            return stripped
+
         # Try adapter_name for protocols
-        if adapter_name and adapter_name.strip():
-            return adapter_name.strip()
-        
+        stripped = adapter_name.strip() if adapter_name else ''
+        if stripped:
+            return stripped
+
         # Fallback to node_id if available
-        if node_id and node_id.strip():
-            return node_id.strip()
-        
+        stripped = node_id.strip() if node_id else ''
+        if stripped:
+            return stripped
+
         # Fallback to node_type
         if node_type and node_type.strip():
             return f"{node_type}_{node_id}" if node_id else node_type
-        
+
         # Last resort
         return "Unknown_Node"
     
-    def _extract_activity_type(self, component, namespaces: Dict[str, str]) -> str:
-        """Extract activityType from component extension elements."""
-        extension_elements = component.find('.//bpmn2:extensionElements', namespaces)
-        if extension_elements is not None:
-            for property_elem in extension_elements.findall('.//ifl:property', namespaces):
-                key_elem = property_elem.find('key')
-                value_elem = property_elem.find('value')
-                
-                if key_elem is not None and value_elem is not None:
-                    if key_elem.text == 'activityType':
-                        return value_elem.text
-        return None
-    
-    def _extract_protocol_components(self, root, namespaces: Dict[str, str], data: Dict[str, Any]) -> None:
-        """
-        Extract protocol-specific components from message flows and participants.
-        This captures ALL SAP Integration Suite adapter types: IDOC, SOAP, HTTP, HCIOData, AMQP, ProcessDirect, Mail, etc.
+    @staticmethod
+    def _property_key_value(property_elem) -> Tuple[Any, Any]:
+        """Return the <key> and <value> child elements of an ifl:property.
+
+        The pair are the property's only children, so direct iteration
+        replaces two ElementPath find() evaluations per property.
         """
-        # Extract protocol information from message flows
-        for flow in root.findall('.//bpmn2:messageFlow', namespaces):
-            protocol_data = self._extract_protocol_from_flow(flow, namespaces)
-            if protocol_data:
-                data['protocols'].append(protocol_data)
-        
-        # Extract protocol information from participants
-        for participant in root.findall('.//bpmn2:participant', namespaces):
-            protocol_data = self._extract_protocol_from_participant(participant, namespaces)
-            if protocol_data:
-                data['protocols'].append(protocol_data)
-        
-        # Extract protocol information from all components (broader coverage)
-        for component in root.findall('.//bpmn2:*', namespaces):
-            if component.tag.endswith('}startEvent') or component.tag.endswith('}endEvent') or \
-               component.tag.endswith('}serviceTask') or component.tag.endswith('}callActivity'):
-                protocol_data = self._extract_protocol_from_component(component, namespaces)
-                if protocol_data:
-                    data['protocols'].append(protocol_data)
+        key_elem = value_elem = None
+        for child in property_elem:
+            if child.tag == 'key':
+                key_elem = child
+            elif child.tag == 'value':
+                value_elem = child
+        return key_elem, value_elem
+
+    def _extract_activity_type(self, component) -> str:
+        """Extract activityType from component extension elements."""
+        result = _XP_ACTIVITY_TYPE(component)
+        return str(result[0]) if result else None
     
-    def _extract_protocol_from_flow(self, flow, namespaces: Dict[str, str]) -> Dict[str, Any]:
+    def _extract_protocol_from_flow(self, flow) -> Dict[str, Any]:
         """Extract protocol information from a message flow element."""
         protocol_data = None
         
         # Look for extension elements with protocol information
-        extension_elements = flow.find('.//bpmn2:extensionElements', namespaces)
-        if extension_elements is not None:
-            protocol_data = self._parse_extension_elements(extension_elements, namespaces)
+        extension_elements = _XP_EXTENSION_ELEMENTS(flow)
+        if extension_elements:
+            protocol_data = self._parse_extension_elements(extension_elements[0])
             if protocol_data:
                 protocol_data.update({
                     'id': f"Protocol_{flow.get('id')}",
@@ -306,14 +592,14 @@ class CompleteIFlowKnowledgeGraph:
         
         return protocol_data
     
-    def _extract_protocol_from_participant(self, participant, namespaces: Dict[str, str]) -> Dict[str, Any]:
+    def _extract_protocol_from_participant(self, participant) -> Dict[str, Any]:
         """Extract protocol information from a participant element."""
         protocol_data = None
         
         # Look for extension elements with protocol information
-        extension_elements = participant.find('.//bpmn2:extensionElements', namespaces)
-        if extension_elements is not None:
-            protocol_data = self._parse_extension_elements(extension_elements, namespaces)
+        extension_elements = _XP_EXTENSION_ELEMENTS(participant)
+        if extension_elements:
+            protocol_data = self._parse_extension_elements(extension_elements[0])
             if protocol_data:
                 protocol_data.update({
                     'id': f"Protocol_{participant.get('id')}",
@@ -330,14 +616,14 @@ class CompleteIFlowKnowledgeGraph:
         
         return protocol_data
     
-    def _extract_protocol_from_component(self, component, namespaces: Dict[str, str]) -> Dict[str, Any]:
+    def _extract_protocol_from_component(self, component) -> Dict[str, Any]:
         """Extract protocol information from a component element."""
         protocol_data = None
         
         # Look for extension elements with protocol information
-        extension_elements = component.find('.//bpmn2:extensionElements', namespaces)
-        if extension_elements is not None:
-            protocol_data = self._parse_extension_elements(extension_elements, namespaces)
+        extension_elements = _XP_EXTENSION_ELEMENTS(component)
+        if extension_elements:
+            protocol_data = self._parse_extension_elements(extension_elements[0])
             if protocol_data:
                 protocol_data.update({
                     'id': f"Protocol_{component.get('id')}",
@@ -354,66 +640,49 @@ class CompleteIFlowKnowledgeGraph:
         
         return protocol_data
     
-    def _parse_extension_elements(self, extension_elements, namespaces: Dict[str, str]) -> Dict[str, Any]:
+    # Capture ALL SAP Integration Suite protocol-specific properties:
+    # ifl:property key -> protocol_info attribute
+    _PROTOCOL_KEY_MAP = {
+        'ComponentType': 'component_type',
+        'TransportProtocol': 'transport_protocol',
+        'MessageProtocol': 'message_protocol',
+        'ComponentNS': 'component_namespace',
+        'direction': 'direction',
+        'address': 'address',
+        'Name': 'adapter_name',
+        'system': 'system',
+        'ifl:type': 'ifl_type',
+        'activityType': 'activity_type',
+        # Additional protocol properties for comprehensive coverage
+        'credentialName': 'credential_name',
+        'authentication': 'authentication',
+        'proxyType': 'proxy_type',
+        'timeout': 'timeout',
+        'server': 'server',
+        'port': 'port',
+    }
+
+    def _parse_extension_elements(self, extension_elements) -> Dict[str, Any]:
         """Parse extension elements to extract protocol information."""
         protocol_info = {}
-        
-        # Extract properties from extension elements
-        for property_elem in extension_elements.findall('.//ifl:property', namespaces):
-            key_elem = property_elem.find('key')
-            value_elem = property_elem.find('value')
-            
+        key_map = self._PROTOCOL_KEY_MAP
+
+        # Extract properties from extension elements; one hash lookup per
+        # property instead of a 16-way string-compare ladder
+        for property_elem in _XP_IFL_PROPERTY(extension_elements):
+            key_elem, value_elem = self._property_key_value(property_elem)
+
             if key_elem is not None and value_elem is not None:
-                key = key_elem.text
-                value = value_elem.text
-                
-                # Capture ALL SAP Integration Suite protocol-specific properties
-                if key == 'ComponentType':
-                    protocol_info['component_type'] = value
-                elif key == 'TransportProtocol':
-                    protocol_info['transport_protocol'] = value
-                elif key == 'MessageProtocol':
-                    protocol_info['message_protocol'] = value
-                elif key == 'ComponentNS':
-                    protocol_info['component_namespace'] = value
-                elif key == 'direction':
-                    protocol_info['direction'] = value
-                elif key == 'address':
-                    protocol_info['address'] = value
-                elif key == 'Name':
-                    protocol_info['adapter_name'] = value
-                elif key == 'system':
-                    protocol_info['system'] = value
-                elif key == 'ifl:type':
-                    protocol_info['ifl_type'] = value
-                elif key == 'activityType':
-                    protocol_info['activity_type'] = value
-                # Additional protocol properties for comprehensive coverage
-                elif key == 'credentialName':
-                    protocol_info['credential_name'] = value
-                elif key == 'authentication':
-                    protocol_info['authentication'] = value
-                elif key == 'proxyType':
-                    protocol_info['proxy_type'] = value
-                elif key == 'timeout':
-                    protocol_info['timeout'] = value
-                elif key == 'server':
-                    protocol_info['server'] = value
-                elif key == 'port':
-                    protocol_info['port'] = value
-        
+                attr = key_map.get(key_elem.text)
+                if attr:
+                    protocol_info[attr] = value_elem.text
+
         # Only return protocol data if we found meaningful protocol information
         # Support all SAP Integration Suite adapter types
-        sap_protocol_types = [
-            'IDOC', 'SOAP', 'HTTP', 'HCIOData', 'AMQP', 'ProcessDirect', 'Mail', 
-            'JDBC', 'SFTP', 'FTP', 'SuccessFactors', 'OData', 'REST', 'XI', 
-            'EDI', 'RFC', 'JMS', 'Kafka', 'MQTT', 'WebSocket', 'TCP', 'UDP'
-        ]
-        
-        if any(key in protocol_info for key in ['component_type', 'transport_protocol', 'message_protocol']) or \
-           (protocol_info.get('component_type') in sap_protocol_types):
+        if any(key in protocol_info for key in ('component_type', 'transport_protocol', 'message_protocol')) or \
+           (protocol_info.get('component_type') in _SAP_PROTOCOL_TYPES):
             return protocol_info
-        
+
         return None
     
     def _normalize_component_type(self, comp_type: str) -> str:
@@ -456,432 +725,411 @@ class CompleteIFlowKnowledgeGraph:
             ]
         }
     
-    def create_nodes_for_folder(self, folder_name: str, data: Dict[str, Any]) -> None:
+    # Optional Protocol properties written for every protocol node
+    PROTOCOL_PROPS = (
+        'component_type', 'transport_protocol', 'message_protocol',
+        'component_namespace', 'direction', 'address', 'adapter_name',
+        'system', 'ifl_type', 'activity_type', 'credential_name',
+        'authentication', 'proxy_type', 'timeout', 'server', 'port'
+    )
+
+    @staticmethod
+    def _create_nodes_batch(tx, label: str, rows: List[Dict[str, Any]]) -> None:
+        """MERGE a list of {id, props} rows as a single UNWIND statement.
+
+        MERGE keeps node creation idempotent, so re-ingesting a folder
+        updates its nodes in place instead of duplicating them.
+        """
+        if not rows:
+            # An empty UNWIND still costs a full round-trip and plan
+            logger.debug("No %s rows to create, skipping batch", label)
+            return
+        tx.run(_node_merge_query(label), rows=rows)
+
+    def create_nodes_for_folder(self, tx, folder_name: str, data: Dict[str, Any]) -> None:
         """
         Create all nodes in the Knowledge Graph for a specific folder.
         This function creates processes, participants, components, and subprocesses as nodes.
+        Each label is written as one batched UNWIND MERGE inside the caller's
+        transaction - one commit per folder instead of one per node.
         """
-        logger.info(f"Creating nodes for folder: {folder_name}")
-        
-        with self.driver.session() as session:
-            # Create folder node as semantic layer for this specific folder
-            folder_id = f"Folder_{folder_name.replace(' ', '_').replace('.', '_')}"
-            session.run("""
-                CREATE (f:Folder {
-                    id: $folder_id,
-                    name: $folder_name,
-                    type: 'Folder',
-                    description: 'SAP Integration Flow Knowledge Graph - Semantic Layer'
-                })
-            """, folder_id=folder_id, folder_name=folder_name)
-            logger.debug(f"Created folder node: {folder_name}")
-            
-            # Create processes with folder-specific IDs
-            for process in data['processes']:
-                process_id = f"{folder_id}_{process['id']}"
-                session.run("""
-                    CREATE (p:Process {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id
-                    })
-                """, id=process_id, name=process['name'], type=process['type'], folder_id=folder_id)
-                logger.debug(f"Created process: {process['name']}")
-            
-            # Create participants with folder-specific IDs
-            for participant in data['participants']:
-                participant_id = f"{folder_id}_{participant['id']}"
-                session.run("""
-                    CREATE (p:Participant {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id
-                    })
-                """, id=participant_id, name=participant['name'], type=participant['type'], folder_id=folder_id)
-                logger.debug(f"Created participant: {participant['name']}")
-            
-            # Create components with folder-specific IDs
-            for component in data['components']:
-                component_id = f"{folder_id}_{component['id']}"
-                session.run("""
-                    CREATE (c:Component {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id
-                    })
-                """, id=component_id, name=component['name'], type=component['type'], folder_id=folder_id)
-                logger.debug(f"Created component: {component['name']}")
-            
-            # Create subprocesses with folder-specific IDs
-            for subprocess in data['subprocesses']:
-                subprocess_id = f"{folder_id}_{subprocess['id']}"
-                session.run("""
-                    CREATE (s:SubProcess {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id
-                    })
-                """, id=subprocess_id, name=subprocess['name'], type=subprocess['type'], folder_id=folder_id)
-                logger.debug(f"Created subprocess: {subprocess['name']}")
-            
-            # Create protocol nodes with folder-specific IDs
-            for protocol in data['protocols']:
-                protocol_id = f"{folder_id}_{protocol['id']}"
-                session.run("""
-                    CREATE (p:Protocol {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id,
-                        component_type: $component_type,
-                        transport_protocol: $transport_protocol,
-                        message_protocol: $message_protocol,
-                        component_namespace: $component_namespace,
-                        direction: $direction,
-                        address: $address,
-                        adapter_name: $adapter_name,
-                        system: $system,
-                        ifl_type: $ifl_type,
-                        activity_type: $activity_type,
-                        credential_name: $credential_name,
-                        authentication: $authentication,
-                        proxy_type: $proxy_type,
-                        timeout: $timeout,
-                        server: $server,
-                        port: $port
-                    })
-                """, 
-                id=protocol_id, 
-                name=protocol['name'], 
-                type=protocol['type'], 
-                folder_id=folder_id,
-                component_type=protocol.get('component_type'),
-                transport_protocol=protocol.get('transport_protocol'),
-                message_protocol=protocol.get('message_protocol'),
-                component_namespace=protocol.get('component_namespace'),
-                direction=protocol.get('direction'),
-                address=protocol.get('address'),
-                adapter_name=protocol.get('adapter_name'),
-                system=protocol.get('system'),
-                ifl_type=protocol.get('ifl_type'),
-                activity_type=protocol.get('activity_type'),
-                credential_name=protocol.get('credential_name'),
-                authentication=protocol.get('authentication'),
-                proxy_type=protocol.get('proxy_type'),
-                timeout=protocol.get('timeout'),
-                server=protocol.get('server'),
-                port=protocol.get('port')
-                )
-                logger.debug(f"Created protocol: {protocol['name']} ({protocol.get('component_type', 'Unknown')}) - {protocol.get('activity_type', 'No Activity Type')}")
-            
-            logger.info(f"Created 1 folder, {len(data['processes'])} processes, {len(data['participants'])} participants, "
-                       f"{len(data['components'])} components, {len(data['subprocesses'])} subprocesses, "
-                       f"{len(data['protocols'])} protocols for {folder_name}")
+        logger.info("Creating nodes for folder: %s", folder_name)
+
+        folder_id = self._folder_id(folder_name)
+        # Plain concatenation of a prebuilt prefix beats per-id f-string
+        # formatting in the row-building loops below
+        prefix = folder_id + '_'
+
+        def entity_rows(entities):
+            return [{
+                'id': prefix + e['id'],
+                'props': {'name': e['name'], 'type': e['type'], 'folder_id': folder_id}
+            } for e in entities]
+
+        # Only ship the properties a protocol actually has - most adapters use
+        # a handful of the 16 optional keys, so sending nulls just bloats the
+        # Bolt payload and writes empty property slots
+        protocol_rows = []
+        for protocol in data['protocols']:
+            props = {'name': protocol['name'], 'type': protocol['type'], 'folder_id': folder_id}
+            for key in self.PROTOCOL_PROPS:
+                value = protocol.get(key)
+                if value is not None:
+                    props[key] = value
+            protocol_rows.append({'id': prefix + protocol['id'], 'props': props})
+
+        folder_row = [{
+            'id': folder_id,
+            'props': {
+                'name': folder_name,
+                'type': 'Folder',
+                'description': 'SAP Integration Flow Knowledge Graph - Semantic Layer'
+            }
+        }]
+
+        self._create_nodes_batch(tx, 'Folder', folder_row)
+        self._create_nodes_batch(tx, 'Process', entity_rows(data['processes']))
+        self._create_nodes_batch(tx, 'Participant', entity_rows(data['participants']))
+        self._create_nodes_batch(tx, 'Component', entity_rows(data['components']))
+        self._create_nodes_batch(tx, 'SubProcess', entity_rows(data['subprocesses']))
+        self._create_nodes_batch(tx, 'Protocol', protocol_rows)
+
+        logger.info("Created 1 folder, %s processes, %s participants, "
+                   "%s components, %s subprocesses, %s protocols for %s",
+                   len(data['processes']), len(data['participants']),
+                   len(data['components']), len(data['subprocesses']),
+                   len(data['protocols']), folder_name)
     
-    def create_relationships_for_folder(self, folder_name: str, data: Dict[str, Any]) -> None:
+    @staticmethod
+    def _label_by_id(data: Dict[str, Any]) -> Dict[str, str]:
+        """Map raw BPMN element ids to the label their node was created under."""
+        labels = {}
+        for key, label in (('processes', 'Process'), ('participants', 'Participant'),
+                           ('components', 'Component'), ('subprocesses', 'SubProcess')):
+            for entity in data[key]:
+                labels[entity['id']] = label
+        return labels
+
+    @staticmethod
+    def _flow_rows_by_labels(folder_id: str, flows: List[Dict[str, Any]],
+                             label_by_id: Dict[str, str]) -> Dict[Tuple, List[Dict[str, Any]]]:
+        """Group UNWIND rows by endpoint label pair, skipping edges missing
+        an endpoint. Known labels let the edge MATCH use the per-label id
+        index; endpoints we did not create a node for fall into a (None,
+        None)-style unlabeled group."""
+        prefix = folder_id + '_'
+        groups = {}
+        for flow in flows:
+            if not (flow['source'] and flow['target']):
+                continue
+            key = (label_by_id.get(flow['source']), label_by_id.get(flow['target']))
+            groups.setdefault(key, []).append({
+                'src': prefix + flow['source'],
+                'tgt': prefix + flow['target'],
+                'name': flow['name'],
+                'id': flow['id']
+            })
+        return groups
+
+    @staticmethod
+    def _create_flows_batch(tx, folder_id: str, rel_type: str,
+                            rows: List[Dict[str, Any]],
+                            src_label: str = None, tgt_label: str = None) -> None:
+        """MERGE a list of flow edges as a single UNWIND statement.
+
+        With a label on each endpoint the planner uses a NodeIndexSeek
+        instead of an AllNodesScan per edge.
+        """
+        if not rows:
+            logger.debug("No %s rows to create, skipping batch", rel_type)
+            return
+        tx.run(_flow_merge_query(rel_type, src_label, tgt_label),
+               flows=rows, folder_id=folder_id)
+
+    def create_relationships_for_folder(self, tx, folder_name: str, data: Dict[str, Any]) -> None:
         """
         Create all relationships between nodes for a specific folder.
-        This function creates FLOWS_TO, CONTAINS, and CONNECTS_TO relationships.
+        This function creates FLOWS_TO, CONTAINS, and CONNECTS_TO relationships,
+        all inside the caller's transaction.
         """
-        logger.info(f"Creating relationships for folder: {folder_name}")
-        
-        folder_id = f"Folder_{folder_name.replace(' ', '_').replace('.', '_')}"
-        
-        with self.driver.session() as session:
-            # Create sequence flow relationships with folder-specific IDs
-            for flow in data['sequence_flows']:
-                if flow['source'] and flow['target']:
-                    source_id = f"{folder_id}_{flow['source']}"
-                    target_id = f"{folder_id}_{flow['target']}"
-                    session.run("""
-                        MATCH (source) WHERE source.id = $source AND source.folder_id = $folder_id
-                        MATCH (target) WHERE target.id = $target AND target.folder_id = $folder_id
-                        CREATE (source)-[:FLOWS_TO {name: $name, flow_id: $id}]->(target)
-                    """, source=source_id, target=target_id, 
-                               name=flow['name'], id=flow['id'], folder_id=folder_id)
-                    logger.debug(f"Created sequence flow: {flow['source']} -> {flow['target']}")
-            
-            # Create message flow relationships with folder-specific IDs
-            for flow in data['message_flows']:
-                if flow['source'] and flow['target']:
-                    source_id = f"{folder_id}_{flow['source']}"
-                    target_id = f"{folder_id}_{flow['target']}"
-                    session.run("""
-                        MATCH (source) WHERE source.id = $source AND source.folder_id = $folder_id
-                        MATCH (target) WHERE target.id = $target AND target.folder_id = $folder_id
-                        CREATE (source)-[:CONNECTS_TO {name: $name, flow_id: $id}]->(target)
-                    """, source=source_id, target=target_id, 
-                               name=flow['name'], id=flow['id'], folder_id=folder_id)
-                    logger.debug(f"Created message flow: {flow['source']} -> {flow['target']}")
-            
-            # Create process-component containment relationships
-            self._create_containment_relationships_for_folder(session, folder_id, data)
-            
-            # Create protocol relationships
-            self._create_protocol_relationships_for_folder(session, folder_id, data)
-            
-            # Create folder relationships to connect everything
-            self._create_folder_relationships_for_folder(session, folder_id, data)
-            
-            # Ensure all nodes are connected (no isolated nodes)
-            self._connect_isolated_nodes_for_folder(session, folder_id, data)
-            
-            logger.info(f"Created {len(data['sequence_flows'])} sequence flows, "
-                       f"{len(data['message_flows'])} message flows, {len(data['protocols'])} protocol relationships, "
-                       f"containment relationships, and folder connections for {folder_name}")
+        logger.info("Creating relationships for folder: %s", folder_name)
+
+        folder_id = self._folder_id(folder_name)
+
+        label_by_id = self._label_by_id(data)
+        seq_groups = self._flow_rows_by_labels(folder_id, data['sequence_flows'], label_by_id)
+        msg_groups = self._flow_rows_by_labels(folder_id, data['message_flows'], label_by_id)
+
+        # Create sequence and message flows as one UNWIND per endpoint label
+        # pair - a handful of round-trips instead of one per edge
+        for (src_label, tgt_label), rows in seq_groups.items():
+            self._create_flows_batch(tx, folder_id, 'FLOWS_TO', rows,
+                                     src_label, tgt_label)
+        for (src_label, tgt_label), rows in msg_groups.items():
+            self._create_flows_batch(tx, folder_id, 'CONNECTS_TO', rows,
+                                     src_label, tgt_label)
+
+        # Create process-component containment relationships
+        self._create_containment_relationships_for_folder(tx, folder_id, data)
+
+        # Create protocol relationships
+        self._create_protocol_relationships_for_folder(tx, folder_id, data)
+
+        # Create folder relationships to connect everything
+        self._create_folder_relationships_for_folder(tx, folder_id, data)
+
+        # Ensure all nodes are connected (no isolated nodes)
+        self._connect_isolated_nodes_for_folder(tx, folder_id, data)
+
+        logger.info("Created %s sequence flows, %s message flows, "
+                   "%s protocol relationships, containment relationships, "
+                   "and folder connections for %s",
+                   len(data['sequence_flows']), len(data['message_flows']),
+                   len(data['protocols']), folder_name)
     
-    def _create_containment_relationships_for_folder(self, session, folder_id: str, data: Dict[str, Any]) -> None:
+    def _create_containment_relationships_for_folder(self, tx, folder_id: str, data: Dict[str, Any]) -> None:
         """Create CONTAINS relationships between processes and their components for a specific folder."""
-        
-        # Connect all processes to their components
-        for process in data['processes']:
-            process_id = f"{folder_id}_{process['id']}"
-            session.run("""
-                MATCH (p:Process {id: $process_id, folder_id: $folder_id})
-                MATCH (c:Component {folder_id: $folder_id})
-                CREATE (p)-[:CONTAINS]->(c)
-            """, process_id=process_id, folder_id=folder_id)
+
+        # Connect all processes to their components in one statement - the
+        # UNWIND shares a single Component scan across every process instead
+        # of paying a round-trip and a fresh scan per process
+        prefix = folder_id + '_'
+        process_ids = [prefix + process['id'] for process in data['processes']]
+        if not process_ids:
+            logger.debug("No processes to contain for %s", folder_id)
+            return
+        tx.run(_Q_PROCESS_CONTAINS, process_ids=process_ids, folder_id=folder_id)
     
-    def _create_protocol_relationships_for_folder(self, session, folder_id: str, data: Dict[str, Any]) -> None:
-        """Create relationships for protocol components for a specific folder."""
-        
-        # Connect protocols to their source and target components/participants
-        for protocol in data['protocols']:
-            protocol_id = f"{folder_id}_{protocol['id']}"
-            
-            # Connect protocol to source if available
-            if protocol.get('source'):
-                source_id = f"{folder_id}_{protocol['source']}"
-                session.run("""
-                    MATCH (source) WHERE source.id = $source_id AND source.folder_id = $folder_id
-                    MATCH (protocol:Protocol {id: $protocol_id, folder_id: $folder_id})
-                    CREATE (source)-[:USES_PROTOCOL]->(protocol)
-                """, source_id=source_id, protocol_id=protocol_id, folder_id=folder_id)
-            
-            # Connect protocol to target if available
-            if protocol.get('target'):
-                target_id = f"{folder_id}_{protocol['target']}"
-                session.run("""
-                    MATCH (protocol:Protocol {id: $protocol_id, folder_id: $folder_id})
-                    MATCH (target) WHERE target.id = $target_id AND target.folder_id = $folder_id
-                    CREATE (protocol)-[:CONNECTS_TO]->(target)
-                """, protocol_id=protocol_id, target_id=target_id, folder_id=folder_id)
-            
-            # Connect protocols to participants if they have participant_id
-            if protocol.get('participant_id'):
-                participant_id = f"{folder_id}_{protocol['participant_id']}"
-                session.run("""
-                    MATCH (protocol:Protocol {id: $protocol_id, folder_id: $folder_id})
-                    MATCH (participant:Participant {id: $participant_id, folder_id: $folder_id})
-                    CREATE (protocol)-[:IMPLEMENTS]->(participant)
-                """, protocol_id=protocol_id, participant_id=participant_id, folder_id=folder_id)
-            
-            # Connect protocols to processes based on component type and direction
-            if protocol.get('component_type') and protocol.get('direction'):
-                session.run("""
-                    MATCH (protocol:Protocol {id: $protocol_id, folder_id: $folder_id})
-                    MATCH (process:Process {folder_id: $folder_id})
-                    CREATE (process)-[:USES_PROTOCOL]->(protocol)
-                """, protocol_id=protocol_id, folder_id=folder_id)
-        
-        logger.debug(f"Created protocol relationships for {folder_id}")
+    def _create_protocol_relationships_for_folder(self, tx, folder_id: str, data: Dict[str, Any]) -> None:
+        """Create relationships for protocol components for a specific folder.
+
+        All protocols go out as one UNWIND statement - the old per-protocol
+        loop issued up to four statements each, so a folder with many
+        adapters spent most of its time on round-trips. The optional edges
+        (source, target, participant, process-wide) become conditional CALL
+        subqueries filtering on the null-ness of each row field.
+        """
+        prefix = folder_id + '_'
+        rows = [{
+            'pid': prefix + protocol['id'],
+            'src': prefix + protocol['source'] if protocol.get('source') else None,
+            'tgt': prefix + protocol['target'] if protocol.get('target') else None,
+            'part': prefix + protocol['participant_id'] if protocol.get('participant_id') else None,
+            'proc_wide': bool(protocol.get('component_type') and protocol.get('direction')),
+        } for protocol in data['protocols']]
+        if not rows:
+            logger.debug("No protocols to connect for %s", folder_id)
+            return
+
+        tx.run(_Q_PROTOCOL_EDGES, rows=rows, folder_id=folder_id)
+
+        logger.debug("Created protocol relationships for %s", folder_id)
     
-    def _create_folder_relationships_for_folder(self, session, folder_id: str, data: Dict[str, Any]) -> None:
+    def _create_folder_relationships_for_folder(self, tx, folder_id: str, data: Dict[str, Any]) -> None:
         """Create folder relationships to connect everything to the semantic layer for a specific folder."""
         
-        # Connect folder to all processes
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (p:Process {folder_id: $folder_id})
-            CREATE (f)-[:CONTAINS]->(p)
-        """, folder_id=folder_id)
-        
-        # Connect folder to all participants
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (p:Participant {folder_id: $folder_id})
-            CREATE (f)-[:CONTAINS]->(p)
-        """, folder_id=folder_id)
-        
-        # Connect folder to all subprocesses
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (s:SubProcess {folder_id: $folder_id})
-            CREATE (f)-[:CONTAINS]->(s)
-        """, folder_id=folder_id)
-        
-        # Connect folder to all protocols
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (p:Protocol {folder_id: $folder_id})
-            CREATE (f)-[:CONTAINS]->(p)
-        """, folder_id=folder_id)
-        
-        logger.debug(f"Created folder relationships for {folder_id}")
+        # Nothing to attach - skip the statement rather than run a plan
+        # that matches zero rows
+        if not any(data[key] for key in ('processes', 'participants',
+                                         'subprocesses', 'protocols')):
+            logger.debug("No folder members to connect for %s", folder_id)
+            return
+
+        # Connect folder to all processes, participants, subprocesses and
+        # protocols in one statement - the label disjunction matches the
+        # folder node once instead of once per label
+        tx.run(_Q_FOLDER_CONTAINS, folder_id=folder_id)
+
+        logger.debug("Created folder relationships for %s", folder_id)
     
-    def _connect_isolated_nodes_for_folder(self, session, folder_id: str, data: Dict[str, Any]) -> None:
+    def _connect_isolated_nodes_for_folder(self, tx, folder_id: str, data: Dict[str, Any]) -> None:
         """Ensure all nodes are connected by creating additional relationships for a specific folder."""
-        
-        # Connect all participants to the main integration process
-        session.run("""
-            MATCH (p:Process {folder_id: $folder_id})
-            MATCH (participant:Participant {folder_id: $folder_id})
-            CREATE (p)-[:INTERACTS_WITH]->(participant)
-        """, folder_id=folder_id)
-        
-        # Connect all subprocesses to processes
-        session.run("""
-            MATCH (p:Process {folder_id: $folder_id})
-            MATCH (sp:SubProcess {folder_id: $folder_id})
-            CREATE (p)-[:INVOKES]->(sp)
-        """, folder_id=folder_id)
-        
-        # Connect participants to components that interact with them
-        session.run("""
-            MATCH (c:Component {folder_id: $folder_id})-[r:CONNECTS_TO]->(p:Participant {folder_id: $folder_id})
-            CREATE (p)-[:RECEIVES_FROM]->(c)
-        """, folder_id=folder_id)
-        
-        # Connect start events to their processes
-        session.run("""
-            MATCH (start:Component {type: 'StartEvent', folder_id: $folder_id})
-            MATCH (p:Process {folder_id: $folder_id})
-            CREATE (p)-[:INITIATES]->(start)
-        """, folder_id=folder_id)
-        
-        # Connect end events to their processes
-        session.run("""
-            MATCH (end:Component {type: 'EndEvent', folder_id: $folder_id})
-            MATCH (p:Process {folder_id: $folder_id})
-            CREATE (end)-[:COMPLETES]->(p)
-        """, folder_id=folder_id)
-        
-        # Connect protocols to components that use them
-        session.run("""
-            MATCH (c:Component {folder_id: $folder_id})
-            MATCH (protocol:Protocol {folder_id: $folder_id})
-            WHERE c.id CONTAINS protocol.name OR protocol.name CONTAINS c.name
-            CREATE (c)-[:USES_PROTOCOL]->(protocol)
-        """, folder_id=folder_id)
-        
-        # Connect protocols to participants based on system names
-        session.run("""
-            MATCH (participant:Participant {folder_id: $folder_id})
-            MATCH (protocol:Protocol {folder_id: $folder_id})
-            WHERE participant.name CONTAINS protocol.system OR protocol.system CONTAINS participant.name
-            CREATE (participant)-[:IMPLEMENTS]->(protocol)
-        """, folder_id=folder_id)
-        
-        logger.debug(f"Created additional relationships for {folder_id}")
+        prefix = folder_id + '_'
+
+        # Connect participants to the main integration process only - the
+        # old Process x Participant cross product created |P| x |Q| edges
+        # per folder for no extra meaning
+        if data['processes'] and data['participants']:
+            main_process_id = prefix + data['processes'][0]['id']
+            participant_ids = [prefix + p['id'] for p in data['participants']]
+            tx.run(_Q_INTERACTS_WITH, main_process_id=main_process_id,
+                   participant_ids=participant_ids, folder_id=folder_id)
+
+        # Connect each subprocess to the process that actually contains it
+        # in the BPMN tree, captured during parsing
+        invoke_rows = [{'pid': prefix + sp['process_id'],
+                        'sid': prefix + sp['id']}
+                       for sp in data['subprocesses'] if sp.get('process_id')]
+        if invoke_rows:
+            tx.run(_Q_INVOKES, rows=invoke_rows, folder_id=folder_id)
+
+        # Connect participants to components that interact with them;
+        # CONNECTS_TO edges only exist where the folder had message flows
+        if data['message_flows']:
+            tx.run(_Q_RECEIVES_FROM, folder_id=folder_id)
+
+        # Connect start and end events to their own containing process
+        # rather than every process in the folder
+        start_rows, end_rows = [], []
+        for component in data['components']:
+            if not component.get('process_id'):
+                continue
+            row = {'pid': prefix + component['process_id'],
+                   'cid': prefix + component['id']}
+            if component['type'] == 'StartEvent':
+                start_rows.append(row)
+            elif component['type'] == 'EndEvent':
+                end_rows.append(row)
+        if start_rows:
+            tx.run(_Q_INITIATES, rows=start_rows, folder_id=folder_id)
+        if end_rows:
+            tx.run(_Q_COMPLETES, rows=end_rows, folder_id=folder_id)
+
+        # Connect protocols to components that use them. The substring
+        # matching runs client-side over the parsed data - CONTAINS has no
+        # index support in Neo4j, so the old server-side version was a
+        # components x protocols cross product of linear scans
+        component_pairs = []
+        for component in data['components']:
+            component_id = prefix + component['id']
+            for protocol in data['protocols']:
+                protocol_name = protocol.get('name') or ''
+                if ((protocol_name and protocol_name in component_id)
+                        or (component['name'] and component['name'] in protocol_name)):
+                    component_pairs.append({
+                        'cid': component_id,
+                        'pid': prefix + protocol['id']
+                    })
+        if component_pairs:
+            tx.run(_Q_COMPONENT_USES_PROTOCOL, pairs=component_pairs, folder_id=folder_id)
+
+        # Connect protocols to participants based on system names, matched
+        # client-side for the same reason
+        participant_pairs = []
+        for participant in data['participants']:
+            participant_name = participant['name'] or ''
+            for protocol in data['protocols']:
+                system = protocol.get('system')
+                if system and (system in participant_name or participant_name in system):
+                    participant_pairs.append({
+                        'paid': prefix + participant['id'],
+                        'pid': prefix + protocol['id']
+                    })
+        if participant_pairs:
+            tx.run(_Q_PARTICIPANT_IMPLEMENTS, pairs=participant_pairs, folder_id=folder_id)
+
+        logger.debug("Created additional relationships for %s", folder_id)
     
+    @staticmethod
+    def clear_folder(tx, folder_id: str) -> None:
+        """Delete one folder's subgraph so it can be re-ingested cleanly.
+
+        Edges use MERGE, but elements removed from a folder since the last
+        ingest would otherwise linger in the graph.
+        """
+        tx.run(_Q_CLEAR_FOLDER_NODES, folder_id=folder_id)
+        tx.run(_Q_CLEAR_FOLDER_NODE, folder_id=folder_id)
+        logger.debug("Cleared existing subgraph for %s", folder_id)
+
+    def _ingest_folder(self, tx, folder_name: str, data: Dict[str, Any]) -> None:
+        """Write a folder's nodes and relationships in one transaction.
+
+        The folder's previous subgraph, if any, is dropped in the same
+        transaction, making per-folder re-ingest idempotent without a full
+        database clear.
+        """
+        self.clear_folder(tx, self._folder_id(folder_name))
+        self.create_nodes_for_folder(tx, folder_name, data)
+        self.create_relationships_for_folder(tx, folder_name, data)
+
     def process_single_folder(self, folder_path: str) -> bool:
         """
         Process a single iFlow folder and create its Knowledge Graph.
         Returns True if successful, False otherwise.
         """
         folder_name = self.get_folder_name(folder_path)
-        logger.info(f"Processing folder: {folder_name}")
-        
+        logger.info("Processing folder: %s", folder_name)
+
         try:
             # Get the iFlow file path
             iflow_file = self.get_iflow_file_path(folder_path)
-            
+
             # Parse the iFlow XML
             data = self.parse_iflow_xml(iflow_file)
-            
-            # Create nodes for this folder
-            self.create_nodes_for_folder(folder_name, data)
-            
-            # Create relationships for this folder
-            self.create_relationships_for_folder(folder_name, data)
-            
-            self.processed_folders.append(folder_name)
-            logger.info(f"Successfully processed folder: {folder_name}")
+
+            # One session and one write transaction per folder - nodes and
+            # relationships share a single commit
+            with self._session() as session:
+                session.execute_write(self._ingest_folder, folder_name, data)
+
+            with self._folders_lock:
+                self.processed_folders.append(folder_name)
+            logger.info("Successfully processed folder: %s", folder_name)
             return True
-            
+
         except Exception as e:
-            logger.error(f"Failed to process folder {folder_name}: {e}")
-            self.failed_folders.append(folder_name)
+            logger.error("Failed to process folder %s: %s", folder_name, e)
+            with self._folders_lock:
+                self.failed_folders.append(folder_name)
             return False
     
     def check_isolated_nodes(self) -> Dict[str, List[str]]:
-        """Check for any isolated nodes in the graph."""
-        with self.driver.session() as session:
-            # Find nodes with no relationships
+        """Check for any isolated nodes in the graph.
+
+        The per-label grouping and display strings are built server-side,
+        so the result is one row per label rather than one per node.
+        """
+        with self._session(fetch_size=-1) as session:
             isolated_result = session.run("""
                 MATCH (n)
                 WHERE NOT (n)--()
-                RETURN labels(n)[0] as NodeType, n.name as NodeName, n.id as NodeId, n.folder_id as FolderId
+                RETURN labels(n)[0] AS node_type,
+                       collect(coalesce(n.name, 'None') + ' (' + coalesce(n.id, 'None')
+                               + ') in ' + coalesce(n.folder_id, 'None')) AS entries
             """)
-            
-            isolated_nodes = {}
-            for record in isolated_result:
-                node_type = record['NodeType']
-                node_name = record['NodeName']
-                node_id = record['NodeId']
-                folder_id = record['FolderId']
-                
-                if node_type not in isolated_nodes:
-                    isolated_nodes[node_type] = []
-                isolated_nodes[node_type].append(f"{node_name} ({node_id}) in {folder_id}")
-            
-            return isolated_nodes
+            return {node_type: entries
+                    for node_type, entries in isolated_result.values('node_type', 'entries')}
     
     def get_graph_statistics(self) -> Dict[str, Any]:
-        """Get statistics about the Knowledge Graph."""
-        with self.driver.session() as session:
-            # Count nodes by type
-            node_result = session.run("""
-                MATCH (n)
-                RETURN labels(n)[0] as NodeType, count(n) as Count
-                ORDER BY Count DESC
-            """)
-            
-            node_counts = {}
-            total_nodes = 0
-            for record in node_result:
-                node_type = record['NodeType']
-                count = record['Count']
-                node_counts[node_type] = count
-                total_nodes += count
-            
-            # Count relationships by type
-            rel_result = session.run("""
-                MATCH ()-[r]->()
-                RETURN type(r) as RelationshipType, count(r) as Count
-                ORDER BY Count DESC
-            """)
-            
-            rel_counts = {}
-            total_relationships = 0
-            for record in rel_result:
-                rel_type = record['RelationshipType']
-                count = record['Count']
-                rel_counts[rel_type] = count
-                total_relationships += count
-            
-            # Count folders
-            folder_count = session.run("MATCH (f:Folder) RETURN count(f) as count").single()['count']
-            
-            stats = {
-                'total_folders': folder_count,
-                'total_nodes': total_nodes,
-                'total_relationships': total_relationships,
-                'nodes_by_type': node_counts,
-                'relationships_by_type': rel_counts,
-                'processed_folders': len(self.processed_folders),
-                'failed_folders': len(self.failed_folders)
-            }
-            
-            return stats
+        """Get statistics about the Knowledge Graph.
+
+        Node and relationship counts come back in one statement via two
+        collected subqueries instead of three separate round-trips; the
+        folder count falls out of the node counts.
+        """
+        with self._session() as session:
+            record = session.run("""
+                CALL {
+                    MATCH (n)
+                    RETURN labels(n)[0] AS label, count(n) AS count
+                    ORDER BY count DESC
+                }
+                WITH collect({label: label, count: count}) AS node_counts
+                CALL {
+                    MATCH ()-[r]->()
+                    RETURN type(r) AS rel_type, count(r) AS count
+                    ORDER BY count DESC
+                }
+                RETURN node_counts,
+                       collect({rel_type: rel_type, count: count}) AS rel_counts
+            """).single()
+
+        node_counts = {row['label']: row['count'] for row in record['node_counts']}
+        rel_counts = {row['rel_type']: row['count'] for row in record['rel_counts']}
+
+        return {
+            'total_folders': node_counts.get('Folder', 0),
+            'total_nodes': sum(node_counts.values()),
+            'total_relationships': sum(rel_counts.values()),
+            'nodes_by_type': node_counts,
+            'relationships_by_type': rel_counts,
+            'processed_folders': len(self.processed_folders),
+            'failed_folders': len(self.failed_folders)
+        }
     
     def export_graph_data(self, filename: str = "complete_iflow_graph_data.json") -> None:
         """Export the complete graph data to a JSON file."""
-        logger.info(f"Exporting graph data to {filename}")
+        logger.info("Exporting graph data to %s", filename)
         
         graph_data = {
             'statistics': self.get_graph_statistics(),
@@ -890,30 +1138,34 @@ class CompleteIFlowKnowledgeGraph:
             'folders': []
         }
         
-        # Get data for each folder
-        with self.driver.session() as session:
-            for folder_name in self.processed_folders:
-                folder_id = f"Folder_{folder_name.replace(' ', '_').replace('.', '_')}"
-                
-                # Get folder data
-                folder_result = session.run("""
-                    MATCH (f:Folder {id: $folder_id})
-                    OPTIONAL MATCH (f)-[:CONTAINS]->(n)
-                    RETURN f, collect(n) as nodes
-                """, folder_id=folder_id)
-                
-                folder_data = folder_result.single()
-                if folder_data:
-                    graph_data['folders'].append({
-                        'folder_name': folder_name,
-                        'folder_id': folder_id,
-                        'nodes': [dict(node) for node in folder_data['nodes']]
-                    })
-        
-        with open(filename, 'w') as f:
-            json.dump(graph_data, f, indent=2, default=str)
+        # Get data for all folders in one statement - one round-trip for the
+        # whole export instead of one per processed folder
+        folder_names_by_id = {self._folder_id(name): name
+                              for name in self.processed_folders}
+        # The export always drains the full result, so skip record paging
+        with self._session(fetch_size=-1) as session:
+            folder_result = session.run("""
+                UNWIND $folder_ids AS fid
+                MATCH (f:Folder {id: fid})
+                OPTIONAL MATCH (f)-[:CONTAINS]->(n)
+                RETURN fid, collect(n) as nodes
+            """, folder_ids=list(folder_names_by_id))
+
+            for record in folder_result:
+                folder_id = record['fid']
+                graph_data['folders'].append({
+                    'folder_name': folder_names_by_id[folder_id],
+                    'folder_id': folder_id,
+                    'nodes': [dict(node) for node in record['nodes']]
+                })
         
-        logger.info(f"Graph data exported to {filename}")
+        # orjson serializes in C and hands back one bytes object, instead of
+        # json.dump's Python-level encoder writing the file piecemeal
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(graph_data, default=str,
+                                 option=orjson.OPT_INDENT_2))
+
+        logger.info("Graph data exported to %s", filename)
     
     def run(self, dry_run: bool = False) -> None:
         """
@@ -935,17 +1187,23 @@ class CompleteIFlowKnowledgeGraph:
                 logger.info("FOUND IFLOW FOLDERS:")
                 for i, folder_path in enumerate(iflow_folders, 1):
                     folder_name = self.get_folder_name(folder_path)
-                    logger.info(f"  {i:3d}. {folder_name}")
+                    logger.info("  %3d. %s", i, folder_name)
                 logger.info("=" * 80)
-                logger.info(f"Total folders found: {len(iflow_folders)}")
+                logger.info("Total folders found: %s", len(iflow_folders))
                 return
             
             # Clear existing data
             self.clear_database()
-            
-            # Process each folder
-            for folder_path in iflow_folders:
-                self.process_single_folder(folder_path)
+
+            # Make sure endpoint lookups are index-backed before bulk writes
+            self.ensure_indexes()
+
+            # Process folders concurrently: each folder is dominated by Bolt
+            # round-trips, so workers overlap network waits with parsing
+            workers = min(int(os.getenv('KG_FOLDER_WORKERS', '8')), len(iflow_folders))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # list() drains the iterator so worker exceptions propagate
+                list(executor.map(self.process_single_folder, iflow_folders))
             
             # Export graph data
             self.export_graph_data()
@@ -955,7 +1213,7 @@ class CompleteIFlowKnowledgeGraph:
             if isolated_nodes:
                 logger.warning("Found isolated nodes:")
                 for node_type, nodes in isolated_nodes.items():
-                    logger.warning(f"   {node_type}: {', '.join(nodes)}")
+                    logger.warning("   %s: %s", node_type, ', '.join(nodes))
             else:
                 logger.info("All nodes are connected - no isolated nodes found!")
             
@@ -964,28 +1222,28 @@ class CompleteIFlowKnowledgeGraph:
             logger.info("=" * 80)
             logger.info("COMPLETE KNOWLEDGE GRAPH CREATED SUCCESSFULLY!")
             logger.info("=" * 80)
-            logger.info(f"TOTAL FOLDERS PROCESSED: {stats['total_folders']}")
-            logger.info(f"SUCCESSFUL FOLDERS: {stats['processed_folders']}")
-            logger.info(f"FAILED FOLDERS: {stats['failed_folders']}")
-            logger.info(f"TOTAL NODES CREATED: {stats['total_nodes']}")
-            logger.info(f"TOTAL RELATIONSHIPS CREATED: {stats['total_relationships']}")
+            logger.info("TOTAL FOLDERS PROCESSED: %s", stats['total_folders'])
+            logger.info("SUCCESSFUL FOLDERS: %s", stats['processed_folders'])
+            logger.info("FAILED FOLDERS: %s", stats['failed_folders'])
+            logger.info("TOTAL NODES CREATED: %s", stats['total_nodes'])
+            logger.info("TOTAL RELATIONSHIPS CREATED: %s", stats['total_relationships'])
             logger.info("")
             logger.info("NODES BY TYPE:")
             for node_type, count in stats['nodes_by_type'].items():
-                logger.info(f"   • {node_type}: {count}")
+                logger.info("   • %s: %s", node_type, count)
             logger.info("")
             logger.info("RELATIONSHIPS BY TYPE:")
             for rel_type, count in stats['relationships_by_type'].items():
-                logger.info(f"   • {rel_type}: {count}")
+                logger.info("   • %s: %s", rel_type, count)
             logger.info("")
             logger.info("PROCESSED FOLDERS:")
             for folder in self.processed_folders:
-                logger.info(f"   ✓ {folder}")
+                logger.info("   ✓ %s", folder)
             if self.failed_folders:
                 logger.info("")
                 logger.info("FAILED FOLDERS:")
                 for folder in self.failed_folders:
-                    logger.info(f"   ✗ {folder}")
+                    logger.info("   ✗ %s", folder)
             logger.info("=" * 80)
             logger.info("Your Complete iFlow Knowledge Graph is ready for visualization!")
             logger.info("Open Neo4j Browser (http://localhost:7474) to explore the graph")
@@ -994,7 +1252,7 @@ class CompleteIFlowKnowledgeGraph:
             logger.info("=" * 80)
             
         except Exception as e:
-            logger.error(f"Error creating Complete Knowledge Graph: {e}")
+            logger.error("Error creating Complete Knowledge Graph: %s", e)
             raise
         finally:
             self.close()
@@ -6,14 +6,145 @@ Every component, process, flow, external system, participant, and subprocess is
 All connections are created as relationships to mirror the original iFlow layout.
 """
 
+import atexit
+import functools
 import os
-import xml.etree.ElementTree as ET
+import itertools
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree as ET
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 import logging
-from typing import Dict, List, Tuple, Any
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterator, List, Tuple, Any
 import json
 
+# Default number of rows sent per UNWIND batch during ingestion
+DEFAULT_BATCH_SIZE = 1000
+
+# Separator line for the success banner, built once at import
+_BANNER = '=' * 60
+
+# Concurrent Bolt writers for batched node ingestion; each in-flight batch
+# overlaps its network round-trip and server commit with the others
+KG_WRITE_WORKERS = int(os.getenv('KG_WRITE_WORKERS', '8'))
+
+# Naming the database explicitly saves the driver a server round-trip to
+# resolve the home database when each session is opened
+NEO4J_DATABASE = os.getenv('NEO4J_DATABASE', 'neo4j')
+
+@functools.cache
+def _default_driver():
+    """Shared driver for instances not handed one explicitly.
+
+    Cached so repeated invocations (scripted pipelines, tests) reuse one
+    connection pool instead of paying the TLS handshake and routing-table
+    fetch per run; closed once at interpreter exit.
+    """
+    driver = GraphDatabase.driver(
+        os.getenv('NEO4J_URI', 'neo4j://127.0.0.1:7687'),
+        auth=(os.getenv('NEO4J_USERNAME', os.getenv('NEO4J_USER', 'neo4j')),
+              os.getenv('NEO4J_PASSWORD', 'password')),
+        # Sized for the concurrent batch writers plus the main session
+        max_connection_pool_size=int(os.getenv('NEO4J_POOL_SIZE', '16')))
+    atexit.register(driver.close)
+    return driver
+
+def _json_default(obj):
+    """json encoder fallback: driver Node/Relationship objects are dict-like,
+    so their property copy happens lazily inside the encoder instead of
+    eagerly for every record."""
+    if hasattr(obj, 'items'):
+        return dict(obj)
+    return str(obj)
+
+def _batched(rows, size):
+    """Yield successive lists of at most `size` rows."""
+    it = iter(rows)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+class _LazyJoin:
+    """Joins a list of strings only when the log record is actually
+    formatted, so filtered levels never pay for the concatenation."""
+
+    __slots__ = ('items', 'sep')
+
+    def __init__(self, items, sep=', '):
+        self.items = items
+        self.sep = sep
+
+    def __str__(self):
+        return self.sep.join(self.items)
+
+class _CountingTx:
+    """Transaction wrapper that consumes each result and accumulates the
+    write counters, so phases can report created-entity totals without
+    re-counting the database afterwards."""
+
+    __slots__ = ('_tx', 'nodes_created', 'relationships_created')
+
+    def __init__(self, tx):
+        self._tx = tx
+        self.nodes_created = 0
+        self.relationships_created = 0
+
+    def run(self, query, **params):
+        counters = self._tx.run(query, **params).consume().counters
+        self.nodes_created += counters.nodes_created
+        self.relationships_created += counters.relationships_created
+
+class _Throttle:
+    """Rate-limits progress reporting to at most once per interval.
+
+    ready() is a single monotonic-clock comparison, so callers can check it
+    on every element without the logging cost dominating tight loops.
+    """
+
+    __slots__ = ('interval', '_next')
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._next = time.monotonic() + interval
+
+    def ready(self) -> bool:
+        now = time.monotonic()
+        if now < self._next:
+            return False
+        self._next = now + self.interval
+        return True
+
+# XML namespaces used by SAP iFlow BPMN files
+BPMN2_NS = 'http://www.omg.org/spec/BPMN/20100524/MODEL'
+IFL_NS = 'http:///com.sap.ifl.model/Ifl.xsd'
+
+def _bpmn2(tag: str) -> str:
+    """Namespace-qualified bpmn2 tag name, as iterparse reports it."""
+    return '{%s}%s' % (BPMN2_NS, tag)
+
+NAMESPACES = {'bpmn2': BPMN2_NS, 'ifl': IFL_NS}
+
+# Qualified ifl:property tag, as iter() reports it
+_IFL_PROPERTY_TAG = '{%s}property' % IFL_NS
+
+# Characters not allowed in a Folder node id, replaced with underscores
+_FOLDER_ID_TRANS = str.maketrans(' .-', '___')
+
+# Precompiled XPath expressions - compiled once at import and reused for
+# every parsed element instead of reparsing the path string per call
+_XP_EXTENSION_ELEMENTS = ET.XPath('bpmn2:extensionElements', namespaces=NAMESPACES)
+# Predicated lookup answers "what is this component's activityType?" in one
+# C-level XPath evaluation instead of a find + iter + Python loop
+_XP_ACTIVITY_TYPE = ET.XPath(
+    "bpmn2:extensionElements//ifl:property[key='activityType']/value/text()",
+    namespaces=NAMESPACES)
+
 # Load environment variables
 load_dotenv()
 
@@ -26,77 +157,295 @@ class IFlowKnowledgeGraph:
     Creates a Knowledge Graph that exactly replicates the SAP Integration Flow diagram.
     Enhanced version with protocol nodes and folder isolation support.
     """
-    
-    def __init__(self, folder_name: str = None):
-        """Initialize the Knowledge Graph creator with Neo4j connection."""
-        self.uri = os.getenv('NEO4J_URI', 'neo4j://127.0.0.1:7687')
-        self.user = os.getenv('NEO4J_USERNAME', os.getenv('NEO4J_USER', 'neo4j'))
-        self.password = os.getenv('NEO4J_PASSWORD', 'password')
-        
-        self.driver = GraphDatabase.driver(self.uri, auth=(self.user, self.password))
+
+    # Every label the pipeline writes - used for index creation before ingest
+    NODE_LABELS = ('Folder', 'Process', 'Participant', 'Component', 'SubProcess', 'Protocol')
+
+    # Qualified tag names precomputed once so the iterparse loop dispatches
+    # on plain string comparisons
+    PROCESS_TAG = _bpmn2('process')
+    PARTICIPANT_TAG = _bpmn2('participant')
+    SUBPROCESS_TAG = _bpmn2('subProcess')
+    SEQUENCE_FLOW_TAG = _bpmn2('sequenceFlow')
+    MESSAGE_FLOW_TAG = _bpmn2('messageFlow')
+    SERVICE_TASK_TAG = _bpmn2('serviceTask')
+    # Tags map straight to the normalized type name, so the handler never
+    # needs a second lookup through _normalize_component_type
+    COMPONENT_TAGS = {
+        _bpmn2('startEvent'): 'StartEvent',
+        _bpmn2('endEvent'): 'EndEvent',
+        SERVICE_TASK_TAG: 'ServiceTask',
+        _bpmn2('callActivity'): 'CallActivity',
+        _bpmn2('parallelGateway'): 'ParallelGateway',
+        _bpmn2('exclusiveGateway'): 'ExclusiveGateway',
+    }
+
+    def __init__(self, folder_name: str = None, driver=None):
+        """
+        Initialize the Knowledge Graph creator with Neo4j connection.
+        An already-open driver can be passed in to reuse a shared connection
+        pool; the caller then stays responsible for closing it.
+        """
+        if driver is not None:
+            self.driver = driver
+        else:
+            self.driver = _default_driver()
+        # Both branches share a pool owned elsewhere (the caller or the
+        # module factory's atexit hook), so close() never tears it down
+        self._owns_driver = False
+        # Opened lazily by _session() and reused for the whole run
+        self._cached_session = None
+        # True right after this folder's data was wiped, letting node batches
+        # use CREATE instead of MERGE
+        self._fresh_folder = False
         self.iflow_file = "src/main/resources/scenarioflows/integrationflow/test_iflow.iflw"
         self.folder_name = folder_name or "Default_iFlow"
+        # Sanitised once here instead of being rebuilt at every call site;
+        # the prefix saves an f-string format per id at every loop site
+        self.folder_id = 'Folder_' + self.folder_name.translate(_FOLDER_ID_TRANS)
+        self._id_prefix = self.folder_id + '_'
         
         # Store parsed data
         self.processes = {}
         self.components = {}
         self.participants = {}
-        self.flows = []
         self.subprocesses = {}
         self.protocols = {}
+        # Backing lists for the flows property; parse_iflow_xml points these
+        # at the parsed data so flows never needs a third copy
+        self._seq_flows = []
+        self._msg_flows = []
+
+    @property
+    def flows(self):
+        """All parsed flows, sequence flows first, chained lazily."""
+        return itertools.chain(self._seq_flows, self._msg_flows)
         
     def close(self):
-        """Close the Neo4j driver connection."""
-        if self.driver:
+        """Close the cached session and the driver (driver only if owned).
+
+        Idempotent: the driver reference is dropped after closing so a
+        second call - e.g. run()'s finally after a with-block exit - is a
+        no-op instead of a second socket teardown.
+        """
+        if self._cached_session is not None:
+            self._cached_session.close()
+            self._cached_session = None
+        if self.driver is not None and self._owns_driver:
             self.driver.close()
+            self.driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _session(self):
+        """Return the lazily-opened session shared by this instance.
+
+        One session per run avoids re-acquiring a pooled connection for
+        every statement; it is closed in close().
+        """
+        if self._cached_session is None:
+            self._cached_session = self.driver.session(database=NEO4J_DATABASE)
+        return self._cached_session
+
+    def _read(self, query: str, **params) -> List[Any]:
+        """Run a read query in a managed transaction and return all records."""
+        return self._session().execute_read(lambda tx: list(tx.run(query, **params)))
+
+    def _write(self, query: str, **params) -> List[Any]:
+        """Run a write query in a managed transaction and return all records."""
+        return self._session().execute_write(lambda tx: list(tx.run(query, **params)))
     
     def clear_database(self):
-        """Clear existing iFlow data from the database."""
-        with self.driver.session() as session:
-            session.run("MATCH (n) DETACH DELETE n")
-            logger.info("Cleared existing iFlow data from database")
-    
+        """Clear existing iFlow data from the database.
+
+        Deletes run in server-side batches so a large graph never has to be
+        removed in one huge transaction.
+        """
+        # CALL IN TRANSACTIONS needs an implicit transaction, so this runs
+        # on the session directly instead of through _write
+        self._session().run("""
+            MATCH (n)
+            CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+        """)
+        self._fresh_folder = True
+        logger.info("Cleared existing iFlow data from database")
+
     def clear_folder_data(self):
-        """Clear data for a specific folder only."""
-        folder_id = f"Folder_{self.folder_name.replace(' ', '_').replace('.', '_').replace('-', '_')}"
-        with self.driver.session() as session:
-            session.run("MATCH (n {folder_id: $folder_id}) DETACH DELETE n", folder_id=folder_id)
-            logger.info(f"Cleared existing data for folder: {self.folder_name}")
+        """Clear data for a specific folder only, in server-side delete batches."""
+        # CALL IN TRANSACTIONS needs an implicit transaction, so this runs
+        # on the session directly instead of through _write
+        self._session().run("""
+            MATCH (n {folder_id: $folder_id})
+            CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+        """, folder_id=self.folder_id)
+        self._fresh_folder = True
+        logger.info("Cleared existing data for folder: %s", self.folder_name)
     
     def check_folder_exists(self):
         """Check if a folder with this name already exists."""
-        folder_id = f"Folder_{self.folder_name.replace(' ', '_').replace('.', '_').replace('-', '_')}"
-        with self.driver.session() as session:
-            result = session.run("MATCH (f:Folder {id: $folder_id}) RETURN f", folder_id=folder_id)
-            return result.single() is not None
+        records = self._read("MATCH (f:Folder {id: $folder_id}) RETURN f", folder_id=self.folder_id)
+        return bool(records)
     
+    def ensure_indexes(self):
+        """Create constraints and indexes so batched MERGEs are index-backed."""
+        # Schema statements run in their own implicit transactions
+        session = self._session()
+        # Folder ids are globally unique; the constraint doubles as the
+        # Folder id index
+        session.run("CREATE CONSTRAINT folder_id_unique IF NOT EXISTS "
+                    "FOR (n:Folder) REQUIRE n.id IS UNIQUE")
+        for label in self.NODE_LABELS:
+            if label == 'Folder':
+                continue
+            # Node ids carry the folder prefix, so they are unique across
+            # folders; the constraint gives an index seek per MATCH and
+            # guards against double ingestion
+            session.run(f"CREATE CONSTRAINT {label.lower()}_id_unique IF NOT EXISTS "
+                        f"FOR (n:{label}) REQUIRE n.id IS UNIQUE")
+            # folder_id leads so folder-wide matches use the index
+            # prefix and id + folder_id predicates resolve in one seek
+            session.run(f"CREATE INDEX IF NOT EXISTS FOR (n:{label}) ON (n.folder_id, n.id)")
+        # Newly created indexes populate asynchronously; wait for them so
+        # the first ingestion's MATCH/MERGE lookups are seeks, not scans
+        session.run("CALL db.awaitIndexes(300)")
+        logger.info("Ensured constraints and indexes for all node labels")
+
+    def _merge_nodes_batch(self, session, label: str, rows: List[Dict[str, Any]],
+                           batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """Write a list of {id, props} rows as one UNWIND statement per batch.
+
+        Right after the folder was cleared every row is guaranteed new, so
+        CREATE skips the per-row index seek that MERGE pays. Any error drops
+        back to MERGE so a retry stays idempotent. Returns the number of
+        nodes actually created, taken from the result summaries.
+        """
+        verb = 'CREATE' if self._fresh_folder else 'MERGE'
+        query = (
+            f"UNWIND $rows AS row "
+            f"{verb} (n:{label} {{id: row.id}}) "
+            f"SET n += row.props"
+        )
+        created = 0
+        try:
+            for batch in _batched(rows, batch_size):
+                # One explicit transaction per batch: a single commit for the
+                # whole batch, retried by the driver on transient failures
+                summary = session.execute_write(
+                    lambda tx, rows=batch: tx.run(query, rows=rows).consume())
+                created += summary.counters.nodes_created
+        except Exception:
+            self._fresh_folder = False
+            raise
+        return created
+
     def get_current_counts(self) -> Dict[str, int]:
         """Get current node and relationship counts from the database."""
-        with self.driver.session() as session:
-            node_count = session.run("MATCH (n) RETURN count(n) as count").single()['count']
-            rel_count = session.run("MATCH ()-[r]->() RETURN count(r) as count").single()['count']
-            return {'nodes': node_count, 'relationships': rel_count}
+        # COUNT subqueries resolve from the count store, and returning both
+        # in one statement halves the round-trips
+        record = self._read(
+            "RETURN COUNT { MATCH (n) } as node_count, "
+            "COUNT { MATCH ()-[r]->() } as rel_count")[0]
+        node_count = record['node_count']
+        rel_count = record['rel_count']
+        return {'nodes': node_count, 'relationships': rel_count}
     
+    def _handle_process(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:process element."""
+        process_data = {
+            'id': elem.get('id'),
+            'name': elem.get('name'),
+            'type': 'Process'
+        }
+        data['processes'].append(process_data)
+        self.processes[process_data['id']] = process_data
+
+    def _handle_participant(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:participant element plus any protocol details."""
+        participant_data = {
+            'id': elem.get('id'),
+            'name': elem.get('name'),
+            'type': 'Participant'
+        }
+        data['participants'].append(participant_data)
+        self.participants[participant_data['id']] = participant_data
+        protocol_data = self._extract_protocol(elem, (('participant_id', 'id'),))
+        if protocol_data and self._is_valid_protocol(protocol_data):
+            data['protocols'].append(protocol_data)
+
+    def _handle_component(self, elem, data: Dict[str, Any]) -> None:
+        """Collect an event/task/gateway element plus any protocol details."""
+        component_data = {
+            'id': elem.get('id'),
+            'name': elem.get('name'),
+            'type': self.COMPONENT_TAGS[elem.tag]
+        }
+        data['components'].append(component_data)
+        self.components[component_data['id']] = component_data
+        # Only service tasks carry actual protocol properties
+        if elem.tag == self.SERVICE_TASK_TAG:
+            protocol_data = self._extract_protocol(elem, (('component_id', 'id'),))
+            if protocol_data and self._is_valid_protocol(protocol_data):
+                data['protocols'].append(protocol_data)
+
+    def _handle_subprocess(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:subProcess element."""
+        subprocess_data = {
+            'id': elem.get('id'),
+            'name': elem.get('name'),
+            'type': 'SubProcess'
+        }
+        data['subprocesses'].append(subprocess_data)
+        self.subprocesses[subprocess_data['id']] = subprocess_data
+
+    def _handle_sequence_flow(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:sequenceFlow element."""
+        flow_data = {
+            'id': elem.get('id'),
+            'name': elem.get('name', ''),
+            'source': elem.get('sourceRef'),
+            'target': elem.get('targetRef'),
+            'type': 'SequenceFlow'
+        }
+        data['sequence_flows'].append(flow_data)
+
+    def _handle_message_flow(self, elem, data: Dict[str, Any]) -> None:
+        """Collect a bpmn2:messageFlow element plus any protocol details."""
+        flow_data = {
+            'id': elem.get('id'),
+            'name': elem.get('name', ''),
+            'source': elem.get('sourceRef'),
+            'target': elem.get('targetRef'),
+            'type': 'MessageFlow'
+        }
+        data['message_flows'].append(flow_data)
+        protocol_data = self._extract_protocol(elem, (('source', 'sourceRef'), ('target', 'targetRef')))
+        if protocol_data and self._is_valid_protocol(protocol_data):
+            data['protocols'].append(protocol_data)
+
+    # O(1) dispatch table for the iterparse loop; component tags all share
+    # one handler that looks up the concrete type from COMPONENT_TAGS
+    TAG_HANDLERS = {
+        PROCESS_TAG: _handle_process,
+        PARTICIPANT_TAG: _handle_participant,
+        SUBPROCESS_TAG: _handle_subprocess,
+        SEQUENCE_FLOW_TAG: _handle_sequence_flow,
+        MESSAGE_FLOW_TAG: _handle_message_flow,
+    }
+    for _component_tag in COMPONENT_TAGS:
+        TAG_HANDLERS[_component_tag] = _handle_component
+    del _component_tag
+
     def parse_iflow_xml(self) -> Dict[str, Any]:
         """
         Parse the iFlow XML file and extract all components and relationships.
         Returns a structured dictionary with all iFlow elements.
         """
-        logger.info(f"Parsing iFlow XML file: {self.iflow_file}")
-        
-        try:
-            tree = ET.parse(self.iflow_file)
-            root = tree.getroot()
-        except FileNotFoundError:
-            logger.error(f"iFlow file not found: {self.iflow_file}")
-            return self._create_fallback_structure()
-        
-        # Define namespaces
-        namespaces = {
-            'bpmn2': 'http://www.omg.org/spec/BPMN/20100524/MODEL',
-            'ifl': 'http:///com.sap.ifl.model/Ifl.xsd'
-        }
-        
+        logger.info("Parsing iFlow XML file: %s", self.iflow_file)
+
         data = {
             'processes': [],
             'participants': [],
@@ -106,82 +455,45 @@ class IFlowKnowledgeGraph:
             'subprocesses': [],
             'protocols': []  # New: Protocol-specific components
         }
-        
-        # Extract processes
-        for process in root.findall('.//bpmn2:process', namespaces):
-            process_data = {
-                'id': process.get('id'),
-                'name': process.get('name'),
-                'type': 'Process'
-            }
-            data['processes'].append(process_data)
-            self.processes[process_data['id']] = process_data
-        
-        # Extract participants
-        for participant in root.findall('.//bpmn2:participant', namespaces):
-            participant_data = {
-                'id': participant.get('id'),
-                'name': participant.get('name'),
-                'type': 'Participant'
-            }
-            data['participants'].append(participant_data)
-            self.participants[participant_data['id']] = participant_data
-        
-        # Extract all components (start events, end events, service tasks, call activities, gateways)
-        component_types = ['startEvent', 'endEvent', 'serviceTask', 'callActivity', 'parallelGateway', 'exclusiveGateway']
-        
-        for comp_type in component_types:
-            for component in root.findall(f'.//bpmn2:{comp_type}', namespaces):
-                component_data = {
-                    'id': component.get('id'),
-                    'name': component.get('name'),
-                    'type': self._normalize_component_type(comp_type)
-                }
-                data['components'].append(component_data)
-                self.components[component_data['id']] = component_data
-        
-        # Extract subprocesses
-        for subprocess in root.findall('.//bpmn2:subProcess', namespaces):
-            subprocess_data = {
-                'id': subprocess.get('id'),
-                'name': subprocess.get('name'),
-                'type': 'SubProcess'
-            }
-            data['subprocesses'].append(subprocess_data)
-            self.subprocesses[subprocess_data['id']] = subprocess_data
-        
-        # Extract sequence flows
-        for flow in root.findall('.//bpmn2:sequenceFlow', namespaces):
-            flow_data = {
-                'id': flow.get('id'),
-                'name': flow.get('name', ''),
-                'source': flow.get('sourceRef'),
-                'target': flow.get('targetRef'),
-                'type': 'SequenceFlow'
-            }
-            data['sequence_flows'].append(flow_data)
-            self.flows.append(flow_data)
-        
-        # Extract message flows
-        for flow in root.findall('.//bpmn2:messageFlow', namespaces):
-            flow_data = {
-                'id': flow.get('id'),
-                'name': flow.get('name', ''),
-                'source': flow.get('sourceRef'),
-                'target': flow.get('targetRef'),
-                'type': 'MessageFlow'
-            }
-            data['message_flows'].append(flow_data)
-            self.flows.append(flow_data)
-        
-        # Extract protocol-specific components from message flows and participants
-        self._extract_protocol_components(root, namespaces, data)
-        
-        logger.info(f"Parsed {len(data['processes'])} processes, {len(data['participants'])} participants, "
-                   f"{len(data['components'])} components, {len(data['subprocesses'])} subprocesses, "
-                   f"{len(data['sequence_flows'])} sequence flows, {len(data['message_flows'])} message flows, "
-                   f"{len(data['protocols'])} protocol components")
-        
+        # The flows property chains these lists instead of keeping a copy
+        self._seq_flows = data['sequence_flows']
+        self._msg_flows = data['message_flows']
+
+        handlers = self.TAG_HANDLERS
+        progress = _Throttle()
+        handled = 0
+
+        try:
+            # One streaming pass over 'end' events replaces the per-element-type
+            # findall traversals; each tag dispatches straight to its handler,
+            # which pulls protocol details while the subtree is still in memory
+            for _event, elem in ET.iterparse(self.iflow_file, events=('end',),
+                                             tag=tuple(handlers),
+                                             huge_tree=True):
+                handlers[elem.tag](self, elem, data)
+                handled += 1
+                if progress.ready():
+                    logger.debug("Parsing iFlow XML: %s elements handled", handled)
+
+                # Handled subtree is no longer needed - drop it and any
+                # already-processed siblings to keep memory constant
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
+        except OSError:
+            logger.error("iFlow file not found: %s", self.iflow_file)
+            return self._create_fallback_structure()
+
+        logger.info("Parsed %s processes, %s participants, %s components, "
+                   "%s subprocesses, %s sequence flows, %s message flows, "
+                   "%s protocol components",
+                   len(data['processes']), len(data['participants']),
+                   len(data['components']), len(data['subprocesses']),
+                   len(data['sequence_flows']), len(data['message_flows']),
+                   len(data['protocols']))
+
         return data
     
     def _normalize_component_type(self, comp_type: str) -> str:
@@ -201,188 +513,130 @@ class IFlowKnowledgeGraph:
         Get a proper node name with fallback logic.
         If name is empty or None, fallback to system, adapter_name, id, or type properties.
         """
-        if name and name.strip():
-            return name.strip()
-        
-        # For protocols, try system property first
-        if system and system.strip():
-            return system.strip()
-        
-        # Try adapter_name for protocols
-        if adapter_name and adapter_name.strip():
-            return adapter_name.strip()
-        
-        # Fallback to node_id if available
-        if node_id and node_id.strip():
-            return node_id.strip()
-        
+        # Runs for every parsed element, so each candidate is stripped
+        # exactly once; system and adapter_name come before the id for
+        # protocols
+        for candidate in (name, system, adapter_name, node_id):
+            stripped = candidate.strip() if candidate else ''
+            if stripped:
+                return stripped
+
         # Fallback to node_type
         if node_type and node_type.strip():
             return f"{node_type}_{node_id}" if node_id else node_type
-        
+
         # Last resort
         return "Unknown_Node"
     
-    def _extract_activity_type(self, component, namespaces: Dict[str, str]) -> str:
+    def _extract_activity_type(self, component) -> str:
         """Extract activityType from component extension elements."""
-        extension_elements = component.find('.//bpmn2:extensionElements', namespaces)
-        if extension_elements is not None:
-            for property_elem in extension_elements.findall('.//ifl:property', namespaces):
-                key_elem = property_elem.find('key')
-                value_elem = property_elem.find('value')
-                
-                if key_elem is not None and value_elem is not None:
-                    if key_elem.text == 'activityType':
-                        return value_elem.text
-        return None
+        result = _XP_ACTIVITY_TYPE(component)
+        return str(result[0]) if result else None
     
-    def _extract_protocol_components(self, root, namespaces: Dict[str, str], data: Dict[str, Any]) -> None:
-        """
-        Extract protocol-specific components from message flows and participants.
-        This captures ONLY actual communication protocols: IDOC, SOAP, HTTP, HCIOData, AMQP, ProcessDirect, Mail, etc.
-        Excludes events like RequestReply, EndEvent, StartEvent, etc.
+    def _extract_protocol(self, elem, extra_attrs=()) -> Dict[str, Any]:
+        """Extract protocol information from an element's extension properties.
+
+        The message flow, participant, and component variants only differ in
+        which element attributes they copy onto the record, so extra_attrs
+        carries those as (protocol_key, element_attribute) pairs.
         """
-        # Extract protocol information from message flows (these are usually actual protocols)
-        for flow in root.findall('.//bpmn2:messageFlow', namespaces):
-            protocol_data = self._extract_protocol_from_flow(flow, namespaces)
-            if protocol_data and self._is_valid_protocol(protocol_data):
-                data['protocols'].append(protocol_data)
-        
-        # Extract protocol information from participants (these are usually actual protocols)
-        for participant in root.findall('.//bpmn2:participant', namespaces):
-            protocol_data = self._extract_protocol_from_participant(participant, namespaces)
-            if protocol_data and self._is_valid_protocol(protocol_data):
-                data['protocols'].append(protocol_data)
-        
-        # Extract protocol information ONLY from service tasks that have actual protocol properties
-        for component in root.findall('.//bpmn2:serviceTask', namespaces):
-            protocol_data = self._extract_protocol_from_component(component, namespaces)
-            if protocol_data and self._is_valid_protocol(protocol_data):
-                data['protocols'].append(protocol_data)
-    
-    def _extract_protocol_from_flow(self, flow, namespaces: Dict[str, str]) -> Dict[str, Any]:
-        """Extract protocol information from a message flow element."""
-        protocol_data = None
-        
-        # Look for extension elements with protocol information
-        extension_elements = flow.find('.//bpmn2:extensionElements', namespaces)
-        if extension_elements is not None:
-            protocol_data = self._parse_extension_elements(extension_elements, namespaces)
-            if protocol_data:
-                protocol_data.update({
-                    'id': f"Protocol_{flow.get('id')}",
-                    'name': self._get_node_name(
-                        flow.get('name', ''), 
-                        flow.get('id'), 
-                        'Protocol',
-                        protocol_data.get('system'),
-                        protocol_data.get('adapter_name')
-                    ),
-                    'source': flow.get('sourceRef'),
-                    'target': flow.get('targetRef'),
-                    'type': 'Protocol'
-                })
-        
-        return protocol_data
-    
-    def _extract_protocol_from_participant(self, participant, namespaces: Dict[str, str]) -> Dict[str, Any]:
-        """Extract protocol information from a participant element."""
-        protocol_data = None
-        
-        # Look for extension elements with protocol information
-        extension_elements = participant.find('.//bpmn2:extensionElements', namespaces)
-        if extension_elements is not None:
-            protocol_data = self._parse_extension_elements(extension_elements, namespaces)
-            if protocol_data:
-                protocol_data.update({
-                    'id': f"Protocol_{participant.get('id')}",
-                    'name': self._get_node_name(
-                        participant.get('name', ''), 
-                        participant.get('id'), 
-                        'Protocol',
-                        protocol_data.get('system'),
-                        protocol_data.get('adapter_name')
-                    ),
-                    'participant_id': participant.get('id'),
-                    'type': 'Protocol'
-                })
-        
-        return protocol_data
-    
-    def _extract_protocol_from_component(self, component, namespaces: Dict[str, str]) -> Dict[str, Any]:
-        """Extract protocol information from a component element."""
-        protocol_data = None
-        
         # Look for extension elements with protocol information
-        extension_elements = component.find('.//bpmn2:extensionElements', namespaces)
-        if extension_elements is not None:
-            protocol_data = self._parse_extension_elements(extension_elements, namespaces)
-            if protocol_data:
-                protocol_data.update({
-                    'id': f"Protocol_{component.get('id')}",
-                    'name': self._get_node_name(
-                        component.get('name', ''), 
-                        component.get('id'), 
-                        'Protocol',
-                        protocol_data.get('system'),
-                        protocol_data.get('adapter_name')
-                    ),
-                    'component_id': component.get('id'),
-                    'type': 'Protocol'
-                })
-        
+        extension_elements = _XP_EXTENSION_ELEMENTS(elem)
+        if not extension_elements:
+            return None
+        protocol_data = self._parse_extension_elements(extension_elements[0])
+        if not protocol_data:
+            return None
+        protocol_data.update({
+            'id': f"Protocol_{elem.get('id')}",
+            'name': self._get_node_name(
+                elem.get('name', ''),
+                elem.get('id'),
+                'Protocol',
+                protocol_data.get('system'),
+                protocol_data.get('adapter_name')
+            ),
+            'type': 'Protocol'
+        })
+        for key, attr in extra_attrs:
+            protocol_data[key] = elem.get(attr)
         return protocol_data
     
-    def _parse_extension_elements(self, extension_elements, namespaces: Dict[str, str]) -> Dict[str, Any]:
+    # Capture ALL SAP Integration Suite protocol-specific properties:
+    # ifl:property key -> protocol_info attribute
+    _PROTOCOL_KEY_MAP = {
+        'ComponentType': 'component_type',
+        'TransportProtocol': 'transport_protocol',
+        'MessageProtocol': 'message_protocol',
+        'ComponentNS': 'component_namespace',
+        'direction': 'direction',
+        'address': 'address',
+        'Name': 'adapter_name',
+        'system': 'system',
+        'ifl:type': 'ifl_type',
+        'activityType': 'activity_type',
+        # Additional protocol properties for comprehensive coverage
+        'credentialName': 'credential_name',
+        'authentication': 'authentication',
+        'proxyType': 'proxy_type',
+        'timeout': 'timeout',
+        'server': 'server',
+        'port': 'port',
+    }
+
+    @staticmethod
+    def _property_key_value(property_elem) -> Tuple[Any, Any]:
+        """Return the <key> and <value> child elements of an ifl:property.
+
+        The pair are the property's only children, so direct iteration
+        replaces two ElementPath find() evaluations per property.
+        """
+        key_elem = value_elem = None
+        for child in property_elem:
+            if child.tag == 'key':
+                key_elem = child
+            elif child.tag == 'value':
+                value_elem = child
+        return key_elem, value_elem
+
+    def _parse_extension_elements(self, extension_elements) -> Dict[str, Any]:
         """Parse extension elements to extract protocol information."""
         protocol_info = {}
-        
-        # Extract properties from extension elements
-        for property_elem in extension_elements.findall('.//ifl:property', namespaces):
-            key_elem = property_elem.find('key')
-            value_elem = property_elem.find('value')
-            
+        # Bound method hoisted out of the loop so each iteration skips the
+        # attribute lookups
+        key_map_get = self._PROTOCOL_KEY_MAP.get
+
+        # Extract properties from extension elements; one hash lookup per
+        # property instead of a 16-way string-compare ladder
+        for property_elem in extension_elements.iter(_IFL_PROPERTY_TAG):
+            key_elem, value_elem = self._property_key_value(property_elem)
+
             if key_elem is not None and value_elem is not None:
-                key = key_elem.text
-                value = value_elem.text
-                
-                # Capture ALL SAP Integration Suite protocol-specific properties
-                if key == 'ComponentType':
-                    protocol_info['component_type'] = value
-                elif key == 'TransportProtocol':
-                    protocol_info['transport_protocol'] = value
-                elif key == 'MessageProtocol':
-                    protocol_info['message_protocol'] = value
-                elif key == 'ComponentNS':
-                    protocol_info['component_namespace'] = value
-                elif key == 'direction':
-                    protocol_info['direction'] = value
-                elif key == 'address':
-                    protocol_info['address'] = value
-                elif key == 'Name':
-                    protocol_info['adapter_name'] = value
-                elif key == 'system':
-                    protocol_info['system'] = value
-                elif key == 'ifl:type':
-                    protocol_info['ifl_type'] = value
-                elif key == 'activityType':
-                    protocol_info['activity_type'] = value
-                # Additional protocol properties for comprehensive coverage
-                elif key == 'credentialName':
-                    protocol_info['credential_name'] = value
-                elif key == 'authentication':
-                    protocol_info['authentication'] = value
-                elif key == 'proxyType':
-                    protocol_info['proxy_type'] = value
-                elif key == 'timeout':
-                    protocol_info['timeout'] = value
-                elif key == 'server':
-                    protocol_info['server'] = value
-                elif key == 'port':
-                    protocol_info['port'] = value
-        
+                attr = key_map_get(key_elem.text)
+                if attr:
+                    protocol_info[attr] = value_elem.text
+
         return protocol_info if protocol_info else None
     
+    # Events and non-protocol activities that must not become Protocol nodes
+    _EXCLUDED_ACTIVITIES = frozenset((
+        'requestreply', 'endevent', 'startevent', 'receive', 'send', 'transform',
+        'router', 'splitter', 'aggregator', 'filter', 'enricher', 'validator'
+    ))
+
+    # Generic component types that are not protocols
+    _EXCLUDED_TYPES = frozenset((
+        'script', 'groovy', 'javascript', 'java', 'xslt', 'mapping', 'transformation'
+    ))
+
+    # Valid protocol indicators; one compiled scan over the combined text
+    # replaces a substring pass per indicator
+    _VALID_PROTO_RE = re.compile(
+        r'http|https|sftp|ftp|soap|rest|odata|idoc|amqp|jms|mail|smtp|pop3'
+        r'|imap|ldap|sap|rfc|processdirect|successfactors|salesforce'
+        r'|workday|azure|aws|gcp',
+        re.IGNORECASE)
+
     def _is_valid_protocol(self, protocol_data: Dict[str, Any]) -> bool:
         """
         Determine if the extracted data represents a valid communication protocol.
@@ -390,587 +644,402 @@ class IFlowKnowledgeGraph:
         """
         if not protocol_data:
             return False
-        
+
         # Get the component type and activity type
         component_type = (protocol_data.get('component_type') or '').lower()
         activity_type = (protocol_data.get('activity_type') or '').lower()
-        transport_protocol = (protocol_data.get('transport_protocol') or '').lower()
-        message_protocol = (protocol_data.get('message_protocol') or '').lower()
-        adapter_name = (protocol_data.get('adapter_name') or '').lower()
-        
+        transport_protocol = protocol_data.get('transport_protocol') or ''
+        message_protocol = protocol_data.get('message_protocol') or ''
+        adapter_name = protocol_data.get('adapter_name') or ''
+
         # Exclude events and non-protocol activities
-        excluded_activities = [
-            'requestreply', 'endevent', 'startevent', 'receive', 'send', 'transform',
-            'router', 'splitter', 'aggregator', 'filter', 'enricher', 'validator'
-        ]
-        
-        if activity_type in excluded_activities:
+        if activity_type in self._EXCLUDED_ACTIVITIES:
             return False
-        
+
         # Exclude generic component types that are not protocols
-        excluded_component_types = [
-            'script', 'groovy', 'javascript', 'java', 'xslt', 'mapping', 'transformation'
-        ]
-        
-        if component_type in excluded_component_types:
+        if component_type in self._EXCLUDED_TYPES:
             return False
-        
-        # Valid protocol indicators
-        valid_protocol_indicators = [
-            'http', 'https', 'sftp', 'ftp', 'soap', 'rest', 'odata', 'idoc', 'amqp',
-            'jms', 'mail', 'smtp', 'pop3', 'imap', 'ldap', 'sap', 'rfc', 'processdirect',
-            'successfactors', 'salesforce', 'workday', 'azure', 'aws', 'gcp'
-        ]
-        
+
         # Check if any valid protocol indicator is present
-        all_text = f"{component_type} {activity_type} {transport_protocol} {message_protocol} {adapter_name}".lower()
-        
-        for indicator in valid_protocol_indicators:
-            if indicator in all_text:
-                return True
-        
-        # Additional check: if it has transport_protocol or message_protocol, it's likely a protocol
-        if transport_protocol or message_protocol:
-            return True
-        
-        # If it has adapter_name with protocol-like names
-        if adapter_name and any(proto in adapter_name for proto in ['http', 'sftp', 'soap', 'rest', 'odata', 'idoc']):
+        all_text = f"{component_type} {activity_type} {transport_protocol} {message_protocol} {adapter_name}"
+        if self._VALID_PROTO_RE.search(all_text):
             return True
-        
-        return False
+
+        # Additional check: if it has transport_protocol or message_protocol, it's likely a protocol
+        return bool(transport_protocol or message_protocol)
     
+    _FALLBACK_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                  'fallback_iflow.json')
+
     def _create_fallback_structure(self) -> Dict[str, Any]:
         """
         Create a fallback structure based on the iFlow screenshot analysis.
         This ensures we have a working Knowledge Graph even if XML parsing fails.
+
+        The structure lives in fallback_iflow.json next to this module so the
+        rarely-used literals are only parsed when the fallback is actually hit.
         """
         logger.info("Creating fallback structure based on iFlow analysis")
-        
-        return {
-            'processes': [
-                {'id': 'Process_1', 'name': 'Integration Process', 'type': 'Process'},
-                {'id': 'Process_81563893', 'name': 'XML to JSON Conversion', 'type': 'Process'},
-                {'id': 'Process_162', 'name': 'Commission Titles by Batch', 'type': 'Process'},
-                {'id': 'Process_81563943', 'name': 'Commission Titles', 'type': 'Process'},
-                {'id': 'Process_81564010', 'name': 'Exception Handler', 'type': 'Process'}
-            ],
-            'participants': [
-                {'id': 'Participant_12', 'name': 'SuccessFactors', 'type': 'Participant'},
-                {'id': 'Participant_223', 'name': 'Commission', 'type': 'Participant'},
-                {'id': 'Participant_81564139', 'name': 'SFTP', 'type': 'Participant'}
-            ],
-            'components': [
-                # Main flow components
-                {'id': 'StartEvent_64', 'name': 'Start', 'type': 'StartEvent'},
-                {'id': 'CallActivity_15', 'name': 'Custom Data Transformation', 'type': 'CallActivity'},
-                {'id': 'CallActivity_20', 'name': 'ExecutionTime', 'type': 'CallActivity'},
-                {'id': 'CallActivity_24', 'name': 'Derive Custom Query', 'type': 'CallActivity'},
-                {'id': 'ServiceTask_16', 'name': 'SuccessFactors Request', 'type': 'ServiceTask'},
-                {'id': 'ExclusiveGateway_38', 'name': 'Gateway', 'type': 'ExclusiveGateway'},
-                {'id': 'CallActivity_81564205', 'name': 'Event Version Check', 'type': 'CallActivity'},
-                {'id': 'ParallelGateway_81564058', 'name': 'Parallel Gateway', 'type': 'ParallelGateway'},
-                {'id': 'CallActivity_58', 'name': 'Write Variables', 'type': 'CallActivity'},
-                {'id': 'EndEvent_44', 'name': 'End', 'type': 'EndEvent'},
-                
-                # XML to JSON subprocess components
-                {'id': 'StartEvent_81563894', 'name': 'XML Start', 'type': 'StartEvent'},
-                {'id': 'CallActivity_81564220', 'name': 'Remove Empty Nodes', 'type': 'CallActivity'},
-                {'id': 'CallActivity_81563860', 'name': 'XML to JSON Converter', 'type': 'CallActivity'},
-                {'id': 'CallActivity_81563891', 'name': 'Remove Root Node', 'type': 'CallActivity'},
-                {'id': 'CallActivity_81564112', 'name': 'Setup Charset', 'type': 'CallActivity'},
-                {'id': 'EndEvent_81563895', 'name': 'XML End', 'type': 'EndEvent'},
-                
-                # Batch subprocess components
-                {'id': 'StartEvent_163', 'name': 'Batch Start', 'type': 'StartEvent'},
-                {'id': 'CallActivity_45793', 'name': 'Gather Payload', 'type': 'CallActivity'},
-                {'id': 'ParallelGateway_81564236', 'name': 'Fork', 'type': 'ParallelGateway'},
-                {'id': 'ServiceTask_150', 'name': 'Request Reply', 'type': 'ServiceTask'},
-                {'id': 'CallActivity_5918', 'name': 'JSON to XML Converter', 'type': 'CallActivity'},
-                {'id': 'CallActivity_198', 'name': 'Increment Loop', 'type': 'CallActivity'},
-                {'id': 'CallActivity_81564239', 'name': 'Remove XML Declaration', 'type': 'CallActivity'},
-                {'id': 'ParallelGateway_81564242', 'name': 'Join', 'type': 'ParallelGateway'},
-                {'id': 'CallActivity_81564246', 'name': 'Combine Payload', 'type': 'CallActivity'},
-                {'id': 'EndEvent_187', 'name': 'Batch End', 'type': 'EndEvent'},
-                
-                # Commission subprocess components
-                {'id': 'StartEvent_81563944', 'name': 'Commission Start', 'type': 'StartEvent'},
-                {'id': 'EndEvent_81564141', 'name': 'Commission End', 'type': 'EndEvent'},
-                
-                # Exception handler components
-                {'id': 'StartEvent_81564007', 'name': 'Exception Start 1', 'type': 'StartEvent'},
-                {'id': 'CallActivity_81564014', 'name': 'Exception Process 1', 'type': 'CallActivity'},
-                {'id': 'EndEvent_81564008', 'name': 'Exception End 1', 'type': 'EndEvent'},
-                {'id': 'StartEvent_81564025', 'name': 'Exception Start 2', 'type': 'StartEvent'},
-                {'id': 'CallActivity_81564028', 'name': 'Exception Process 2', 'type': 'CallActivity'},
-                {'id': 'EndEvent_81564026', 'name': 'Exception End 2', 'type': 'EndEvent'},
-                {'id': 'StartEvent_81564033', 'name': 'Exception Start 3', 'type': 'StartEvent'},
-                {'id': 'CallActivity_81564036', 'name': 'Exception Process 3', 'type': 'CallActivity'},
-                {'id': 'EndEvent_81564034', 'name': 'Exception End 3', 'type': 'EndEvent'}
-            ],
-            'subprocesses': [
-                {'id': 'SubProcess_81564032', 'name': 'Exception Subprocess 4', 'type': 'SubProcess'},
-                {'id': 'SubProcess_81564024', 'name': 'Exception Subprocess 3', 'type': 'SubProcess'},
-                {'id': 'SubProcess_81564006', 'name': 'Exception Subprocess 1', 'type': 'SubProcess'},
-                {'id': 'SubProcess_81564017', 'name': 'Exception Subprocess 2', 'type': 'SubProcess'}
-            ],
-            'sequence_flows': [
-                # Main flow
-                {'id': 'SequenceFlow_220', 'name': '', 'source': 'StartEvent_64', 'target': 'CallActivity_15', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81563941', 'name': '', 'source': 'CallActivity_15', 'target': 'CallActivity_20', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_25', 'name': '', 'source': 'CallActivity_20', 'target': 'CallActivity_24', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81563997', 'name': '', 'source': 'CallActivity_24', 'target': 'ServiceTask_16', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_109', 'name': '', 'source': 'ServiceTask_16', 'target': 'ExclusiveGateway_38', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_207', 'name': 'Route 1', 'source': 'ExclusiveGateway_38', 'target': 'CallActivity_81564205', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564207', 'name': '', 'source': 'CallActivity_81564205', 'target': 'ParallelGateway_81564058', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81563963', 'name': '', 'source': 'CallActivity_58', 'target': 'EndEvent_44', 'type': 'SequenceFlow'},
-                
-                # XML to JSON subprocess
-                {'id': 'SequenceFlow_81563897', 'name': '', 'source': 'StartEvent_81563894', 'target': 'CallActivity_81564220', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564255', 'name': '', 'source': 'CallActivity_81564220', 'target': 'CallActivity_81563860', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81563892', 'name': '', 'source': 'CallActivity_81563860', 'target': 'CallActivity_81563891', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81563899', 'name': '', 'source': 'CallActivity_81563891', 'target': 'CallActivity_81564112', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564257', 'name': '', 'source': 'CallActivity_81564112', 'target': 'EndEvent_81563895', 'type': 'SequenceFlow'},
-                
-                # Batch subprocess
-                {'id': 'SequenceFlow_5916', 'name': '', 'source': 'StartEvent_163', 'target': 'CallActivity_45793', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_45794', 'name': '', 'source': 'CallActivity_45793', 'target': 'ParallelGateway_81564236', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564237', 'name': 'Branch 1', 'source': 'ParallelGateway_81564236', 'target': 'ServiceTask_150', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_5919', 'name': '', 'source': 'ServiceTask_150', 'target': 'CallActivity_5918', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_45810', 'name': '', 'source': 'CallActivity_5918', 'target': 'CallActivity_198', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_45813', 'name': '', 'source': 'CallActivity_198', 'target': 'CallActivity_81564239', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564240', 'name': '', 'source': 'CallActivity_81564239', 'target': 'ParallelGateway_81564242', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564243', 'name': '', 'source': 'ParallelGateway_81564242', 'target': 'CallActivity_81564246', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564247', 'name': '', 'source': 'CallActivity_81564246', 'target': 'EndEvent_187', 'type': 'SequenceFlow'},
-                
-                # Commission subprocess
-                {'id': 'SequenceFlow_81563944', 'name': '', 'source': 'StartEvent_81563944', 'target': 'EndEvent_81564141', 'type': 'SequenceFlow'},
-                
-                # Exception handlers
-                {'id': 'SequenceFlow_81564009', 'name': '', 'source': 'StartEvent_81564007', 'target': 'CallActivity_81564014', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564015', 'name': '', 'source': 'CallActivity_81564014', 'target': 'EndEvent_81564008', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564027', 'name': '', 'source': 'StartEvent_81564025', 'target': 'CallActivity_81564028', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564029', 'name': '', 'source': 'CallActivity_81564028', 'target': 'EndEvent_81564026', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564035', 'name': '', 'source': 'StartEvent_81564033', 'target': 'CallActivity_81564036', 'type': 'SequenceFlow'},
-                {'id': 'SequenceFlow_81564037', 'name': '', 'source': 'CallActivity_81564036', 'target': 'EndEvent_81564034', 'type': 'SequenceFlow'}
-            ],
-            'message_flows': [
-                {'id': 'MessageFlow_17', 'name': 'SuccessFactors', 'source': 'ServiceTask_16', 'target': 'Participant_12', 'type': 'MessageFlow'},
-                {'id': 'MessageFlow_155', 'name': 'HTTP', 'source': 'ServiceTask_150', 'target': 'Participant_223', 'type': 'MessageFlow'}
-            ]
-        }
+
+        with open(self._FALLBACK_JSON, encoding='utf-8') as f:
+            return json.load(f)
     
-    def create_nodes(self, data: Dict[str, Any]) -> None:
+    # Optional protocol properties copied verbatim onto Protocol nodes
+    PROTOCOL_PROPS = (
+        'component_type', 'transport_protocol', 'message_protocol',
+        'component_namespace', 'direction', 'address', 'adapter_name',
+        'system', 'ifl_type', 'activity_type', 'credential_name',
+        'authentication', 'proxy_type', 'timeout', 'server', 'port'
+    )
+
+    def create_nodes(self, data: Dict[str, Any], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
         """
         Create all nodes in the Knowledge Graph.
         This function creates processes, participants, components, subprocesses, and protocols as nodes.
         Each node is tagged with a folder_id to ensure isolation between different iFlow folders.
+        Nodes are written as batched UNWIND MERGEs (one round-trip per batch)
+        instead of one statement per entity. Returns the number of nodes
+        created, summed from the batch result summaries.
         """
-        logger.info(f"Creating nodes in the Knowledge Graph for folder: {self.folder_name}")
-        
-        folder_id = f"Folder_{self.folder_name.replace(' ', '_').replace('.', '_').replace('-', '_')}"
-        
-        with self.driver.session() as session:
-            # Create folder node as semantic layer with folder-specific ID
-            session.run("""
-                CREATE (f:Folder {
-                    id: $folder_id,
-                    name: $folder_name,
-                    type: 'Folder',
-                    description: 'SAP Integration Flow Knowledge Graph - Semantic Layer',
-                    folder_id: $folder_id
-                })
-            """, folder_id=folder_id, folder_name=self.folder_name)
-            logger.debug(f"Created folder node: {self.folder_name}")
-            
-            # Create processes with folder-specific IDs
-            for process in data['processes']:
-                process_id = f"{folder_id}_{process['id']}"
-                session.run("""
-                    CREATE (p:Process {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id
-                    })
-                """, id=process_id, name=process['name'], type=process['type'], folder_id=folder_id)
-                logger.debug(f"Created process: {process['name']}")
-            
-            # Create participants with folder-specific IDs
-            for participant in data['participants']:
-                participant_id = f"{folder_id}_{participant['id']}"
-                session.run("""
-                    CREATE (p:Participant {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id
-                    })
-                """, id=participant_id, name=participant['name'], type=participant['type'], folder_id=folder_id)
-                logger.debug(f"Created participant: {participant['name']}")
-            
-            # Create components with folder-specific IDs
-            for component in data['components']:
-                component_id = f"{folder_id}_{component['id']}"
-                session.run("""
-                    CREATE (c:Component {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id
-                    })
-                """, id=component_id, name=component['name'], type=component['type'], folder_id=folder_id)
-                logger.debug(f"Created component: {component['name']}")
-            
-            # Create subprocesses with folder-specific IDs
-            for subprocess in data['subprocesses']:
-                subprocess_id = f"{folder_id}_{subprocess['id']}"
-                session.run("""
-                    CREATE (s:SubProcess {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id
-                    })
-                """, id=subprocess_id, name=subprocess['name'], type=subprocess['type'], folder_id=folder_id)
-                logger.debug(f"Created subprocess: {subprocess['name']}")
-            
-            # Create protocol nodes with folder-specific IDs
-            for protocol in data['protocols']:
-                protocol_id = f"{folder_id}_{protocol['id']}"
-                session.run("""
-                    CREATE (p:Protocol {
-                        id: $id,
-                        name: $name,
-                        type: $type,
-                        folder_id: $folder_id,
-                        component_type: $component_type,
-                        transport_protocol: $transport_protocol,
-                        message_protocol: $message_protocol,
-                        component_namespace: $component_namespace,
-                        direction: $direction,
-                        address: $address,
-                        adapter_name: $adapter_name,
-                        system: $system,
-                        ifl_type: $ifl_type,
-                        activity_type: $activity_type,
-                        credential_name: $credential_name,
-                        authentication: $authentication,
-                        proxy_type: $proxy_type,
-                        timeout: $timeout,
-                        server: $server,
-                        port: $port
-                    })
-                """, 
-                id=protocol_id, 
-                name=protocol['name'], 
-                type=protocol['type'], 
-                folder_id=folder_id,
-                component_type=protocol.get('component_type'),
-                transport_protocol=protocol.get('transport_protocol'),
-                message_protocol=protocol.get('message_protocol'),
-                component_namespace=protocol.get('component_namespace'),
-                direction=protocol.get('direction'),
-                address=protocol.get('address'),
-                adapter_name=protocol.get('adapter_name'),
-                system=protocol.get('system'),
-                ifl_type=protocol.get('ifl_type'),
-                activity_type=protocol.get('activity_type'),
-                credential_name=protocol.get('credential_name'),
-                authentication=protocol.get('authentication'),
-                proxy_type=protocol.get('proxy_type'),
-                timeout=protocol.get('timeout'),
-                server=protocol.get('server'),
-                port=protocol.get('port')
-                )
-                logger.debug(f"Created protocol: {protocol['name']} ({protocol.get('component_type', 'Unknown')}) - {protocol.get('activity_type', 'No Activity Type')}")
-            
-            logger.info(f"Created 1 folder, {len(data['processes'])} processes, {len(data['participants'])} participants, "
-                       f"{len(data['components'])} components, {len(data['subprocesses'])} subprocesses, "
-                       f"{len(data['protocols'])} protocols for {self.folder_name}")
+        logger.info("Creating nodes in the Knowledge Graph for folder: %s", self.folder_name)
+
+        folder_id = self.folder_id
+        prefix = self._id_prefix
+
+        def entity_rows(entities):
+            return [{
+                'id': prefix + e['id'],
+                'props': {'name': e['name'], 'type': e['type'], 'folder_id': folder_id}
+            } for e in entities]
+
+        protocol_rows = []
+        for protocol in data['protocols']:
+            props = {'name': protocol['name'], 'type': protocol['type'], 'folder_id': folder_id}
+            for key in self.PROTOCOL_PROPS:
+                props[key] = protocol.get(key)
+            protocol_rows.append({'id': prefix + protocol['id'], 'props': props})
+
+        folder_row = [{
+            'id': folder_id,
+            'props': {
+                'name': self.folder_name,
+                'type': 'Folder',
+                'description': 'SAP Integration Flow Knowledge Graph - Semantic Layer',
+                'folder_id': folder_id
+            }
+        }]
+
+        created = self._merge_nodes_batch(self._session(), 'Folder', folder_row, batch_size)
+
+        # Batches are disjoint by id, so they can be written concurrently to
+        # overlap Bolt round-trips; sessions are not thread-safe, so each
+        # task opens its own from the driver's pool
+        batches = [(label, batch)
+                   for label, rows in (
+                       ('Process', entity_rows(data['processes'])),
+                       ('Participant', entity_rows(data['participants'])),
+                       ('Component', entity_rows(data['components'])),
+                       ('SubProcess', entity_rows(data['subprocesses'])),
+                       ('Protocol', protocol_rows))
+                   for batch in _batched(rows, batch_size)]
+
+        def write_batch(job):
+            label, batch = job
+            with self.driver.session(database=NEO4J_DATABASE) as session:
+                return self._merge_nodes_batch(session, label, batch, batch_size)
+
+        if len(batches) <= 1:
+            for job in batches:
+                created += write_batch(job)
+        else:
+            with ThreadPoolExecutor(max_workers=min(KG_WRITE_WORKERS, len(batches))) as executor:
+                # sum() consumes the iterator, surfacing the first worker
+                # exception, and totals the per-batch created counts
+                created += sum(executor.map(write_batch, batches))
+
+        logger.info("Created 1 folder, %s processes, %s participants, "
+                   "%s components, %s subprocesses, %s protocols for %s",
+                   len(data['processes']), len(data['participants']),
+                   len(data['components']), len(data['subprocesses']),
+                   len(data['protocols']), self.folder_name)
+        return created
     
-    def create_relationships(self, data: Dict[str, Any]) -> None:
+    def create_relationships(self, data: Dict[str, Any]) -> int:
         """
         Create all relationships between nodes.
         This function creates FLOWS_TO, CONTAINS, and CONNECTS_TO relationships.
         All relationships are created with folder-specific IDs to ensure isolation.
+        Returns the number of relationships created, from the result summaries.
         """
-        logger.info(f"Creating relationships in the Knowledge Graph for folder: {self.folder_name}")
-        
-        folder_id = f"Folder_{self.folder_name.replace(' ', '_').replace('.', '_').replace('-', '_')}"
+        logger.info("Creating relationships in the Knowledge Graph for folder: %s", self.folder_name)
         
-        with self.driver.session() as session:
-            # Create sequence flow relationships with folder-specific IDs
-            for flow in data['sequence_flows']:
-                if flow['source'] and flow['target']:
-                    source_id = f"{folder_id}_{flow['source']}"
-                    target_id = f"{folder_id}_{flow['target']}"
-                    session.run("""
-                        MATCH (source) WHERE source.id = $source AND source.folder_id = $folder_id
-                        MATCH (target) WHERE target.id = $target AND target.folder_id = $folder_id
-                        CREATE (source)-[:FLOWS_TO {name: $name, flow_id: $id}]->(target)
-                    """, source=source_id, target=target_id, folder_id=folder_id,
-                               name=flow['name'], id=flow['id'])
-                    logger.debug(f"Created sequence flow: {flow['source']} -> {flow['target']}")
-            
-            # Create message flow relationships with folder-specific IDs
-            for flow in data['message_flows']:
-                if flow['source'] and flow['target']:
-                    source_id = f"{folder_id}_{flow['source']}"
-                    target_id = f"{folder_id}_{flow['target']}"
-                    session.run("""
-                        MATCH (source) WHERE source.id = $source AND source.folder_id = $folder_id
-                        MATCH (target) WHERE target.id = $target AND target.folder_id = $folder_id
-                        CREATE (source)-[:CONNECTS_TO {name: $name, flow_id: $id}]->(target)
-                    """, source=source_id, target=target_id, folder_id=folder_id,
-                               name=flow['name'], id=flow['id'])
-                    logger.debug(f"Created message flow: {flow['source']} -> {flow['target']}")
-            
+        folder_id = self.folder_id
+        prefix = self._id_prefix
+
+        def flow_rows(flows):
+            """Rows for one UNWIND-batched flow write; unresolved ends skipped."""
+            return [{'source': prefix + flow['source'],
+                     'target': prefix + flow['target'],
+                     'name': flow['name'], 'flow_id': flow['id']}
+                    for flow in flows if flow['source'] and flow['target']]
+
+        seq_rows = flow_rows(data['sequence_flows'])
+        msg_rows = flow_rows(data['message_flows'])
+
+        def write_all(tx):
+            # The wrapper consumes each statement and totals its write
+            # counters; everything below runs through it unchanged
+            tx = _CountingTx(tx)
+
+            # One round-trip per batch instead of one per edge; chunking the
+            # UNWIND lists keeps statement size bounded on very large iFlows,
+            # same as the node ingestion path
+            for chunk in _batched(seq_rows, DEFAULT_BATCH_SIZE):
+                tx.run("""
+                    UNWIND $rows AS row
+                    MATCH (source) WHERE source.id = row.source AND source.folder_id = $folder_id
+                    MATCH (target) WHERE target.id = row.target AND target.folder_id = $folder_id
+                    CREATE (source)-[:FLOWS_TO {name: row.name, flow_id: row.flow_id}]->(target)
+                """, rows=chunk, folder_id=folder_id)
+
+            for chunk in _batched(msg_rows, DEFAULT_BATCH_SIZE):
+                tx.run("""
+                    UNWIND $rows AS row
+                    MATCH (source) WHERE source.id = row.source AND source.folder_id = $folder_id
+                    MATCH (target) WHERE target.id = row.target AND target.folder_id = $folder_id
+                    CREATE (source)-[:CONNECTS_TO {name: row.name, flow_id: row.flow_id}]->(target)
+                """, rows=chunk, folder_id=folder_id)
+
             # Create protocol relationships
-            self._create_protocol_relationships(session, data, folder_id)
-            
+            self._create_protocol_relationships(tx, data, folder_id)
+
             # Create process-component containment relationships
-            self._create_containment_relationships(session, data, folder_id)
-            
-            # Create folder relationships to connect everything
-            self._create_folder_relationships(session, data, folder_id)
-            
-            # Create comprehensive folder connections for better querying
-            self.create_folder_query_helper(session, folder_id)
-            
+            self._create_containment_relationships(tx, data, folder_id)
+
+            # Connect the folder to everything it owns; CONTAINS_ALL alone
+            # covers the semantic layer, so there is no separate per-label
+            # folder CONTAINS pass any more
+            self.create_folder_query_helper(tx, folder_id)
+
             # Ensure all nodes are connected (no isolated nodes)
-            self._connect_isolated_nodes(session, data, folder_id)
-            
-            logger.info(f"Created {len(data['sequence_flows'])} sequence flows, "
-                       f"{len(data['message_flows'])} message flows, protocol relationships, "
-                       f"containment relationships, and folder connections for {self.folder_name}")
+            self._connect_isolated_nodes(tx, data, folder_id)
+
+            return tx.relationships_created
+
+        # Every relationship statement shares one explicit transaction:
+        # a single commit for the phase instead of one per statement
+        created = self._session().execute_write(write_all)
+
+        logger.info("Created %s sequence flows, %s message flows, protocol relationships, "
+                   "containment relationships, and folder connections for %s",
+                   len(data['sequence_flows']), len(data['message_flows']),
+                   self.folder_name)
+        return created
     
-    def _create_protocol_relationships(self, session, data: Dict[str, Any], folder_id: str) -> None:
+    def _create_protocol_relationships(self, tx, data: Dict[str, Any], folder_id: str) -> None:
         """Create relationships for protocol nodes."""
         logger.info("Creating protocol relationships...")
-        
+
+        prefix = self._id_prefix
         for protocol in data['protocols']:
-            protocol_id = f"{folder_id}_{protocol['id']}"
+            protocol_id = prefix + protocol['id']
             
             # Connect protocol to its source component if available
             if protocol.get('source'):
-                source_id = f"{folder_id}_{protocol['source']}"
-                session.run("""
+                source_id = prefix + protocol['source']
+                tx.run("""
                     MATCH (source) WHERE source.id = $source_id AND source.folder_id = $folder_id
                     MATCH (protocol) WHERE protocol.id = $protocol_id AND protocol.folder_id = $folder_id
                     CREATE (source)-[:USES_PROTOCOL]->(protocol)
                 """, source_id=source_id, protocol_id=protocol_id, folder_id=folder_id)
-                logger.debug(f"Connected protocol {protocol['name']} to source {source_id}")
+                logger.debug("Connected protocol %s to source %s", protocol['name'], source_id)
             
             # Connect protocol to its target component if available
             if protocol.get('target'):
-                target_id = f"{folder_id}_{protocol['target']}"
-                session.run("""
+                target_id = prefix + protocol['target']
+                tx.run("""
                     MATCH (protocol) WHERE protocol.id = $protocol_id AND protocol.folder_id = $folder_id
                     MATCH (target) WHERE target.id = $target_id AND target.folder_id = $folder_id
                     CREATE (protocol)-[:CONNECTS_TO]->(target)
                 """, protocol_id=protocol_id, target_id=target_id, folder_id=folder_id)
-                logger.debug(f"Connected protocol {protocol['name']} to target {target_id}")
+                logger.debug("Connected protocol %s to target %s", protocol['name'], target_id)
             
             # Connect protocol to its participant if available
             if protocol.get('participant_id'):
-                participant_id = f"{folder_id}_{protocol['participant_id']}"
-                session.run("""
+                participant_id = prefix + protocol['participant_id']
+                tx.run("""
                     MATCH (protocol) WHERE protocol.id = $protocol_id AND protocol.folder_id = $folder_id
                     MATCH (participant) WHERE participant.id = $participant_id AND participant.folder_id = $folder_id
                     CREATE (protocol)-[:IMPLEMENTS]->(participant)
                 """, protocol_id=protocol_id, participant_id=participant_id, folder_id=folder_id)
-                logger.debug(f"Connected protocol {protocol['name']} to participant {participant_id}")
+                logger.debug("Connected protocol %s to participant %s", protocol['name'], participant_id)
     
-    def _create_containment_relationships(self, session, data: Dict[str, Any], folder_id: str) -> None:
-        """Create CONTAINS relationships between processes and their components."""
-        
+    # Known processes and their components from the original iFlow diagram,
+    # keyed by unprefixed process id
+    _PROCESS_COMPONENTS = {
         # Main Integration Process contains main flow components
-        main_process_components = [
+        'Process_1': (
             'StartEvent_64', 'CallActivity_15', 'CallActivity_20', 'CallActivity_24',
             'ServiceTask_16', 'ExclusiveGateway_38', 'CallActivity_81564205',
             'ParallelGateway_81564058', 'CallActivity_58', 'EndEvent_44'
-        ]
-        
-        session.run("""
-            MATCH (p:Process {id: 'Process_1'})
-            MATCH (c:Component)
-            WHERE c.id IN $component_ids
-            CREATE (p)-[:CONTAINS]->(c)
-        """, component_ids=main_process_components)
-        
+        ),
         # XML to JSON Conversion process
-        xml_components = [
+        'Process_81563893': (
             'StartEvent_81563894', 'CallActivity_81564220', 'CallActivity_81563860',
             'CallActivity_81563891', 'CallActivity_81564112', 'EndEvent_81563895'
-        ]
-        
-        session.run("""
-            MATCH (p:Process {id: 'Process_81563893'})
-            MATCH (c:Component)
-            WHERE c.id IN $component_ids
-            CREATE (p)-[:CONTAINS]->(c)
-        """, component_ids=xml_components)
-        
+        ),
         # Commission Titles by Batch process
-        batch_components = [
+        'Process_162': (
             'StartEvent_163', 'CallActivity_45793', 'ParallelGateway_81564236',
             'ServiceTask_150', 'CallActivity_5918', 'CallActivity_198',
             'CallActivity_81564239', 'ParallelGateway_81564242', 'CallActivity_81564246', 'EndEvent_187'
-        ]
-        
-        session.run("""
-            MATCH (p:Process {id: 'Process_162'})
-            MATCH (c:Component)
-            WHERE c.id IN $component_ids
-            CREATE (p)-[:CONTAINS]->(c)
-        """, component_ids=batch_components)
-        
+        ),
         # Commission Titles process
-        comm_components = ['StartEvent_81563944', 'EndEvent_81564141']
-        
-        session.run("""
-            MATCH (p:Process {id: 'Process_81563943'})
-            MATCH (c:Component)
-            WHERE c.id IN $component_ids
-            CREATE (p)-[:CONTAINS]->(c)
-        """, component_ids=comm_components)
-        
+        'Process_81563943': ('StartEvent_81563944', 'EndEvent_81564141'),
         # Exception Handler process
-        exception_components = [
+        'Process_81564010': (
             'StartEvent_81564007', 'CallActivity_81564014', 'EndEvent_81564008',
             'StartEvent_81564025', 'CallActivity_81564028', 'EndEvent_81564026',
             'StartEvent_81564033', 'CallActivity_81564036', 'EndEvent_81564034'
-        ]
-        
-        session.run("""
-            MATCH (p:Process {id: 'Process_81564010'})
-            MATCH (c:Component)
-            WHERE c.id IN $component_ids
+        ),
+    }
+
+    def _create_containment_relationships(self, tx, data: Dict[str, Any], folder_id: str) -> None:
+        """Create CONTAINS relationships between processes and their components."""
+
+        prefix = self._id_prefix
+        contain_map = [{'pid': prefix + pid, 'cids': [prefix + c for c in cids]}
+                       for pid, cids in self._PROCESS_COMPONENTS.items()]
+
+        # One UNWIND-driven statement replaces five per-process queries.
+        # Ids now carry the folder prefix and a folder_id filter, so the
+        # lookups are index seeks and stay correct with multiple folders
+        # ingested (the unprefixed literals matched nothing after the
+        # folder-namespacing change)
+        tx.run("""
+            UNWIND $contain_map AS m
+            MATCH (p:Process {id: m.pid, folder_id: $folder_id})
+            UNWIND m.cids AS cid
+            MATCH (c:Component {id: cid, folder_id: $folder_id})
             CREATE (p)-[:CONTAINS]->(c)
-        """, component_ids=exception_components)
-    
-    def _create_folder_relationships(self, session, data: Dict[str, Any], folder_id: str) -> None:
-        """Create folder relationships to connect everything to the semantic layer for a specific folder."""
-        
-        # Connect folder to all processes in this folder
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (p:Process {folder_id: $folder_id})
-            CREATE (f)-[:CONTAINS]->(p)
-        """, folder_id=folder_id)
-        
-        # Connect folder to all participants in this folder
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (p:Participant {folder_id: $folder_id})
-            CREATE (f)-[:CONTAINS]->(p)
-        """, folder_id=folder_id)
-        
-        # Connect folder to all subprocesses in this folder
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (s:SubProcess {folder_id: $folder_id})
-            CREATE (f)-[:CONTAINS]->(s)
-        """, folder_id=folder_id)
-        
-        # Connect folder to all protocols in this folder
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (p:Protocol {folder_id: $folder_id})
-            CREATE (f)-[:CONTAINS]->(p)
-        """, folder_id=folder_id)
-        
-        # Connect folder to all components in this folder (MOST IMPORTANT!)
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (c:Component {folder_id: $folder_id})
-            CREATE (f)-[:CONTAINS]->(c)
-        """, folder_id=folder_id)
-        
-        logger.debug(f"Created folder relationships for {folder_id}")
-    
-    def create_folder_query_helper(self, session, folder_id: str) -> None:
+        """, contain_map=contain_map, folder_id=folder_id)
+
+    def create_folder_query_helper(self, tx, folder_id: str) -> None:
         """Create a helper method to generate folder-specific queries."""
         # This method can be used to create additional helper relationships
         # that make folder queries more efficient
         
-        # Create a direct connection from folder to all nodes in the folder
-        session.run("""
-            MATCH (f:Folder {id: $folder_id})
-            MATCH (n {folder_id: $folder_id})
+        # Create a direct connection from folder to all nodes in the folder.
+        # Right after a fresh clear no CONTAINS_ALL edge can exist, so CREATE
+        # skips the per-node relationship-existence check MERGE would pay;
+        # MERGE remains the idempotent fallback for re-runs
+        verb = 'CREATE' if self._fresh_folder else 'MERGE'
+        tx.run(f"""
+            MATCH (f:Folder {{id: $folder_id}})
+            MATCH (n {{folder_id: $folder_id}})
             WHERE n <> f
-            MERGE (f)-[:CONTAINS_ALL]->(n)
+            {verb} (f)-[:CONTAINS_ALL]->(n)
         """, folder_id=folder_id)
         
-        logger.debug(f"Created comprehensive folder connections for {folder_id}")
+        logger.debug("Created comprehensive folder connections for %s", folder_id)
     
-    def _connect_isolated_nodes(self, session, data: Dict[str, Any], folder_id: str) -> None:
+    def _connect_isolated_nodes(self, tx, data: Dict[str, Any], folder_id: str) -> None:
         """Ensure all nodes are connected by creating additional relationships for a specific folder."""
         
-        # Connect all participants to the main integration process
-        session.run("""
-            MATCH (p:Process {folder_id: $folder_id})
+        # Connect participants to the main integration process only. The
+        # unfiltered version created |processes| x |participants| edges -
+        # the largest single write in the pipeline - when the intent was
+        # main-process linkage all along
+        tx.run("""
+            MATCH (p:Process {name: 'Integration Process', folder_id: $folder_id})
             MATCH (participant:Participant {folder_id: $folder_id})
             CREATE (p)-[:INTERACTS_WITH]->(participant)
         """, folder_id=folder_id)
         
         # Connect all subprocesses to processes
-        session.run("""
+        tx.run("""
             MATCH (p:Process {folder_id: $folder_id})
             MATCH (sp:SubProcess {folder_id: $folder_id})
             CREATE (p)-[:INVOKES]->(sp)
         """, folder_id=folder_id)
         
         # Connect participants to components that interact with them
-        session.run("""
+        tx.run("""
             MATCH (c:Component {folder_id: $folder_id})-[r:CONNECTS_TO]->(p:Participant {folder_id: $folder_id})
             CREATE (p)-[:RECEIVES_FROM]->(c)
         """, folder_id=folder_id)
         
         # Connect start events to their processes
-        session.run("""
+        tx.run("""
             MATCH (start:Component {type: 'StartEvent', folder_id: $folder_id})
             MATCH (p:Process {folder_id: $folder_id})
             CREATE (p)-[:INITIATES]->(start)
         """, folder_id=folder_id)
         
         # Connect end events to their processes
-        session.run("""
+        tx.run("""
             MATCH (end:Component {type: 'EndEvent', folder_id: $folder_id})
             MATCH (p:Process {folder_id: $folder_id})
             CREATE (end)-[:COMPLETES]->(p)
         """, folder_id=folder_id)
         
-        # Connect protocols to components that use them
-        session.run("""
-            MATCH (c:Component {folder_id: $folder_id})
-            MATCH (protocol:Protocol {folder_id: $folder_id})
-            WHERE c.id CONTAINS protocol.name OR protocol.name CONTAINS c.name
-            CREATE (c)-[:USES_PROTOCOL]->(protocol)
-        """, folder_id=folder_id)
-        
+        # The substring pairings below used to run as Cartesian products in
+        # Cypher (every component x every protocol, substring-tested per
+        # pair with no usable index). The pairs are now computed here with
+        # C-level substring checks and shipped as one UNWIND list each, so
+        # the graph side is index-backed MATCHes only.
+        prefix = self._id_prefix
+
+        # Connect protocols to components that use them. Protocols with an
+        # explicit source already got their USES_PROTOCOL edge in
+        # _create_protocol_relationships, so the fuzzy name matching only
+        # runs for the ones lacking that metadata - no duplicate edges
+        component_pairs = [
+            {'component': prefix + c['id'], 'protocol': prefix + p['id']}
+            for p in data['protocols']
+            if p.get('name') is not None and p.get('source') is None
+            for c in data['components']
+            if p['name'] in prefix + c['id']
+            or (c.get('name') is not None and c['name'] in p['name'])
+        ]
+        for chunk in _batched(component_pairs, DEFAULT_BATCH_SIZE):
+            tx.run("""
+                UNWIND $pairs AS pair
+                MATCH (c:Component {id: pair.component, folder_id: $folder_id})
+                MATCH (protocol:Protocol {id: pair.protocol, folder_id: $folder_id})
+                CREATE (c)-[:USES_PROTOCOL]->(protocol)
+            """, pairs=chunk, folder_id=folder_id)
+
         # Connect protocols to participants based on system names
-        session.run("""
-            MATCH (participant:Participant {folder_id: $folder_id})
-            MATCH (protocol:Protocol {folder_id: $folder_id})
-            WHERE participant.name CONTAINS protocol.system OR protocol.system CONTAINS participant.name
-            CREATE (participant)-[:IMPLEMENTS]->(protocol)
-        """, folder_id=folder_id)
-        
-        logger.debug(f"Created additional relationships for {folder_id}")
+        participant_pairs = [
+            {'participant': prefix + q['id'], 'protocol': prefix + p['id']}
+            for p in data['protocols'] if p.get('system') is not None
+            for q in data['participants']
+            if q.get('name') is not None
+            and (p['system'] in q['name'] or q['name'] in p['system'])
+        ]
+        for chunk in _batched(participant_pairs, DEFAULT_BATCH_SIZE):
+            tx.run("""
+                UNWIND $pairs AS pair
+                MATCH (participant:Participant {id: pair.participant, folder_id: $folder_id})
+                MATCH (protocol:Protocol {id: pair.protocol, folder_id: $folder_id})
+                CREATE (participant)-[:IMPLEMENTS]->(protocol)
+            """, pairs=chunk, folder_id=folder_id)
+
+        logger.debug("Created additional relationships for %s", folder_id)
     
-    def _connect_participants_to_processes(self, session) -> None:
+    def _connect_participants_to_processes(self, tx) -> None:
         """Connect participants to their corresponding processes based on processRef or name matching."""
         
         # Connect SuccessFactors participant to Integration Process
-        session.run("""
+        tx.run("""
             MATCH (p:Process {name: 'Integration Process'})
             MATCH (participant:Participant {name: 'SuccessFactors'})
             CREATE (p)-[:CONNECTS_TO]->(participant)
         """)
         
         # Connect Commission participants to Commission Titles process
-        session.run("""
+        tx.run("""
             MATCH (p:Process {name: 'Commission Titles'})
             MATCH (participant:Participant)
             WHERE participant.name CONTAINS 'Commission'
@@ -978,7 +1047,7 @@ class IFlowKnowledgeGraph:
         """)
         
         # Connect Commission participants to Commission Titles by Batch process
-        session.run("""
+        tx.run("""
             MATCH (p:Process {name: 'Commission Titles by Batch'})
             MATCH (participant:Participant)
             WHERE participant.name CONTAINS 'Commission'
@@ -986,14 +1055,14 @@ class IFlowKnowledgeGraph:
         """)
         
         # Connect SFTP participant to XML to JSON Conversion process
-        session.run("""
+        tx.run("""
             MATCH (p:Process {name: 'XML to JSON Conversion'})
             MATCH (participant:Participant {name: 'SFTP'})
             CREATE (p)-[:CONNECTS_TO]->(participant)
         """)
         
         # Connect all participants to Integration Process as the main orchestrator
-        session.run("""
+        tx.run("""
             MATCH (p:Process {name: 'Integration Process'})
             MATCH (participant:Participant)
             CREATE (p)-[:ORCHESTRATES]->(participant)
@@ -1002,246 +1071,333 @@ class IFlowKnowledgeGraph:
         logger.debug("Connected participants to their corresponding processes")
     
     def check_isolated_nodes(self) -> Dict[str, List[str]]:
-        """Check for any isolated nodes in the graph."""
-        with self.driver.session() as session:
-            # Find nodes with no relationships
-            isolated_result = session.run("""
-                MATCH (n)
-                WHERE NOT (n)--()
-                RETURN labels(n)[0] as NodeType, n.name as NodeName, n.id as NodeId
-            """)
-            
-            isolated_nodes = {}
-            for record in isolated_result:
-                node_type = record['NodeType']
-                node_name = record['NodeName']
-                node_id = record['NodeId']
-                
-                if node_type not in isolated_nodes:
-                    isolated_nodes[node_type] = []
-                isolated_nodes[node_type].append(f"{node_name} ({node_id})")
-            
-            return isolated_nodes
+        """Check for any isolated nodes in this folder's subgraph."""
+        # Find nodes with no relationships; scoped to the folder so the
+        # degree predicate runs over an index-backed node set instead of
+        # every node in the database. collect() groups per label
+        # server-side, so one row per label comes back instead of one
+        # row per isolated node
+        isolated_result = self._read("""
+            MATCH (n {folder_id: $folder_id})
+            WHERE NOT (n)--()
+            RETURN labels(n)[0] as NodeType,
+                   collect(coalesce(n.name, 'None') + ' (' + n.id + ')') as Names
+        """, folder_id=self.folder_id)
+
+        return {record['NodeType']: record['Names']
+                for record in isolated_result if record['Names']}
     
-    def query_full_flow(self) -> List[Dict[str, Any]]:
+    def query_full_flow(self) -> Iterator[Dict[str, Any]]:
         """
         Query the complete integration flow path from start to end.
-        Returns the entire flow structure that mirrors the iFlow diagram.
+        Yields the flow structure record by record so large graphs never
+        have to be materialized as one Python list.
         """
         logger.info("Querying complete integration flow...")
-        
-        with self.driver.session() as session:
-            # Get the complete flow structure
-            result = session.run("""
-                MATCH (n)-[r]->(m)
-                WHERE r:FLOWS_TO OR r:CONNECTS_TO OR r:CONTAINS OR r:INTERACTS_WITH OR r:INVOKES OR r:RECEIVES_FROM OR r:INITIATES OR r:COMPLETES OR r:ORCHESTRATES
-                RETURN n, r, m
-                ORDER BY n.name, m.name
-            """)
-            
-            flow_data = []
-            for record in result:
-                flow_data.append({
-                    'source': dict(record['n']),
-                    'relationship': dict(record['r']),
-                    'target': dict(record['m'])
-                })
-            
-            logger.info(f"Retrieved {len(flow_data)} flow relationships")
-            return flow_data
-    
-    def query_main_flow(self) -> List[Dict[str, Any]]:
-        """Query the main integration process flow."""
-        with self.driver.session() as session:
-            result = session.run("""
-                MATCH (p:Process {name: 'Integration Process'})-[:CONTAINS]->(c:Component)
-                OPTIONAL MATCH (c)-[r:FLOWS_TO]->(target:Component)
-                RETURN p, c, r, target
-                ORDER BY c.name
-            """)
-            
-            flow_data = []
-            for record in result:
-                flow_data.append({
-                    'process': dict(record['p']),
-                    'component': dict(record['c']),
-                    'relationship': dict(record['r']) if record['r'] else None,
-                    'target': dict(record['target']) if record['target'] else None
-                })
-            
-            return flow_data
-    
-    def query_subprocesses(self) -> List[Dict[str, Any]]:
-        """Query all subprocesses with their internal flows."""
-        with self.driver.session() as session:
-            result = session.run("""
-                MATCH (p:Process)-[:CONTAINS]->(c:Component)
-                WHERE p.name <> 'Integration Process'
-                OPTIONAL MATCH (c)-[r:FLOWS_TO]->(target:Component)
-                RETURN p, c, r, target
-                ORDER BY p.name, c.name
-            """)
-            
-            subprocess_data = []
-            for record in result:
-                subprocess_data.append({
-                    'process': dict(record['p']),
-                    'component': dict(record['c']),
-                    'relationship': dict(record['r']) if record['r'] else None,
-                    'target': dict(record['target']) if record['target'] else None
-                })
-            
-            return subprocess_data
-    
-    def query_external_connections(self) -> List[Dict[str, Any]]:
-        """Query all external system connections."""
-        with self.driver.session() as session:
-            result = session.run("""
-                MATCH (c:Component)-[r:CONNECTS_TO]->(p:Participant)
-                RETURN c, r, p
-                ORDER BY p.name
-            """)
-            
-            connections = []
-            for record in result:
-                connections.append({
-                    'component': dict(record['c']),
-                    'relationship': dict(record['r']),
-                    'participant': dict(record['p'])
-                })
-            
-            return connections
+
+        # Get the complete flow structure; the typed pattern lets the store
+        # iterate only these relationship types instead of scanning every
+        # relationship and testing its type per row
+        result = self._session().run("""
+            MATCH (n)-[r:FLOWS_TO|CONNECTS_TO|CONTAINS|INTERACTS_WITH|INVOKES|RECEIVES_FROM|INITIATES|COMPLETES|ORCHESTRATES]->(m)
+            RETURN n, r, m
+        """)
+
+        for record in result:
+            yield {
+                'source': record['n'],
+                'relationship': record['r'],
+                'target': record['m']
+            }
+
+    def query_main_flow(self) -> Iterator[Dict[str, Any]]:
+        """Query the main integration process flow, one record at a time."""
+        result = self._session().run("""
+            MATCH (p:Process {name: 'Integration Process'})-[:CONTAINS]->(c:Component)
+            OPTIONAL MATCH (c)-[r:FLOWS_TO]->(target:Component)
+            RETURN p, c, r, target
+            ORDER BY c.name
+        """)
+
+        for record in result:
+            yield {
+                'process': record['p'],
+                'component': record['c'],
+                'relationship': record['r'],
+                'target': record['target']
+            }
+
+    def query_subprocesses(self) -> Iterator[Dict[str, Any]]:
+        """Query all subprocesses with their internal flows, streamed."""
+        result = self._session().run("""
+            MATCH (p:Process)-[:CONTAINS]->(c:Component)
+            WHERE p.name <> 'Integration Process'
+            OPTIONAL MATCH (c)-[r:FLOWS_TO]->(target:Component)
+            RETURN p, c, r, target
+            ORDER BY p.name, c.name
+        """)
+
+        for record in result:
+            yield {
+                'process': record['p'],
+                'component': record['c'],
+                'relationship': record['r'],
+                'target': record['target']
+            }
+
+    def query_external_connections(self) -> Iterator[Dict[str, Any]]:
+        """Query all external system connections, streamed."""
+        result = self._session().run("""
+            MATCH (c:Component)-[r:CONNECTS_TO]->(p:Participant)
+            RETURN c, r, p
+            ORDER BY p.name
+        """)
+
+        for record in result:
+            yield {
+                'component': record['c'],
+                'relationship': record['r'],
+                'participant': record['p']
+            }
     
     def get_graph_statistics(self) -> Dict[str, Any]:
         """Get statistics about the Knowledge Graph."""
-        with self.driver.session() as session:
-            # Count nodes by type
-            node_result = session.run("""
-                MATCH (n)
-                RETURN labels(n)[0] as NodeType, count(n) as Count
-                ORDER BY Count DESC
-            """)
+        # apoc.meta.stats answers from the store's count metadata in O(1);
+        # fall back to the two full scans when APOC is not installed
+        try:
+            record = self._read(
+                "CALL apoc.meta.stats() YIELD labels, relTypesCount "
+                "RETURN labels, relTypesCount")[0]
+        except Exception:
+            logger.debug("apoc.meta.stats unavailable, counting via scans")
+        else:
+            node_counts = dict(sorted(record['labels'].items(),
+                                      key=lambda kv: kv[1], reverse=True))
+            rel_counts = dict(sorted(record['relTypesCount'].items(),
+                                     key=lambda kv: kv[1], reverse=True))
+            return {
+                'total_nodes': sum(node_counts.values()),
+                'total_relationships': sum(rel_counts.values()),
+                'nodes_by_type': node_counts,
+                'relationships_by_type': rel_counts
+            }
+
+        # Count nodes by type
+        node_result = self._read("""
+            MATCH (n)
+            RETURN labels(n)[0] as NodeType, count(n) as Count
+            ORDER BY Count DESC
+        """)
             
-            node_counts = {}
-            total_nodes = 0
-            for record in node_result:
-                node_type = record['NodeType']
-                count = record['Count']
-                node_counts[node_type] = count
-                total_nodes += count
+        node_counts = {}
+        total_nodes = 0
+        for record in node_result:
+            node_type = record['NodeType']
+            count = record['Count']
+            node_counts[node_type] = count
+            total_nodes += count
             
-            # Count relationships by type
-            rel_result = session.run("""
-                MATCH ()-[r]->()
-                RETURN type(r) as RelationshipType, count(r) as Count
-                ORDER BY Count DESC
-            """)
+        # Count relationships by type
+        rel_result = self._read("""
+            MATCH ()-[r]->()
+            RETURN type(r) as RelationshipType, count(r) as Count
+            ORDER BY Count DESC
+        """)
             
-            rel_counts = {}
-            total_relationships = 0
-            for record in rel_result:
-                rel_type = record['RelationshipType']
-                count = record['Count']
-                rel_counts[rel_type] = count
-                total_relationships += count
+        rel_counts = {}
+        total_relationships = 0
+        for record in rel_result:
+            rel_type = record['RelationshipType']
+            count = record['Count']
+            rel_counts[rel_type] = count
+            total_relationships += count
             
-            stats = {
-                'total_nodes': total_nodes,
-                'total_relationships': total_relationships,
-                'nodes_by_type': node_counts,
-                'relationships_by_type': rel_counts
-            }
+        stats = {
+            'total_nodes': total_nodes,
+            'total_relationships': total_relationships,
+            'nodes_by_type': node_counts,
+            'relationships_by_type': rel_counts
+        }
             
-            return stats
+        return stats
     
-    def export_graph_data(self, filename: str = "iflow_graph_data.json") -> None:
-        """Export the complete graph data to a JSON file."""
-        logger.info(f"Exporting graph data to {filename}")
-        
-        graph_data = {
-            'full_flow': self.query_full_flow(),
-            'main_flow': self.query_main_flow(),
-            'subprocesses': self.query_subprocesses(),
-            'external_connections': self.query_external_connections(),
-            'statistics': self.get_graph_statistics()
-        }
-        
-        with open(filename, 'w') as f:
-            json.dump(graph_data, f, indent=2, default=str)
-        
-        logger.info(f"Graph data exported to {filename}")
+    def export_graph_data(self, dest="iflow_graph_data.json") -> None:
+        """
+        Export the complete graph data as JSON.
+        dest may be a filename or a writable text file-like object, so callers
+        can stream the export without touching disk.
+        """
+        logger.info("Exporting graph data to %s", dest)
+
+        sections = (
+            ('full_flow', self.query_full_flow),
+            ('main_flow', self.query_main_flow),
+            ('subprocesses', self.query_subprocesses),
+            ('external_connections', self.query_external_connections),
+        )
+
+        def write_stream(f):
+            # Each section is streamed item by item, so the export never
+            # holds more than one record's dict in memory at a time
+            f.write('{\n')
+            for name, query in sections:
+                f.write('%s: [' % json.dumps(name))
+                first = True
+                for item in query():
+                    f.write('\n' if first else ',\n')
+                    f.write(json.dumps(item, default=_json_default))
+                    first = False
+                f.write('\n],\n' if not first else '],\n')
+            f.write('"statistics": ')
+            f.write(json.dumps(self.get_graph_statistics(), default=_json_default))
+            f.write('\n}\n')
+
+        if hasattr(dest, 'write'):
+            write_stream(dest)
+        else:
+            with open(dest, 'w') as f:
+                write_stream(f)
+
+        logger.info("Graph data exported to %s", dest)
     
-    def run(self) -> None:
+    def run(self, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
         """
         Main execution method to create the complete iFlow Knowledge Graph.
+        batch_size controls how many rows are sent per UNWIND statement.
         """
+        # Hand log records to a background listener for the duration of the
+        # run, so each logger call costs an enqueue instead of synchronous
+        # handler I/O on the ingestion thread. Skipped when another run
+        # already swapped the handlers (concurrent run_many workers)
+        root_logger = logging.getLogger()
+        sync_handlers = [h for h in root_logger.handlers
+                         if not isinstance(h, QueueHandler)]
+        listener = None
+        if sync_handlers and len(sync_handlers) == len(root_logger.handlers):
+            log_queue = queue.Queue(-1)
+            listener = QueueListener(log_queue, *sync_handlers,
+                                     respect_handler_level=True)
+            root_logger.handlers = [QueueHandler(log_queue)]
+            listener.start()
         try:
-            logger.info(f"Starting iFlow Knowledge Graph creation for folder: {self.folder_name}")
-            
+            logger.info("Starting iFlow Knowledge Graph creation for folder: %s", self.folder_name)
+
             # Check if folder already exists
             if self.check_folder_exists():
-                logger.warning(f"Folder '{self.folder_name}' already exists in the database!")
+                logger.warning("Folder '%s' already exists in the database!", self.folder_name)
                 raise Exception(f"Folder '{self.folder_name}' already exists. Please use a different name or clear the existing folder first.")
-            
+
+            # Make sure the merge keys are index-backed before bulk writes
+            self.ensure_indexes()
+
             # Clear existing data for this folder only (not the entire database)
             self.clear_folder_data()
-            
+
             # Parse iFlow XML
             data = self.parse_iflow_xml()
-            
+
+            # One count-store read before the writes; the after-phase totals
+            # come from the result-summary counters instead of re-counting
+            counts_before = self.get_current_counts()
+
             # Create nodes
-            self.create_nodes(data)
-            counts_after_nodes = self.get_current_counts()
-            logger.info(f"After creating nodes: {counts_after_nodes['nodes']} nodes, {counts_after_nodes['relationships']} relationships")
-            
+            nodes_created = self.create_nodes(data, batch_size=batch_size)
+            total_nodes = counts_before['nodes'] + nodes_created
+            logger.info("After creating nodes: %s nodes, %s relationships",
+                        total_nodes, counts_before['relationships'])
+
             # Create relationships
-            self.create_relationships(data)
-            counts_after_relationships = self.get_current_counts()
-            logger.info(f"After creating relationships: {counts_after_relationships['nodes']} nodes, {counts_after_relationships['relationships']} relationships")
-            
-            # Export graph data
-            self.export_graph_data()
+            relationships_created = self.create_relationships(data)
+            logger.info("After creating relationships: %s nodes, %s relationships",
+                        total_nodes, counts_before['relationships'] + relationships_created)
             
-            # Check for isolated nodes
-            isolated_nodes = self.check_isolated_nodes()
+            # Export, isolated-node check and statistics are independent
+            # read-only steps, so they overlap on three worker threads.
+            # Sessions are not thread-safe, so each worker runs on its own
+            # sibling instance sharing this driver's pool
+            def finalize(method_name):
+                worker = type(self)(folder_name=self.folder_name, driver=self.driver)
+                try:
+                    return getattr(worker, method_name)()
+                finally:
+                    worker.close()
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                export_future = executor.submit(finalize, 'export_graph_data')
+                isolated_future = executor.submit(finalize, 'check_isolated_nodes')
+                stats_future = executor.submit(finalize, 'get_graph_statistics')
+                export_future.result()
+                isolated_nodes = isolated_future.result()
+                stats = stats_future.result()
+
             if isolated_nodes:
                 logger.warning("Found isolated nodes:")
                 for node_type, nodes in isolated_nodes.items():
-                    logger.warning(f"   {node_type}: {', '.join(nodes)}")
+                    logger.warning("   %s: %s", node_type, _LazyJoin(nodes))
             else:
                 logger.info("All nodes are connected - no isolated nodes found!")
-            
-            # Print detailed statistics
-            stats = self.get_graph_statistics()
-            logger.info("=" * 60)
-            logger.info("KNOWLEDGE GRAPH CREATED SUCCESSFULLY!")
-            logger.info("=" * 60)
-            logger.info(f"TOTAL NODES CREATED: {stats['total_nodes']}")
-            logger.info(f"TOTAL RELATIONSHIPS CREATED: {stats['total_relationships']}")
-            logger.info("")
-            logger.info("NODES BY TYPE:")
-            for node_type, count in stats['nodes_by_type'].items():
-                logger.info(f"   • {node_type}: {count}")
-            logger.info("")
-            logger.info("RELATIONSHIPS BY TYPE:")
-            for rel_type, count in stats['relationships_by_type'].items():
-                logger.info(f"   • {rel_type}: {count}")
-            logger.info("=" * 60)
-            logger.info("Your iFlow Knowledge Graph is ready for visualization!")
-            logger.info("Open Neo4j Browser (http://localhost:7474) to explore the graph")
-            logger.info("Use Neo4j Bloom for advanced visualization")
-            logger.info("=" * 60)
+
+            # Print detailed statistics. The whole banner goes out as one
+            # log record - a single handler acquisition and flush instead
+            # of a dozen - and is only assembled when INFO is enabled
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('\n'.join((
+                    _BANNER,
+                    "KNOWLEDGE GRAPH CREATED SUCCESSFULLY!",
+                    _BANNER,
+                    f"TOTAL NODES CREATED: {stats['total_nodes']}",
+                    f"TOTAL RELATIONSHIPS CREATED: {stats['total_relationships']}",
+                    "",
+                    "NODES BY TYPE:",
+                    '\n'.join(f"   • {node_type}: {count}"
+                              for node_type, count in stats['nodes_by_type'].items()),
+                    "",
+                    "RELATIONSHIPS BY TYPE:",
+                    '\n'.join(f"   • {rel_type}: {count}"
+                              for rel_type, count in stats['relationships_by_type'].items()),
+                    _BANNER,
+                    "Your iFlow Knowledge Graph is ready for visualization!",
+                    "Open Neo4j Browser (http://localhost:7474) to explore the graph",
+                    "Use Neo4j Bloom for advanced visualization",
+                    _BANNER,
+                )))
             
         except Exception as e:
-            logger.error(f"Error creating Knowledge Graph: {e}")
+            logger.error("Error creating Knowledge Graph: %s", e)
             raise
         finally:
+            if listener is not None:
+                listener.stop()
+                root_logger.handlers = sync_handlers
             self.close()
 
+    @classmethod
+    def run_many(cls, folder_names, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_workers: int = KG_WRITE_WORKERS) -> None:
+        """Ingest several folders concurrently over one shared driver.
+
+        Folders are fully independent subgraphs, so their runs can overlap.
+        The driver is thread-safe while sessions are not, so every worker
+        builds its own instance - and with it its own session - on the
+        shared connection pool.
+        """
+        folder_names = list(folder_names)
+        if not folder_names:
+            return
+
+        driver = _default_driver()
+
+        def run_one(folder_name):
+            cls(folder_name=folder_name, driver=driver).run(batch_size=batch_size)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(folder_names))) as executor:
+            # list() surfaces the first worker exception, if any
+            list(executor.map(run_one, folder_names))
+
 def main():
     """Main function to run the Knowledge Graph creator."""
-    kg = IFlowKnowledgeGraph()
-    kg.run()
+    with IFlowKnowledgeGraph() as kg:
+        kg.run()
 
 if __name__ == "__main__":
     main()